@@ -8,6 +8,7 @@ Main Streamlit application entry point.
 from __future__ import annotations
 
 import streamlit as st
+from datetime import datetime
 from pathlib import Path
 import sys
 
@@ -17,8 +18,13 @@ if str(app_dir) not in sys.path:
     sys.path.insert(0, str(app_dir))
 
 from config.settings import get_settings
-from config.database import init_db
-from utils.session_state import init_session_state, display_notifications
+from config.database import init_db, db_scope, get_session_metrics
+from utils.session_state import (
+    init_session_state, display_notifications, show_debug_info,
+    get_cache_stats, get_run_time_stats, timed_run, fragment,
+    rerun_fragment
+)
+from utils.shared_cache import get_shared_cache
 
 # Page configuration
 st.set_page_config(
@@ -127,6 +133,29 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Projects shown per page in the sidebar selector
+PROJECT_PAGE_SIZE = 50
+
+
+@st.cache_resource(show_spinner=False)
+def setup_database(db_path: str) -> bool:
+    """
+    Create or upgrade the schema (once per server process and database).
+    
+    A failed setup raises and is not cached, so the next run retries.
+    """
+    init_db(db_path)
+    
+    # Finish purging projects deleted before the last restart
+    from modules.project.purge import resume_pending_purges
+    resume_pending_purges()
+    
+    # Keep dashboard snapshots from getting older than their refresh age
+    from modules.project.snapshot import start_snapshot_refresh
+    start_snapshot_refresh()
+    return True
+
+
 def initialize_app():
     """Initialize the application."""
     # Initialize session state
@@ -135,14 +164,19 @@ def initialize_app():
     # Initialize database
     settings = get_settings()
     try:
-        init_db(str(settings.get_database_path()))
+        setup_database(str(settings.get_database_path()))
     except Exception as e:
         st.error(f"Database initialization failed: {e}")
         st.stop()
 
 
-def render_sidebar():
-    """Render the sidebar with project selector and navigation."""
+def render_sidebar(snapshot: dict):
+    """
+    Render the sidebar with project selector and navigation.
+    
+    Args:
+        snapshot: Dashboard snapshot of the current project
+    """
     with st.sidebar:
         # App branding
         st.markdown("# 🎯 Semantic SEO")
@@ -156,7 +190,7 @@ def render_sidebar():
         
         # Quick stats if project selected
         if st.session_state.get("current_project"):
-            render_quick_stats()
+            render_quick_stats(snapshot)
             st.divider()
         
         # Settings link
@@ -183,33 +217,65 @@ def render_sidebar():
                 st.session_state.show_debug = True
             else:
                 st.session_state.show_debug = False
+        
+        show_debug_info("Script Run Times", get_run_time_stats())
+        show_debug_info("Database Sessions", get_session_metrics())
+        show_debug_info("Session Cache", get_cache_stats())
+        show_debug_info("Shared Cache", get_shared_cache().stats())
+        
+        from modules.activity.log import get_writer_stats
+        from modules.project.snapshot import get_scheduler_stats
+        show_debug_info("Activity Writer", get_writer_stats())
+        show_debug_info("Dashboard Snapshots", get_scheduler_stats())
 
 
+@fragment
 def render_project_selector():
-    """Render project selector in sidebar."""
+    """
+    Render project selector in sidebar.
+    
+    Searching, paging and the wizard rerun only this fragment; picking a
+    project or creating one reruns the whole app.
+    """
     from modules.project.service import ProjectService
     
     st.markdown("### 📁 Project")
     
-    # Get all projects
+    search = st.text_input(
+        "Search projects",
+        key="project_search",
+        placeholder="Search by name...",
+        label_visibility="collapsed"
+    )
+    page_size = st.session_state.get("project_list_size", PROJECT_PAGE_SIZE)
+    
+    # Listing pages are cached per process until a project changes
     try:
-        project_service = ProjectService()
-        projects = project_service.get_all_projects()
+        with ProjectService() as project_service:
+            page = project_service.list_projects(
+                limit=page_size, search=search
+            )
     except Exception as e:
         st.error(f"Error loading projects: {e}")
-        projects = []
+        page = {"items": [], "next_cursor": None}
+    
+    projects = page["items"]
+    current = st.session_state.get("current_project")
+    current_id = st.session_state.get("current_project_id")
     
-    if not projects:
+    if not projects and not current and not search:
         st.info("No projects yet")
         if st.button("➕ Create First Project", use_container_width=True):
             st.session_state.show_create_project = True
+    elif search and not projects:
+        st.caption("No projects match your search")
     else:
         # Project dropdown
         project_options = {p["id"]: p["name"] for p in projects}
+        if current and current_id not in project_options:
+            project_options = {current_id: current["name"], **project_options}
         project_options["__new__"] = "➕ Create New Project"
         
-        current_id = st.session_state.get("current_project_id")
-        
         selected = st.selectbox(
             "Select Project",
             options=list(project_options.keys()),
@@ -221,14 +287,19 @@ def render_project_selector():
             key="project_selector"
         )
         
+        if page["next_cursor"]:
+            if st.button("More projects...", key="more_projects"):
+                st.session_state.project_list_size = (
+                    page_size + PROJECT_PAGE_SIZE
+                )
+                rerun_fragment()
+        
         if selected == "__new__":
             st.session_state.show_create_project = True
         elif selected != current_id:
             # Load selected project
-            project = next(
-                (p for p in projects if p["id"] == selected),
-                None
-            )
+            with ProjectService() as project_service:
+                project = project_service.get_project(selected)
             if project:
                 st.session_state.current_project_id = project["id"]
                 st.session_state.current_project = project
@@ -296,7 +367,7 @@ def render_create_project_form():
         st.session_state.wizard_data = {}
         st.session_state.generated_framework = None
         st.session_state.show_create_project = False
-        st.rerun()
+        rerun_fragment()
 
 
 def render_wizard_step1(has_ai: bool):
@@ -394,7 +465,7 @@ def render_wizard_step1(has_ai: bool):
                     use_container_width=True
                 ):
                     st.session_state.wizard_step = 2
-                    st.rerun()
+                    rerun_fragment()
             else:
                 # Skip to manual entry if no AI
                 if st.button(
@@ -403,7 +474,7 @@ def render_wizard_step1(has_ai: bool):
                     use_container_width=True
                 ):
                     st.session_state.wizard_step = 3
-                    st.rerun()
+                    rerun_fragment()
         else:
             st.button(
                 "Please enter business name first",
@@ -448,11 +519,11 @@ def render_wizard_step2():
             col1, col2 = st.columns(2)
             with col1:
                 if st.button("🔄 Try Again"):
-                    st.rerun()
+                    rerun_fragment()
             with col2:
                 if st.button("← Back to Edit"):
                     st.session_state.wizard_step = 1
-                    st.rerun()
+                    rerun_fragment()
 
 
 def render_wizard_step3():
@@ -568,23 +639,34 @@ def render_wizard_step3():
         
         if back_clicked:
             st.session_state.wizard_step = 1
-            st.rerun()
+            rerun_fragment()
         
         if regenerate:
             st.session_state.wizard_step = 2
             st.session_state.generated_framework = None
-            st.rerun()
+            rerun_fragment()
         
         if create_clicked and name:
             try:
-                project_service = ProjectService()
-                new_project = project_service.create_project(
-                    name=name,
-                    source_context=source_context or None,
-                    central_entity=central_entity or None,
-                    central_search_intent=central_search_intent or None,
-                    functional_words=functional_words or None,
-                )
+                with ProjectService() as project_service:
+                    new_project = project_service.create_project(
+                        name=name,
+                        source_context=source_context or None,
+                        central_entity=central_entity or None,
+                        central_search_intent=central_search_intent or None,
+                        functional_words=functional_words or None,
+                    )
+                
+                if framework and framework.source_context:
+                    from modules.activity import log as activity
+                    
+                    activity.record_event(
+                        new_project["id"],
+                        activity.AI_JOB_FINISHED,
+                        "AI generated the project framework",
+                        data={"confidence": framework.confidence},
+                        invalidate=False,
+                    )
                 
                 # Reset wizard state
                 st.session_state.wizard_step = 1
@@ -604,7 +686,7 @@ def render_wizard_step3():
                 st.error(f"Error creating project: {e}")
 
 
-def render_quick_stats():
+def render_quick_stats(snapshot: dict):
     """Render quick project stats in sidebar."""
     project = st.session_state.get("current_project", {})
     
@@ -614,12 +696,13 @@ def render_quick_stats():
     if project.get("central_entity"):
         st.caption(f"Entity: {project.get('central_entity')}")
     
-    # Placeholder stats - will be populated when services are implemented
+    # From the snapshot the dashboard also renders
+    stats = snapshot["data"]["stats"]
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("📝 Briefs", "0")
+        st.metric("📝 Briefs", stats["total_briefs"])
     with col2:
-        st.metric("🟢 Live", "0")
+        st.metric("🟢 Live", stats["live_pages"])
 
 
 def main():
@@ -627,11 +710,25 @@ def main():
     # Initialize
     initialize_app()
     
+    # One database session for this script run, closed when it ends;
+    # fragment reruns skip main() and are timed under their own name
+    with timed_run("app"), db_scope():
+        render_app()
+
+
+def render_app():
+    """Render the application for one script run."""
     # Display any pending notifications
     display_notifications()
     
+    # Dashboard data of the current project, precomputed in the background
+    project_id = st.session_state.get("current_project_id")
+    snapshot = (
+        load_dashboard_snapshot(project_id) if project_id else EMPTY_SNAPSHOT
+    )
+    
     # Render sidebar
-    render_sidebar()
+    render_sidebar(snapshot)
     
     # Main content area
     st.title("🎯 Semantic SEO Platform")
@@ -649,7 +746,7 @@ def main():
         render_welcome()
     else:
         # Show dashboard
-        render_dashboard()
+        render_dashboard(snapshot)
 
 
 def render_welcome():
@@ -693,13 +790,36 @@ def render_welcome():
     """)
 
 
-def render_dashboard():
-    """Render main dashboard for selected project."""
+def render_dashboard(snapshot: dict):
+    """
+    Render main dashboard for selected project.
+    
+    Args:
+        snapshot: Dashboard snapshot of the project
+    """
+    from modules.project.snapshot import build_snapshot, rebuild_pending
+    
     project = st.session_state.get("current_project", {})
     
     # Project header
     st.markdown(f"## 📁 {project.get('name', 'Project')}")
     
+    # Snapshot age and on-demand refresh
+    col1, col2 = st.columns([5, 1])
+    with col1:
+        status = f"Dashboard data updated {format_age(snapshot['built_at'])}"
+        if rebuild_pending(project.get("id")):
+            status += " · refresh scheduled"
+        st.caption(status)
+    with col2:
+        if st.button("🔄 Refresh", key="refresh_dashboard"):
+            try:
+                with st.spinner("Refreshing dashboard..."):
+                    build_snapshot(project.get("id"))
+                st.rerun()
+            except Exception as e:
+                st.error(f"Error refreshing dashboard: {e}")
+    
     # Project context summary
     with st.expander("Project Context", expanded=False):
         col1, col2 = st.columns(2)
@@ -729,70 +849,169 @@ def render_dashboard():
     ])
     
     with tabs[0]:
-        render_overview_tab()
+        render_overview_tab(snapshot)
     
     with tabs[1]:
         render_quick_actions_tab()
     
     with tabs[2]:
-        render_recent_activity_tab()
+        render_recent_activity_tab(snapshot)
 
 
-def render_overview_tab():
+def render_overview_tab(snapshot: dict):
     """Render dashboard overview tab."""
-    # Status metrics (placeholder - will use real data)
+    stats = snapshot["data"]["stats"]
+    by_status = stats["briefs_by_status"]
+    
+    # Brief counts per workflow status
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
         st.metric(
             "⚫ Black",
-            "0",
+            by_status.get("black", 0),
             help="Briefs not ready"
         )
     with col2:
         st.metric(
             "🟠 Orange",
-            "0",
+            by_status.get("orange", 0),
             help="Briefs ready"
         )
     with col3:
         st.metric(
             "🟡 Yellow",
-            "0",
+            by_status.get("yellow", 0),
             help="Writing in progress"
         )
     with col4:
         st.metric(
             "🔵 Blue",
-            "0",
+            by_status.get("blue", 0),
             help="Awaiting publication"
         )
     with col5:
         st.metric(
             "🟢 Green",
-            "0",
+            by_status.get("green", 0),
             help="Published"
         )
     
     st.markdown("---")
     
-    # Topical Authority score (placeholder)
+    # Topical Authority score
     col1, col2 = st.columns([2, 1])
     
     with col1:
         st.markdown("### 📊 Topical Authority Score")
-        st.progress(0.0)
+        score = stats["authority"]
+        st.progress(
+            min(score["overall"], 1.0),
+            text=f"{score['overall']:.0%}"
+        )
         st.caption(
-            "Coverage: 0% | Depth: 0% | Momentum: 0%"
+            f"Coverage: {score['coverage']:.0%} | "
+            f"Depth: {score['depth']:.0%} | "
+            f"Momentum: {score['momentum']:.0%} | "
+            f"Live pages: {stats['live_pages']}"
         )
     
     with col2:
         st.markdown("### 🎯 Next Actions")
-        st.markdown("1. Define source context")
-        st.markdown("2. Create topical map")
-        st.markdown("3. Generate first briefs")
+        project = st.session_state.get("current_project") or {}
+        actions = []
+        if not project.get("source_context"):
+            actions.append("Define source context")
+        if not stats["topical_maps"]:
+            actions.append("Create topical map")
+        if not stats["total_briefs"]:
+            actions.append("Generate first briefs")
+        elif stats["live_pages"] < stats["total_briefs"]:
+            actions.append("Move ready briefs toward publication")
+        for i, action in enumerate(actions or ["Keep publishing"], 1):
+            st.markdown(f"{i}. {action}")
+    
+    # Queries with the most clicks (Search Console data)
+    top_queries = snapshot["data"]["top_queries"]
+    if top_queries:
+        st.markdown("---")
+        st.markdown("### 🔍 Top Queries")
+        st.dataframe(
+            [
+                {
+                    "Query": q["query"],
+                    "Clicks": q["clicks"],
+                    "Impressions": q["impressions"],
+                    "Avg. Position": q["position"],
+                }
+                for q in top_queries
+            ],
+            use_container_width=True,
+            hide_index=True,
+        )
+
 
+EMPTY_PROJECT_STATS = {
+    "topical_maps": 0,
+    "total_briefs": 0,
+    "briefs_by_status": {},
+    "publications": 0,
+    "live_pages": 0,
+    "coverage_score": 0.0,
+    "authority": {"overall": 0.0, "coverage": 0.0, "depth": 0.0, "momentum": 0.0},
+}
 
+
+EMPTY_SNAPSHOT = {
+    "project_id": None,
+    "data": {
+        "stats": EMPTY_PROJECT_STATS,
+        "recent_activity": [],
+        "activity_next_cursor": None,
+        "top_queries": [],
+    },
+    "built_at": None,
+    "build_ms": None,
+}
+
+
+def load_dashboard_snapshot(project_id: str) -> dict:
+    """
+    Get the project's dashboard snapshot (one primary-key read).
+    
+    The snapshot is only built during a page request on the project's
+    first visit; after that the background scheduler keeps it current.
+    """
+    from modules.project.snapshot import build_snapshot, get_snapshot
+    
+    try:
+        snapshot = get_snapshot(project_id)
+        if snapshot is None:
+            snapshot = build_snapshot(project_id)
+    except Exception as e:
+        st.error(f"Error loading dashboard: {e}")
+        snapshot = None
+    return snapshot or EMPTY_SNAPSHOT
+
+
+def format_age(timestamp: str) -> str:
+    """Format an ISO UTC timestamp as e.g. "5 min ago"."""
+    if not timestamp:
+        return "never"
+    
+    seconds = (
+        datetime.utcnow() - datetime.fromisoformat(timestamp)
+    ).total_seconds()
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)} h ago"
+    return f"{int(seconds // 86400)} d ago"
+
+
+@fragment
 def render_quick_actions_tab():
     """Render quick actions tab."""
     col1, col2 = st.columns(2)
@@ -840,19 +1059,78 @@ def render_quick_actions_tab():
             st.switch_page("pages/7_⚙️_Settings.py")
 
 
-def render_recent_activity_tab():
-    """Render recent activity tab."""
+ACTIVITY_PAGE_SIZE = 20
+
+ACTIVITY_ICONS = {
+    "project_created": "📁",
+    "project_updated": "✏️",
+    "project_imported": "📥",
+    "brief_created": "📝",
+    "brief_updated": "✏️",
+    "brief_status_changed": "🔁",
+    "brief_deleted": "🗑️",
+    "publication_created": "🚀",
+    "publication_updated": "🔄",
+    "topical_map_created": "🗺️",
+    "export_created": "📤",
+    "ai_job_finished": "🤖",
+}
+
+
+@fragment
+def render_recent_activity_tab(snapshot: dict):
+    """
+    Render recent activity tab ("Show more" reruns only this tab).
+    
+    The first page comes from the dashboard snapshot; further pages are
+    read from the activity log.
+    """
+    from modules.activity.service import ActivityService
+    
     st.markdown("### 📋 Recent Activity")
-    st.info("Activity tracking will be available once you start creating content.")
     
-    # Placeholder for activity feed
-    st.markdown("""
-    Activity will show:
-    - Recently created/updated briefs
-    - Publication events
-    - AI generation tasks
-    - Import/export operations
-    """)
+    project_id = st.session_state.get("current_project_id")
+    events = list(snapshot["data"]["recent_activity"])
+    next_cursor = snapshot["data"]["activity_next_cursor"]
+    
+    # Cursors of the further pages shown so far ("Show more" appends
+    # one); they continue the snapshot's first page, so start over
+    # whenever the snapshot is rebuilt
+    shown = (project_id, snapshot["built_at"])
+    paging = st.session_state.get("activity_paging")
+    if not paging or paging["snapshot"] != shown:
+        paging = {"snapshot": shown, "cursors": []}
+        st.session_state.activity_paging = paging
+    cursors = paging["cursors"]
+    
+    try:
+        with ActivityService() as activity_service:
+            for cursor in cursors:
+                page = activity_service.list_events(
+                    project_id, limit=ACTIVITY_PAGE_SIZE, cursor=cursor
+                )
+                events.extend(page["items"])
+                next_cursor = page["next_cursor"]
+    except Exception as e:
+        st.error(f"Error loading activity: {e}")
+        return
+    
+    if not events:
+        st.info(
+            "No activity yet. Creating briefs, publishing and exporting "
+            "will show up here."
+        )
+        return
+    
+    for event in events:
+        icon = ACTIVITY_ICONS.get(event["event_type"], "•")
+        when = event["created_at"][:16].replace("T", " ")
+        st.markdown(f"{icon} {event['summary'] or event['event_type']}")
+        st.caption(f"{when} UTC")
+    
+    if next_cursor and st.button("Show more", key="activity_more"):
+        cursors.append(next_cursor)
+        rerun_fragment()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,227 @@
+"""Benchmark script time per interaction in the main app.
+
+Seeds a temporary SQLite database with projects, briefs and activity,
+then drives ``app.py`` through Streamlit's AppTest: first render, a plain
+rerun, searching and paging the project list, selecting a project and
+paging its activity feed.
+
+AppTest reruns the whole script for every interaction, so the "full run"
+column (wall time of the AppTest run) and the "script" column (the app's
+own ``timed_run("app")`` time) are what an interaction costs without
+fragments. Interactions inside a fragment only rerun that fragment in a
+browser session; its own time is the "fragment" column. Trees without
+run timing only report the full run, which makes it easy to compare
+against an older checkout::
+    
+    python benchmarks/bench_interactions.py --json after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def seed(projects: int, briefs: int, events: int) -> str:
+    """
+    Insert projects; the second newest gets briefs and activity events.
+    
+    The app opens the newest project, so the benchmark switches to the
+    second one.
+    
+    Returns:
+        Name of the project with data
+    """
+    from sqlalchemy import insert
+    
+    from config.database import get_session_local, init_db
+    from utils.database import ActivityEvent, ContentBrief, Project
+    
+    init_db()
+    statuses = ["black", "orange", "yellow", "blue", "green"]
+    
+    session = get_session_local()()
+    try:
+        start = datetime.utcnow() - timedelta(days=1)
+        rows = [
+            Project(
+                name=f"Project {i:04d}",
+                central_entity=f"entity {i}",
+                updated_at=start + timedelta(seconds=i),
+            )
+            for i in range(projects)
+        ]
+        session.add_all(rows)
+        session.flush()
+        project_id = rows[-2].id
+        project_name = rows[-2].name
+        
+        session.execute(insert(ContentBrief), [
+            {
+                "project_id": project_id,
+                "title_tag": f"Brief {i}",
+                "status": statuses[i % len(statuses)],
+            }
+            for i in range(briefs)
+        ])
+        
+        session.execute(insert(ActivityEvent), [
+            {
+                "project_id": project_id,
+                "event_type": "brief_created",
+                "summary": f"Created brief Brief {i}",
+                "created_at": start + timedelta(seconds=i),
+            }
+            for i in range(events)
+        ])
+        session.commit()
+        return project_name
+    finally:
+        session.close()
+
+
+def fragment_ms(at, region: str) -> Optional[float]:
+    """Milliseconds of a region's last timed run (None if not timed)."""
+    if "run_times" not in at.session_state:
+        return None
+    history = at.session_state["run_times"].get(region)
+    return history[-1] * 1000 if history else None
+
+
+def run_interactions(
+    project_name: str
+) -> Dict[str, Tuple[float, Optional[float], Optional[float]]]:
+    """
+    Drive the app once through every interaction.
+    
+    Returns:
+        Interaction name -> (full run ms, script ms, fragment ms); the
+        last two are None when not timed
+    """
+    from streamlit.testing.v1 import AppTest
+    
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120)
+    results = {}
+    
+    def measure(name: str, action, region: Optional[str] = None):
+        start = time.perf_counter()
+        action()
+        elapsed = (time.perf_counter() - start) * 1000
+        if at.exception:
+            raise RuntimeError(f"{name} failed: {at.exception[0].message}")
+        results[name] = (
+            elapsed,
+            fragment_ms(at, "app"),
+            fragment_ms(at, region) if region else None,
+        )
+    
+    selector = "render_project_selector"
+    measure("first render", at.run)
+    measure("rerun", at.run)
+    measure(
+        "search projects",
+        lambda: at.sidebar.text_input(key="project_search")
+        .input("Project 00").run(),
+        selector,
+    )
+    measure(
+        "clear search",
+        lambda: at.sidebar.text_input(key="project_search").input("").run(),
+        selector,
+    )
+    measure(
+        "more projects",
+        lambda: at.sidebar.button(key="more_projects").click().run(),
+        selector,
+    )
+    
+    def select_project():
+        selectbox = at.sidebar.selectbox(key="project_selector")
+        selectbox.select_index(selectbox.options.index(project_name)).run()
+    
+    measure("select project", select_project)
+    measure(
+        "activity: show more",
+        lambda: at.button(key="activity_more").click().run(),
+        "render_recent_activity_tab",
+    )
+    return results
+
+
+def median(values: List[Optional[float]]) -> Optional[float]:
+    values = [v for v in values if v is not None]
+    return statistics.median(values) if values else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--briefs", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--json", type=Path, help="Save results to a file")
+    parser.add_argument(
+        "--compare", type=Path, help="Earlier --json results to diff against"
+    )
+    args = parser.parse_args()
+    
+    tmp = Path(tempfile.mkdtemp(prefix="bench_interactions_"))
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp / 'bench.db'}"
+    os.environ["EXPORT_PATH"] = str(tmp / "exports")
+    os.environ["BACKUP_PATH"] = str(tmp / "backups")
+    
+    project_name = seed(args.projects, args.briefs, args.events)
+    runs = [run_interactions(project_name) for _ in range(args.repeat)]
+    
+    results = {
+        name: {
+            "full_ms": median([r[name][0] for r in runs]),
+            "script_ms": median([r[name][1] for r in runs]),
+            "fragment_ms": median([r[name][2] for r in runs]),
+        }
+        for name in runs[0]
+    }
+    
+    baseline = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    
+    print(
+        f"Script time per interaction (median of {args.repeat}; "
+        f"{args.projects} projects, {args.briefs} briefs, "
+        f"{args.events} events)"
+    )
+    print(
+        f"  {'':<24}{'full run':>10}{'script':>10}{'fragment':>10}"
+        + ("  full run before" if baseline else "")
+    )
+    
+    def cell(ms: Optional[float]) -> str:
+        return f"{ms:8.0f}ms" if ms is not None else f"{'-':>10}"
+    
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("full_ms")
+        print(
+            f"  {name:<24}{cell(result['full_ms'])}"
+            f"{cell(result['script_ms'])}{cell(result['fragment_ms'])}"
+            + (f"  {before:8.0f}ms" if before else "")
+        )
+    
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
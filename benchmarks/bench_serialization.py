@@ -0,0 +1,189 @@
+"""Benchmark JSON serialization of a large project export.
+
+Builds a synthetic project in a temporary SQLite database, then streams
+it to NDJSON with the standard library serializer and with the fast
+backend of ``utils.serialization`` (orjson or msgspec, when installed),
+and checks both produce the same records.
+
+Usage::
+    
+    python benchmarks/bench_serialization.py --briefs 5000 --sections 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def build_project(briefs: int, sections: int) -> str:
+    """Insert a project with briefs, sections, maps and entities."""
+    from sqlalchemy import insert
+    
+    from config.database import get_session_local
+    from utils.database import (
+        BriefSection, ContentBrief, Entity, Project, TopicalMap
+    )
+    
+    session = get_session_local()()
+    try:
+        project = Project(
+            name="Benchmark", central_entity="benchmark",
+            functional_words=["buy", "compare", "learn"],
+        )
+        session.add(project)
+        session.flush()
+        
+        topical_map = TopicalMap(project_id=project.id, name="Map")
+        session.add(topical_map)
+        session.flush()
+        
+        session.execute(insert(Entity), [
+            {"topical_map_id": topical_map.id, "name": f"Entity {i}"}
+            for i in range(briefs // 10)
+        ])
+        
+        brief_ids = []
+        brief_rows = []
+        for i in range(briefs):
+            brief_ids.append(str(uuid.uuid4()))
+            brief_rows.append({
+                "id": brief_ids[-1],
+                "project_id": project.id,
+                "title_tag": f"Brief {i}: how to compare option {i}",
+                "url_slug": f"brief-{i}",
+                "macro_context": "Benchmark macro context " * 4,
+                "micro_contexts": [f"context {j}" for j in range(5)],
+            })
+        session.execute(insert(ContentBrief), brief_rows)
+        
+        session.execute(insert(BriefSection), [
+            {
+                "brief_id": brief_id,
+                "heading_level": "H2",
+                "heading_text": f"Section {j} heading text",
+                "order_position": j,
+                "content_instructions": {"tone": "neutral", "words": 150},
+            }
+            for brief_id in brief_ids
+            for j in range(sections)
+        ])
+        
+        session.commit()
+        return project.id
+    finally:
+        session.close()
+
+
+def export_ndjson(project_id: str) -> bytes:
+    """Stream the project to NDJSON in memory."""
+    from config.database import get_session_local
+    from modules.project.export import ProjectExporter
+    
+    buffer = io.BytesIO()
+    session = get_session_local()()
+    try:
+        ProjectExporter(session).write(project_id, buffer, format="ndjson")
+    finally:
+        session.close()
+    return buffer.getvalue()
+
+
+def fetch_rows(project_id: str, iso_dates: bool) -> list:
+    """Load every exported row into memory."""
+    from config.database import get_session_local
+    from modules.project.export import ProjectExporter
+    
+    session = get_session_local()()
+    try:
+        return [
+            {"table": table, "row": row}
+            for table, row in ProjectExporter(session).iter_rows(
+                project_id, iso_dates=iso_dates
+            )
+        ]
+    finally:
+        session.close()
+
+
+def timed(func, repeat: int):
+    """Run func repeat times; return the last result and the best time."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--briefs", type=int, default=5000)
+    parser.add_argument("--sections", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    tmp = tempfile.mkdtemp(prefix="bench_serialization_")
+    os.environ["DATABASE_PATH"] = str(Path(tmp) / "bench.db")
+    os.environ.pop("DATABASE_URL", None)
+    
+    from config.database import init_db
+    from utils import serialization
+    
+    init_db()
+    project_id = build_project(args.briefs, args.sections)
+    rows = args.briefs * (args.sections + 1) + args.briefs // 10
+    
+    fast_backend = serialization.backend()
+    
+    # Encoding only: rows already in memory
+    iso_rows = fetch_rows(project_id, iso_dates=True)
+    native_rows = fetch_rows(project_id, iso_dates=False)
+    _, encode_slow = timed(
+        lambda: [json.dumps(r, default=str).encode("utf-8") for r in iso_rows],
+        args.repeat
+    )
+    _, encode_fast = timed(
+        lambda: [serialization.dumps(r) for r in native_rows], args.repeat
+    )
+    
+    # End to end: query, serialize and write NDJSON
+    fast, fast_time = timed(lambda: export_ndjson(project_id), args.repeat)
+    
+    # Force the standard library fallback
+    saved = serialization.orjson, serialization.msgspec
+    serialization.orjson = serialization.msgspec = None
+    try:
+        slow, slow_time = timed(lambda: export_ndjson(project_id), args.repeat)
+    finally:
+        serialization.orjson, serialization.msgspec = saved
+    
+    def records(data: bytes):
+        lines = data.splitlines()[1:]  # Header carries the export time
+        return [json.loads(line) for line in lines]
+    
+    same = records(fast) == records(slow)
+    
+    print(f"Rows exported:       {rows:,}")
+    print("Encoding only (rows in memory)")
+    print(f"  json (stdlib):     {encode_slow:.3f}s")
+    print(f"  {fast_backend + ':':<19}{encode_fast:.3f}s")
+    print(f"  Speedup:           {encode_slow / encode_fast:.2f}x")
+    print("Full NDJSON export (query + encode + write)")
+    print(f"  json (stdlib):     {slow_time:.3f}s ({len(slow) / 1e6:.1f} MB)")
+    print(f"  {fast_backend + ':':<19}{fast_time:.3f}s ({len(fast) / 1e6:.1f} MB)")
+    print(f"  Speedup:           {slow_time / fast_time:.2f}x")
+    print(f"Identical records:   {same}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
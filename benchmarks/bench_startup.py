@@ -0,0 +1,188 @@
+"""Benchmark cold-start cost of the app and its pages.
+
+Measures, each in a fresh interpreter so nothing is already imported:
+
+- import time of the modules every page loads, from ``python -X
+  importtime`` (cumulative microseconds of the top-level imports)
+- first-render time of ``app.py`` and every page under ``pages/``, run
+  through Streamlit's AppTest against an empty temporary database
+
+Results can be saved and compared with an earlier run, e.g. before and
+after a deploy::
+    
+    python benchmarks/bench_startup.py --json after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules loaded on the startup path of every page
+MODULES = [
+    "config.settings",
+    "config.database",
+    "utils.session_state",
+    "utils.database",
+    "utils.export",
+    "modules.project.service",
+    "modules.analytics.scoring",
+]
+
+RENDER_SNIPPET = """
+import sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+start = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - start
+print("ERROR" if at.exception else elapsed)
+"""
+
+
+def run_python(args: List[str], env: Dict[str, str]) -> subprocess.CompletedProcess:
+    """Run the interpreter from the repository root."""
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def import_time(module: str, env: Dict[str, str]) -> Dict[str, float]:
+    """
+    Import a module in a fresh interpreter.
+    
+    Returns:
+        Dictionary with the total milliseconds spent importing the
+        module's package and the three slowest direct dependencies
+    """
+    result = run_python(["-X", "importtime", "-c", f"import {module}"], env)
+    package = module.split(".")[0]
+    
+    def in_package(name: str) -> bool:
+        return name.split(".")[0] == package
+    
+    total = 0.0
+    slowest = []
+    pending = []  # (depth, ms, name) since the last top-level import
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header
+        
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        pending.append((depth, int(cumulative) / 1000, name.strip()))
+        if depth > 0:
+            continue
+        
+        if in_package(name.strip()):
+            total += pending[-1][1]
+            # Lines are printed after their own imports, so a line's
+            # importer is the next line with a smaller depth
+            for i, (d, ms, dep) in enumerate(pending[:-1]):
+                parent = next(p for p in pending[i + 1:] if p[0] < d)
+                if not in_package(dep) and in_package(parent[2]):
+                    slowest.append((ms, dep))
+        pending = []
+    
+    slowest = sorted(slowest, reverse=True)[:3]
+    return {
+        "total_ms": total,
+        "slowest": [f"{name} {ms:.0f}ms" for ms, name in slowest],
+    }
+
+
+def render_time(script: Path, env: Dict[str, str]) -> Optional[float]:
+    """First-render milliseconds of a page (None if it raised)."""
+    result = run_python(["-c", RENDER_SNIPPET, str(script)], env)
+    output = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not output or output[-1] == "ERROR":
+        return None
+    return float(output[-1]) * 1000
+
+
+def median(values: List[Optional[float]]) -> Optional[float]:
+    values = [v for v in values if v is not None]
+    return statistics.median(values) if values else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", type=Path, help="Save results to a file")
+    parser.add_argument(
+        "--compare", type=Path, help="Earlier --json results to diff against"
+    )
+    parser.add_argument(
+        "--skip-render", action="store_true", help="Only measure imports"
+    )
+    args = parser.parse_args()
+    
+    tmp = tempfile.mkdtemp(prefix="bench_startup_")
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{Path(tmp) / 'bench.db'}"
+    env["EXPORT_PATH"] = str(Path(tmp) / "exports")
+    env["BACKUP_PATH"] = str(Path(tmp) / "backups")
+    env["PYTHONPATH"] = str(ROOT)
+    
+    results = {"imports": {}, "renders": {}}
+    
+    for module in MODULES:
+        runs = [import_time(module, env) for _ in range(args.repeat)]
+        results["imports"][module] = {
+            "ms": median([r["total_ms"] for r in runs]),
+            "slowest": runs[-1]["slowest"],
+        }
+    
+    if not args.skip_render:
+        scripts = [ROOT / "app.py", *sorted((ROOT / "pages").glob("*.py"))]
+        for script in scripts:
+            name = str(script.relative_to(ROOT))
+            runs = [render_time(script, env) for _ in range(args.repeat)]
+            results["renders"][name] = {"ms": median(runs)}
+    
+    baseline = {"imports": {}, "renders": {}}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    
+    def row(label: str, section: str, name: str, extra: str = ""):
+        ms = results[section][name]["ms"]
+        before = baseline.get(section, {}).get(name, {}).get("ms")
+        value = "failed" if ms is None else f"{ms:8.0f}ms"
+        delta = ""
+        if ms is not None and before:
+            delta = f"  ({(ms - before) / before:+.0%} vs {before:.0f}ms)"
+        print(f"  {label:<36}{value}{delta}{extra}")
+    
+    print(f"Import time (median of {args.repeat}, fresh interpreter)")
+    for module in MODULES:
+        slowest = ", ".join(results["imports"][module]["slowest"])
+        row(module, "imports", module)
+        print(f"  {'':<38}slowest: {slowest}")
+    
+    if results["renders"]:
+        print(f"First render (median of {args.repeat}, empty database)")
+        for name in results["renders"]:
+            row(name, "renders", name)
+    
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,14 +1,20 @@
-"""Configuration package for Semantic SEO Platform."""
-
-from config.settings import Settings, get_settings
-from config.ai_providers import AI_PROVIDERS, get_provider_config
-from config.database import get_database_url, init_db
-
-__all__ = [
-    "Settings",
-    "get_settings",
-    "AI_PROVIDERS",
-    "get_provider_config",
-    "get_database_url",
-    "init_db",
-]
\ No newline at end of file
+"""Configuration package for Semantic SEO Platform.
+
+Package-level names are imported on first access (PEP 562), so importing
+``config.settings`` does not also load the AI provider table or the
+database engine code.
+"""
+
+from __future__ import annotations
+
+from utils.lazy import lazy_module
+
+# Public name -> defining module
+__getattr__, __dir__, __all__ = lazy_module(__name__, {
+    "Settings": "config.settings",
+    "get_settings": "config.settings",
+    "AI_PROVIDERS": "config.ai_providers",
+    "get_provider_config": "config.ai_providers",
+    "get_database_url": "config.database",
+    "init_db": "config.database",
+})
\ No newline at end of file
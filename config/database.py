@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
@@ -13,17 +18,38 @@ from sqlalchemy.pool import StaticPool
 _engine = None
 _SessionLocal = None
 
+# Session shared by all services during one script run (see db_scope)
+_scoped_session: ContextVar[Optional[Session]] = ContextVar(
+    "scoped_session", default=None
+)
 
-def get_database_url(db_path: Optional[str] = None) -> str:
+
+def get_database_url(
+    db_path: Optional[str] = None,
+    url: Optional[str] = None
+) -> str:
     """
-    Get SQLite database URL.
+    Get database URL.
+    
+    An explicit URL wins, then the ``DATABASE_URL`` setting (e.g. a shared
+    PostgreSQL server for team deployments), then a local SQLite file.
     
     Args:
-        db_path: Optional custom database path
+        db_path: Optional custom SQLite database path
+        url: Optional full SQLAlchemy database URL
     
     Returns:
-        SQLite connection URL
+        Database connection URL
     """
+    if url:
+        return url
+    
+    from config.settings import get_settings
+    
+    settings_url = get_settings().database.url
+    if settings_url:
+        return settings_url
+    
     if db_path is None:
         # Default path relative to config directory
         base_path = Path(__file__).parent.parent
@@ -37,6 +63,87 @@ def get_database_url(db_path: Optional[str] = None) -> str:
     return f"sqlite:///{db_path}"
 
 
+def get_backend_name(database_url: Optional[str] = None) -> str:
+    """
+    Get the backend name (sqlite, postgresql, ...) of a database URL.
+    
+    Args:
+        database_url: Database URL (defaults to the engine's URL)
+    
+    Returns:
+        Backend name
+    """
+    if database_url is None:
+        return get_engine().dialect.name
+    return make_url(database_url).get_backend_name()
+
+
+def create_db_engine(database_url: str, echo: bool = False):
+    """
+    Create an engine with backend-appropriate pooling.
+    
+    - In-memory SQLite uses a single shared connection (StaticPool).
+    - File SQLite uses a connection pool with WAL journaling, so readers
+      don't wait on the writer, and a busy timeout instead of failing
+      immediately on lock contention.
+    - Server databases (PostgreSQL) use a QueuePool sized from
+      ``DatabaseSettings`` with pre-ping to drop stale connections.
+    
+    Args:
+        database_url: SQLAlchemy database URL
+        echo: Log SQL statements
+    
+    Returns:
+        SQLAlchemy engine
+    """
+    from config.settings import get_settings
+    
+    db_settings = get_settings().database
+    url = make_url(database_url)
+    
+    if url.get_backend_name() != "sqlite":
+        return create_engine(
+            url,
+            pool_size=db_settings.pool_size,
+            max_overflow=db_settings.max_overflow,
+            pool_timeout=db_settings.pool_timeout,
+            pool_recycle=db_settings.pool_recycle,
+            pool_pre_ping=True,
+            echo=echo,
+        )
+    
+    in_memory = url.database in (None, "", ":memory:")
+    
+    if in_memory:
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            echo=echo,
+        )
+    else:
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False, "timeout": 30},
+            pool_size=db_settings.pool_size,
+            max_overflow=db_settings.max_overflow,
+            pool_timeout=db_settings.pool_timeout,
+            echo=echo,
+        )
+    
+    # Enable foreign keys (and WAL for files) for SQLite
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if not in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+    
+    return engine
+
+
 def get_engine(db_path: Optional[str] = None):
     """
     Get or create SQLAlchemy engine.
@@ -50,25 +157,49 @@ def get_engine(db_path: Optional[str] = None):
     global _engine
     
     if _engine is None:
-        database_url = get_database_url(db_path)
+        from config.settings import get_settings
         
-        _engine = create_engine(
+        database_url = get_database_url(db_path)
+        _engine = create_db_engine(
             database_url,
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
-            echo=False,  # Set to True for SQL logging
+            echo=get_settings().database.echo,  # Set to True for SQL logging
         )
-        
-        # Enable foreign keys for SQLite
-        @event.listens_for(_engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
     
     return _engine
 
 
+def shares_connection() -> bool:
+    """Check if the engine hands the same connection to every thread."""
+    return isinstance(get_engine().pool, StaticPool)
+
+
+class TrackedSession(Session):
+    """Session that keeps process-wide counts of opened/closed sessions."""
+    
+    _lock = threading.Lock()
+    _open: "weakref.WeakSet[TrackedSession]" = weakref.WeakSet()
+    _opened_total = 0
+    _closed_total = 0
+    _peak_open = 0
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        cls = TrackedSession
+        with cls._lock:
+            cls._open.add(self)
+            cls._opened_total += 1
+            cls._peak_open = max(cls._peak_open, len(cls._open))
+    
+    def close(self):
+        """Close the session and stop counting it as open."""
+        super().close()
+        cls = TrackedSession
+        with cls._lock:
+            if self in cls._open:
+                cls._open.discard(self)
+                cls._closed_total += 1
+
+
 def get_session_local():
     """Get SessionLocal class for creating sessions."""
     global _SessionLocal
@@ -78,12 +209,72 @@ def get_session_local():
         _SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
-            bind=engine
+            bind=engine,
+            class_=TrackedSession
         )
     
     return _SessionLocal
 
 
+@contextmanager
+def db_scope() -> Iterator[Session]:
+    """
+    Open one session for a unit of work (e.g. a Streamlit script run).
+    
+    Services created inside the scope without an explicit session share
+    this session instead of opening their own; it is closed when the
+    scope exits, however the run ends (including st.stop/st.rerun).
+    Nested scopes reuse the outer session.
+    
+    Yields:
+        Database session
+    """
+    current = _scoped_session.get()
+    if current is not None:
+        yield current
+        return
+    
+    session = get_session_local()()
+    token = _scoped_session.set(session)
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _scoped_session.reset(token)
+        session.close()
+
+
+def get_scoped_session() -> Optional[Session]:
+    """Get the session of the active db_scope, if any."""
+    return _scoped_session.get()
+
+
+def get_session_metrics() -> Dict[str, Any]:
+    """
+    Get process-wide session metrics.
+    
+    Returns:
+        Dictionary with open/opened/closed/peak session counts and the
+        number of objects held in open sessions' identity maps
+    """
+    cls = TrackedSession
+    with cls._lock:
+        sessions = list(cls._open)
+        metrics = {
+            "open_sessions": len(sessions),
+            "opened_total": cls._opened_total,
+            "closed_total": cls._closed_total,
+            "peak_open": cls._peak_open,
+        }
+    
+    metrics["identity_map_objects"] = sum(
+        len(session.identity_map) for session in sessions
+    )
+    return metrics
+
+
 def get_db() -> Session:
     """
     Get database session.
@@ -107,13 +298,89 @@ def init_db(db_path: Optional[str] = None):
         db_path: Optional custom database path
     """
     from utils.database import Base
+    from utils.content_store import migrate_inline_content
     
     engine = get_engine(db_path)
     Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+    migrate_inline_content(engine)
     
     return engine
 
 
+def upgrade_schema(engine):
+    """
+    Add columns that were introduced after a table was first created.
+    
+    ``create_all`` only creates missing tables, so databases created by an
+    older version would lack new columns and indexes. Only nullable
+    columns without server defaults are added; anything else needs a real
+    migration.
+    
+    Args:
+        engine: SQLAlchemy engine
+    
+    Returns:
+        List of added "table.column" names
+    """
+    from utils.database import Base
+    
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+    
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            
+            existing_columns = {
+                c["name"] for c in inspector.get_columns(table.name)
+            }
+            
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                if not column.nullable or column.server_default is not None:
+                    continue
+                
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(
+                    f'ALTER TABLE "{table.name}" '
+                    f'ADD COLUMN "{column.name}" {column_type}'
+                ))
+                added.append(f"{table.name}.{column.name}")
+        
+        # Indexes added after a table was created are skipped by
+        # create_all for old tables
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_indexes = _get_index_names(conn, table.name)
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(bind=conn)
+    
+    return added
+
+
+def _get_index_names(conn, table_name: str) -> set:
+    """Get a table's index names, including expression indexes."""
+    if conn.dialect.name == "sqlite":
+        # The SQLite inspector skips expression indexes
+        return set(conn.execute(
+            text(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = :table"
+            ),
+            {"table": table_name}
+        ).scalars())
+    
+    return {
+        index["name"] for index in inspect(conn).get_indexes(table_name)
+    }
+
+
 def reset_db(db_path: Optional[str] = None):
     """
     Reset database by dropping and recreating all tables.
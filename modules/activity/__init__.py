@@ -0,0 +1,10 @@
+"""Activity module - project event log and feed."""
+
+from modules.activity.log import record_event, flush_events
+from modules.activity.service import ActivityService
+
+__all__ = [
+    "ActivityService",
+    "record_event",
+    "flush_events",
+]
\ No newline at end of file
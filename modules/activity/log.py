@@ -0,0 +1,253 @@
+"""Buffered writer for the activity event log.
+
+Services call ``record_event`` after a write; it only appends the event
+to an in-memory buffer, so it adds no database work to user actions. A
+daemon thread inserts buffered events in batches (one multi-row INSERT
+per flush) every ``FLUSH_INTERVAL`` seconds or as soon as ``BATCH_SIZE``
+events are waiting. A batch whose insert fails (e.g. while the database
+is locked) is retried on the following flushes, up to ``MAX_RETRIES``.
+
+Recording an event is also the change signal for the shared cache: the
+event's project version is bumped immediately, so every session reads
+fresh data on its next rerun even before the event itself is written.
+It also schedules a rebuild of the project's dashboard snapshot.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from config.database import get_session_local
+from modules.project.snapshot import schedule_rebuild
+from utils.database import ActivityEvent
+from utils.shared_cache import bump_project_version
+
+
+# Event types
+PROJECT_CREATED = "project_created"
+PROJECT_UPDATED = "project_updated"
+PROJECT_IMPORTED = "project_imported"
+BRIEF_CREATED = "brief_created"
+BRIEF_UPDATED = "brief_updated"
+BRIEF_STATUS_CHANGED = "brief_status_changed"
+BRIEF_DELETED = "brief_deleted"
+PUBLICATION_CREATED = "publication_created"
+PUBLICATION_UPDATED = "publication_updated"
+TOPICAL_MAP_CREATED = "topical_map_created"
+EXPORT_CREATED = "export_created"
+AI_JOB_FINISHED = "ai_job_finished"
+
+# Events that do not change project data
+READ_ONLY_EVENTS = (EXPORT_CREATED, AI_JOB_FINISHED)
+
+FLUSH_INTERVAL = 0.5  # Seconds between flushes
+BATCH_SIZE = 200  # Events that trigger an early flush
+MAX_PENDING = 10000  # Oldest events are dropped beyond this
+MAX_RETRIES = 5  # Failed flushes before a batch is dropped
+
+
+class ActivityWriter:
+    """Buffer activity events and insert them in batches."""
+    
+    def __init__(
+        self,
+        flush_interval: float = FLUSH_INTERVAL,
+        batch_size: int = BATCH_SIZE,
+        max_pending: int = MAX_PENDING,
+        max_retries: int = MAX_RETRIES
+    ):
+        """
+        Initialize writer.
+        
+        Args:
+            flush_interval: Seconds between flushes
+            batch_size: Pending events that trigger an early flush
+            max_pending: Buffer size (oldest events are dropped when full)
+            max_retries: Failed flushes before a batch is dropped
+        """
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        
+        self._pending: Deque[Dict[str, Any]] = deque(maxlen=max_pending)
+        self._in_flight: List[Dict[str, Any]] = []
+        # Batches whose insert failed, oldest first: [failed flushes, events]
+        self._retry: List[List[Any]] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # One batch insert at a time
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_error: Optional[str] = None
+    
+    def record(self, event: Dict[str, Any]):
+        """Buffer an event for the next batch."""
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._pending.append(event)
+            self.recorded += 1
+            full = len(self._pending) >= self.batch_size
+            
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="activity-writer", daemon=True
+                )
+                self._thread.start()
+        
+        if full:
+            self._wakeup.set()
+    
+    def flush(self) -> int:
+        """
+        Insert all buffered events now.
+        
+        Batches that failed before are inserted first, in order. When an
+        insert fails, the remaining batches are kept for the next flush,
+        and a batch that has failed ``max_retries`` flushes is dropped.
+        
+        Returns:
+            Number of events written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batches = self._retry
+                if self._pending:
+                    batches.append([0, list(self._pending)])
+                    self._pending.clear()
+                self._retry = []
+                self._in_flight = [e for _, batch in batches for e in batch]
+            
+            written = 0
+            try:
+                while batches:
+                    error = self._insert(batches[0][1])
+                    if error is None:
+                        written += len(batches.pop(0)[1])
+                        continue
+                    
+                    self.failed += len(batches[0][1])
+                    self.last_error = error
+                    # The database is likely still busy, so every waiting
+                    # batch counts this flush as a failure
+                    for entry in batches:
+                        entry[0] += 1
+                    expired = [b for b in batches if b[0] >= self.max_retries]
+                    self.dropped += sum(len(batch) for _, batch in expired)
+                    batches = [b for b in batches if b[0] < self.max_retries]
+                    break
+            finally:
+                self.written += written
+                with self._lock:
+                    self._retry = batches
+                    self._in_flight = []
+            
+            return written
+    
+    def _insert(self, batch: List[Dict[str, Any]]) -> Optional[str]:
+        """Insert one batch; returns the error message if it failed."""
+        session = get_session_local()()
+        try:
+            session.execute(insert(ActivityEvent), batch)
+            session.commit()
+            return None
+        except Exception as e:
+            session.rollback()
+            return f"{type(e).__name__}: {e}"
+        finally:
+            session.close()
+    
+    def pending(self, project_id: str) -> List[Dict[str, Any]]:
+        """Get a project's events that are not written yet, oldest first."""
+        with self._lock:
+            events = self._in_flight + [
+                e for _, batch in self._retry for e in batch
+            ] + list(self._pending)
+        return [e for e in events if e["project_id"] == project_id]
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get buffer size and recorded/written/dropped/failed counts."""
+        with self._lock:
+            return {
+                "pending": len(self._pending) + len(self._in_flight) + sum(
+                    len(batch) for _, batch in self._retry
+                ),
+                "recorded": self.recorded,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "last_error": self.last_error,
+            }
+    
+    def _run(self):
+        """Flush periodically, or early when a batch fills up."""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+_writer = ActivityWriter()
+atexit.register(_writer.flush)
+
+
+def record_event(
+    project_id: str,
+    event_type: str,
+    summary: Optional[str] = None,
+    subject_id: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+    invalidate: bool = True
+):
+    """
+    Record a project change.
+    
+    Invalidates the project's shared cache entries immediately, buffers
+    the event for the next batch insert and schedules a rebuild of the
+    project's dashboard snapshot (which lists recent events).
+    
+    Args:
+        project_id: Project UUID
+        event_type: One of the event type constants
+        summary: Short human-readable description
+        subject_id: ID of the changed brief, publication, ...
+        data: Optional JSON-serializable details
+        invalidate: Bump the project's cache version (False for events
+            that do not change project data, e.g. exports)
+    """
+    if invalidate:
+        bump_project_version(project_id)
+    _writer.record({
+        "project_id": project_id,
+        "event_type": event_type,
+        "subject_id": subject_id,
+        "summary": (summary or "")[:255] or None,
+        "data": data,
+        "created_at": datetime.utcnow(),
+    })
+    schedule_rebuild(project_id)
+
+
+def flush_events() -> int:
+    """Write buffered events now (e.g. before reading them back)."""
+    return _writer.flush()
+
+
+def pending_events(project_id: str) -> List[Dict[str, Any]]:
+    """Get a project's buffered, not yet written events."""
+    return _writer.pending(project_id)
+
+
+def get_writer_stats() -> Dict[str, Any]:
+    """Get activity writer statistics."""
+    return _writer.stats()
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""Activity service for reading a project's event feed."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from config.database import get_scoped_session, get_session_local
+from modules.activity.log import READ_ONLY_EVENTS, pending_events
+from utils.database import ActivityEvent
+
+
+class ActivityService:
+    """Service for reading activity events."""
+    
+    def __init__(self, db_session: Optional[Session] = None):
+        """
+        Initialize activity service.
+        
+        Args:
+            db_session: Optional SQLAlchemy session (creates new if not provided)
+        """
+        self._session = db_session
+        self._owns_session = db_session is None
+    
+    @property
+    def session(self) -> Session:
+        """Get database session (the active db_scope session if any)."""
+        if self._session is None:
+            scoped = get_scoped_session()
+            if scoped is not None:
+                self._session = scoped
+                self._owns_session = False
+            else:
+                SessionLocal = get_session_local()
+                self._session = SessionLocal()
+        return self._session
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close session if we own it."""
+        if self._owns_session and self._session:
+            self._session.close()
+    
+    def list_events(
+        self,
+        project_id: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        event_types: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        List a project's events, newest first, one page at a time.
+        
+        Pages are keyset-paginated on (created_at, id) over the
+        project_id/created_at index, so every page costs one index range
+        scan however deep the feed is. The first page also includes
+        events that are still buffered by the activity writer.
+        
+        Args:
+            project_id: Project UUID
+            limit: Maximum events per page
+            cursor: ``next_cursor`` of the previous page
+            event_types: Optional event type filter
+        
+        Returns:
+            Dictionary with "items" (event dictionaries) and
+            "next_cursor" (None on the last page)
+        """
+        query = select(ActivityEvent).where(
+            ActivityEvent.project_id == project_id
+        )
+        
+        if event_types:
+            query = query.where(ActivityEvent.event_type.in_(event_types))
+        
+        if cursor:
+            created_at, last_id = cursor.split("|", 1)
+            created_at = datetime.fromisoformat(created_at)
+            query = query.where(or_(
+                ActivityEvent.created_at < created_at,
+                and_(
+                    ActivityEvent.created_at == created_at,
+                    ActivityEvent.id < int(last_id),
+                ),
+            ))
+        
+        events = self.session.execute(
+            query.order_by(
+                ActivityEvent.created_at.desc(), ActivityEvent.id.desc()
+            ).limit(limit + 1)
+        ).scalars().all()
+        
+        items = [e.to_dict() for e in events[:limit]]
+        
+        next_cursor = None
+        if len(events) > limit:
+            last = items[-1]
+            next_cursor = f"{last['created_at']}|{last['id']}"
+        
+        if cursor is None:
+            buffered = [
+                _pending_dict(e) for e in reversed(pending_events(project_id))
+                if not event_types or e["event_type"] in event_types
+            ]
+            items = buffered[:limit] + items
+        
+        return {"items": items, "next_cursor": next_cursor}
+    
+    def last_change(self, project_id: str) -> Optional[datetime]:
+        """
+        Get the time of a project's newest data change.
+        
+        Every service write records an event, so the newest event that
+        is not read-only (an export or AI notice) marks the project's
+        current data. Events still buffered by the activity writer count
+        too. The lookup walks the project_id/created_at index backwards,
+        so its cost does not grow with the project.
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            Creation time of the newest data event, or None if there is none
+        """
+        # Read the buffer first: an event flushed in between is then
+        # already in the table
+        buffered = [
+            e["created_at"] for e in pending_events(project_id)
+            if e["event_type"] not in READ_ONLY_EVENTS
+        ]
+        newest = self.session.execute(
+            select(ActivityEvent.created_at)
+            .where(
+                ActivityEvent.project_id == project_id,
+                ActivityEvent.event_type.not_in(READ_ONLY_EVENTS),
+            )
+            .order_by(ActivityEvent.created_at.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+        
+        return max(filter(None, [newest, *buffered]), default=None)
+
+
+def _pending_dict(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a buffered event like ActivityEvent.to_dict."""
+    return {
+        "id": None,
+        **event,
+        "created_at": event["created_at"].isoformat(),
+    }
\ No newline at end of file
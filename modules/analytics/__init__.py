@@ -0,0 +1,5 @@
+"""Analytics module - topical authority scoring."""
+
+from modules.analytics.scoring import AuthorityScore, TopicalAuthorityScorer
+
+__all__ = ["AuthorityScore", "TopicalAuthorityScorer"]
\ No newline at end of file
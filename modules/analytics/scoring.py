@@ -0,0 +1,348 @@
+"""
+Topical authority scoring.
+
+Scores a project on three components of Koray's framework:
+- Coverage: how far each mapped attribute has progressed through the
+  brief workflow (briefs linked by attribute_id), core attributes
+  weighted double
+- Depth: section count and target word count of each brief
+- Momentum: publication velocity and consistency over recent weeks
+
+Each component is one aggregate query plus NumPy. Results are cached per
+project with a cheap fingerprint of the rows each component reads, so
+only components whose inputs changed are recomputed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from utils.cache import BoundedCache
+from utils.database import (
+    TopicalMap, Attribute, ContentBrief, BriefSection, Publication
+)
+
+
+# Progress credited to an attribute by its most advanced brief
+STATUS_WEIGHTS = {
+    "black": 0.0,
+    "orange": 0.25,
+    "yellow": 0.5,
+    "blue": 0.75,
+    "green": 1.0,
+}
+
+# Relative weight of core (monetization) vs outer attributes
+SECTION_WEIGHTS = {"core": 2.0, "outer": 1.0}
+
+# A brief at or above these targets counts as fully deep
+TARGET_SECTIONS = 8
+TARGET_WORD_COUNT = 1500
+
+# Momentum window and target publishing rate
+MOMENTUM_WEEKS = 12
+TARGET_WEEKLY_PUBLICATIONS = 3
+
+# Weights of each component in the overall score
+COMPONENT_WEIGHTS = {"coverage": 0.5, "depth": 0.25, "momentum": 0.25}
+
+COMPONENTS = ("coverage", "depth", "momentum")
+
+
+@dataclass
+class AuthorityScore:
+    """Topical authority score of a project (all values 0-1)."""
+    project_id: str
+    coverage: float
+    depth: float
+    momentum: float
+    details: Dict[str, Any] = field(default_factory=dict)
+    computed_at: datetime = field(default_factory=datetime.utcnow)
+    
+    @property
+    def overall(self) -> float:
+        """Weighted overall score."""
+        return sum(
+            getattr(self, name) * weight
+            for name, weight in COMPONENT_WEIGHTS.items()
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "project_id": self.project_id,
+            "overall": self.overall,
+            "coverage": self.coverage,
+            "depth": self.depth,
+            "momentum": self.momentum,
+            "details": self.details,
+            "computed_at": self.computed_at.isoformat(),
+        }
+
+
+# Projects whose component results are kept (least recently scored
+# projects are dropped first)
+MAX_CACHED_PROJECTS = 256
+
+# project_id -> {component: (fingerprint, value, details)}
+_score_cache = BoundedCache(
+    max_bytes=16 * 1024 * 1024,
+    max_entries=MAX_CACHED_PROJECTS,
+    default_ttl=None,
+)
+
+
+def invalidate_scores(project_id: Optional[str] = None):
+    """Drop cached scores for a project (or all projects)."""
+    if project_id is None:
+        _score_cache.clear()
+    else:
+        _score_cache.delete(project_id)
+
+
+class TopicalAuthorityScorer:
+    """Compute and cache topical authority scores."""
+    
+    def __init__(self, session: Session):
+        """
+        Initialize scorer.
+        
+        Args:
+            session: SQLAlchemy session
+        """
+        self.session = session
+    
+    def score(self, project_id: str) -> AuthorityScore:
+        """
+        Get a project's score, recomputing only stale components.
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            AuthorityScore
+        """
+        fingerprints = self.fingerprints(project_id)
+        
+        cached = _score_cache.get(project_id) or {}
+        
+        results = {}
+        for name in COMPONENTS:
+            entry = cached.get(name)
+            if entry is None or entry[0] != fingerprints[name]:
+                value, details = getattr(self, f"compute_{name}")(project_id)
+                entry = (fingerprints[name], value, details)
+            results[name] = entry
+        
+        _score_cache.set(project_id, results)
+        
+        details = {}
+        for name in COMPONENTS:
+            details.update(results[name][2])
+        
+        return AuthorityScore(
+            project_id=project_id,
+            coverage=results["coverage"][1],
+            depth=results["depth"][1],
+            momentum=results["momentum"][1],
+            details=details,
+        )
+    
+    def fingerprints(self, project_id: str) -> Dict[str, Tuple]:
+        """
+        Summarize the rows each component reads, in one query.
+        
+        A component is recomputed only when its fingerprint changes.
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            Dictionary of component name to fingerprint tuple
+        """
+        briefs = select(ContentBrief.id).where(
+            ContentBrief.project_id == project_id
+        )
+        
+        attributes = (
+            select(Attribute.id)
+            .join(TopicalMap, TopicalMap.id == Attribute.topical_map_id)
+            .where(TopicalMap.project_id == project_id)
+        )
+        
+        row = self.session.execute(select(
+            attributes.with_only_columns(func.count(Attribute.id))
+            .scalar_subquery(),
+            attributes.with_only_columns(func.max(Attribute.updated_at))
+            .scalar_subquery(),
+            select(func.count(ContentBrief.id))
+            .where(ContentBrief.project_id == project_id)
+            .scalar_subquery(),
+            select(func.max(ContentBrief.updated_at))
+            .where(ContentBrief.project_id == project_id)
+            .scalar_subquery(),
+            select(func.count(BriefSection.id))
+            .where(BriefSection.brief_id.in_(briefs))
+            .scalar_subquery(),
+            select(func.count(Publication.id))
+            .where(Publication.brief_id.in_(briefs))
+            .scalar_subquery(),
+            select(func.max(Publication.published_at))
+            .where(Publication.brief_id.in_(briefs))
+            .scalar_subquery(),
+        )).one()
+        
+        (
+            attribute_count, attributes_updated, brief_count, briefs_updated,
+            sections, pubs, last_pub
+        ) = row
+        
+        return {
+            # Attribute edits (e.g. a new section) change the weights
+            "coverage": (
+                attribute_count, attributes_updated, brief_count,
+                briefs_updated
+            ),
+            "depth": (brief_count, briefs_updated, sections),
+            # Momentum decays with time, so it is also stale every day
+            "momentum": (pubs, last_pub, datetime.utcnow().date()),
+        }
+    
+    def compute_coverage(self, project_id: str) -> Tuple[float, Dict[str, Any]]:
+        """
+        Weighted share of attribute progress through the brief workflow.
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            Tuple of (coverage 0-1, details)
+        """
+        rows = self.session.execute(
+            select(
+                Attribute.id,
+                Attribute.section,
+                ContentBrief.status,
+            )
+            .join(TopicalMap, TopicalMap.id == Attribute.topical_map_id)
+            .outerjoin(ContentBrief, ContentBrief.attribute_id == Attribute.id)
+            .where(TopicalMap.project_id == project_id)
+        ).all()
+        
+        if not rows:
+            return 0.0, {"attributes": 0, "covered_attributes": 0}
+        
+        attr_ids = np.array([row.id for row in rows])
+        progress = np.array([
+            STATUS_WEIGHTS.get(row.status, 0.0) for row in rows
+        ])
+        weights = np.array([
+            SECTION_WEIGHTS.get(row.section, 1.0) for row in rows
+        ])
+        
+        # Best brief per attribute
+        _, index, inverse = np.unique(
+            attr_ids, return_index=True, return_inverse=True
+        )
+        best = np.zeros(len(index))
+        np.maximum.at(best, inverse, progress)
+        attr_weights = weights[index]
+        
+        coverage = float(np.average(best, weights=attr_weights))
+        
+        return coverage, {
+            "attributes": int(len(best)),
+            "covered_attributes": int(np.count_nonzero(best >= 1.0)),
+        }
+    
+    def compute_depth(self, project_id: str) -> Tuple[float, Dict[str, Any]]:
+        """
+        Mean depth of briefs from section counts and target word counts.
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            Tuple of (depth 0-1, details)
+        """
+        rows = self.session.execute(
+            select(
+                func.count(BriefSection.id),
+                func.coalesce(ContentBrief.word_count_target, 0),
+            )
+            .select_from(ContentBrief)
+            .outerjoin(BriefSection, BriefSection.brief_id == ContentBrief.id)
+            .where(ContentBrief.project_id == project_id)
+            .group_by(ContentBrief.id, ContentBrief.word_count_target)
+        ).all()
+        
+        if not rows:
+            return 0.0, {"briefs": 0, "avg_sections": 0.0}
+        
+        data = np.array(rows, dtype=float)
+        sections, words = data[:, 0], data[:, 1]
+        
+        depth = (
+            0.5 * np.minimum(sections / TARGET_SECTIONS, 1.0)
+            + 0.5 * np.minimum(words / TARGET_WORD_COUNT, 1.0)
+        )
+        
+        return float(depth.mean()), {
+            "briefs": int(len(rows)),
+            "avg_sections": float(sections.mean()),
+        }
+    
+    def compute_momentum(self, project_id: str) -> Tuple[float, Dict[str, Any]]:
+        """
+        Publication velocity and consistency over recent weeks.
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            Tuple of (momentum 0-1, details)
+        """
+        now = datetime.utcnow()
+        since = now - timedelta(weeks=MOMENTUM_WEEKS)
+        
+        dates = self.session.execute(
+            select(Publication.published_at)
+            .join(ContentBrief, ContentBrief.id == Publication.brief_id)
+            .where(
+                ContentBrief.project_id == project_id,
+                Publication.published_at >= since,
+                Publication.published_at <= now,
+            )
+        ).scalars().all()
+        
+        if not dates:
+            return 0.0, {"publications_per_week": 0.0, "active_weeks": 0}
+        
+        age_weeks = np.array([
+            (now - published).total_seconds() / (7 * 86400)
+            for published in dates
+        ])
+        weekly = np.bincount(
+            np.minimum(age_weeks.astype(int), MOMENTUM_WEEKS - 1),
+            minlength=MOMENTUM_WEEKS
+        )
+        
+        # Recent velocity (last 4 weeks) and share of active weeks
+        velocity = weekly[:4].mean()
+        consistency = np.count_nonzero(weekly) / MOMENTUM_WEEKS
+        
+        momentum = (
+            0.6 * min(velocity / TARGET_WEEKLY_PUBLICATIONS, 1.0)
+            + 0.4 * consistency
+        )
+        
+        return float(momentum), {
+            "publications_per_week": float(velocity),
+            "active_weeks": int(np.count_nonzero(weekly)),
+        }
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""Content brief module for briefs, sections and revision history."""
+
+from modules.content_brief.service import ContentBriefService
+from modules.content_brief.revisions import BriefRevisionLog
+
+__all__ = ["ContentBriefService", "BriefRevisionLog"]
\ No newline at end of file
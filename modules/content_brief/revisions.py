@@ -0,0 +1,240 @@
+"""Delta-compressed revision history for content briefs.
+
+A brief and its sections are captured as one JSON document. Each saved
+revision stores only the JSON Patch from the previous revision, and every
+SNAPSHOT_INTERVAL revisions a full copy is stored instead. Rebuilding any
+revision therefore reads one snapshot plus at most SNAPSHOT_INTERVAL - 1
+small patches, in a single query.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from utils.database import BriefRevision, BriefSection, ContentBrief
+from utils.json_patch import apply_patch, make_patch
+
+
+# Store a full snapshot every N revisions
+SNAPSHOT_INTERVAL = 20
+
+# Brief fields that are not part of the versioned document
+_UNVERSIONED_FIELDS = {"id", "project_id", "created_at", "updated_at"}
+
+
+def brief_document(
+    brief: ContentBrief,
+    sections: List[BriefSection]
+) -> Dict[str, Any]:
+    """
+    Build the versioned document of a brief.
+    
+    Sections are keyed by ID so adding, removing or editing one section
+    produces a patch that touches only that section.
+    
+    Args:
+        brief: Content brief
+        sections: The brief's sections
+    
+    Returns:
+        Document with "brief" fields and "sections" by ID
+    """
+    fields = {
+        k: v for k, v in brief.to_dict().items()
+        if k not in _UNVERSIONED_FIELDS
+    }
+    return {
+        "brief": fields,
+        "sections": {
+            section.id: {
+                k: v for k, v in section.to_dict().items()
+                if k not in ("id", "brief_id")
+            }
+            for section in sections
+        },
+    }
+
+
+class BriefRevisionLog:
+    """Record and read brief revisions."""
+    
+    def __init__(self, session: Session):
+        """
+        Initialize revision log.
+        
+        Args:
+            session: SQLAlchemy session
+        """
+        self.session = session
+    
+    def record(
+        self,
+        brief_id: str,
+        document: Dict[str, Any]
+    ) -> Optional[int]:
+        """
+        Record a new revision if the document changed.
+        
+        Does not commit; the revision is written with the caller's
+        transaction.
+        
+        Args:
+            brief_id: Content brief UUID
+            document: Current brief document (see brief_document)
+        
+        Returns:
+            New revision number, or None if nothing changed
+        """
+        latest = self.get_latest_revision(brief_id)
+        
+        if latest == 0:
+            revision = BriefRevision(
+                brief_id=brief_id,
+                revision=1,
+                is_snapshot=True,
+                payload=document,
+            )
+        else:
+            previous = self.get_revision(brief_id, latest)
+            ops = make_patch(previous, document)
+            if not ops:
+                return None
+            
+            number = latest + 1
+            is_snapshot = (number - 1) % SNAPSHOT_INTERVAL == 0
+            revision = BriefRevision(
+                brief_id=brief_id,
+                revision=number,
+                is_snapshot=is_snapshot,
+                payload=document if is_snapshot else ops,
+            )
+        
+        self.session.add(revision)
+        self.session.flush()
+        
+        return revision.revision
+    
+    def get_latest_revision(self, brief_id: str) -> int:
+        """
+        Get the latest revision number of a brief.
+        
+        Args:
+            brief_id: Content brief UUID
+        
+        Returns:
+            Revision number (0 if there is no history)
+        """
+        return self.session.execute(
+            select(func.max(BriefRevision.revision))
+            .where(BriefRevision.brief_id == brief_id)
+        ).scalar() or 0
+    
+    def get_revision(
+        self,
+        brief_id: str,
+        revision: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild a brief as of a revision.
+        
+        Args:
+            brief_id: Content brief UUID
+            revision: Revision number
+        
+        Returns:
+            Brief document, or None if the revision does not exist
+        """
+        snapshot = (
+            select(func.max(BriefRevision.revision))
+            .where(
+                BriefRevision.brief_id == brief_id,
+                BriefRevision.is_snapshot.is_(True),
+                BriefRevision.revision <= revision,
+            )
+            .scalar_subquery()
+        )
+        
+        rows = self.session.execute(
+            select(
+                BriefRevision.revision,
+                BriefRevision.is_snapshot,
+                BriefRevision.payload,
+            )
+            .where(
+                BriefRevision.brief_id == brief_id,
+                BriefRevision.revision >= snapshot,
+                BriefRevision.revision <= revision,
+            )
+            .order_by(BriefRevision.revision)
+        ).all()
+        
+        if not rows or rows[-1].revision != revision:
+            return None
+        
+        document = rows[0].payload
+        for row in rows[1:]:
+            document = apply_patch(document, row.payload)
+        
+        return document
+    
+    def diff(
+        self,
+        brief_id: str,
+        from_revision: int,
+        to_revision: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Diff two revisions of a brief.
+        
+        Args:
+            brief_id: Content brief UUID
+            from_revision: Base revision number
+            to_revision: Target revision number
+        
+        Returns:
+            JSON Patch operations, or None if a revision does not exist
+        """
+        old = self.get_revision(brief_id, from_revision)
+        new = self.get_revision(brief_id, to_revision)
+        
+        if old is None or new is None:
+            return None
+        
+        return make_patch(old, new)
+    
+    def list_revisions(self, brief_id: str) -> List[Dict[str, Any]]:
+        """
+        List a brief's revisions (without payloads), newest first.
+        
+        Args:
+            brief_id: Content brief UUID
+        
+        Returns:
+            List of revision metadata dictionaries
+        """
+        rows = self.session.execute(
+            select(
+                BriefRevision.id,
+                BriefRevision.revision,
+                BriefRevision.is_snapshot,
+                BriefRevision.created_at,
+            )
+            .where(BriefRevision.brief_id == brief_id)
+            .order_by(BriefRevision.revision.desc())
+        ).all()
+        
+        return [
+            {
+                "id": row.id,
+                "brief_id": brief_id,
+                "revision": row.revision,
+                "is_snapshot": row.is_snapshot,
+                "created_at": (
+                    row.created_at.isoformat() if row.created_at else None
+                ),
+            }
+            for row in rows
+        ]
\ No newline at end of file
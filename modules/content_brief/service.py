@@ -0,0 +1,381 @@
+"""Content brief service for CRUD operations and revision history."""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from config.database import get_scoped_session, get_session_local
+from modules.content_brief.revisions import BriefRevisionLog, brief_document
+from modules.activity import log as activity
+from utils.database import ContentBrief, BriefSection
+
+
+BRIEF_STATUSES = ["black", "orange", "yellow", "blue", "green"]
+
+# Fields that can be set on a brief through create/update
+BRIEF_FIELDS = {
+    "entity_id",
+    "attribute_id",
+    "title_tag",
+    "url_slug",
+    "meta_description",
+    "h1",
+    "image_alts",
+    "status",
+    "macro_context",
+    "micro_contexts",
+    "target_publish_date",
+    "actual_publish_date",
+    "word_count_target",
+    "authorship_codes",
+}
+
+SECTION_FIELDS = {
+    "heading_level",
+    "heading_text",
+    "order_position",
+    "question_type",
+    "format_instruction",
+    "content_instructions",
+    "required_terms",
+}
+
+
+class ContentBriefService:
+    """Service for managing content briefs."""
+    
+    def __init__(self, db_session: Optional[Session] = None):
+        """
+        Initialize content brief service.
+        
+        Args:
+            db_session: Optional SQLAlchemy session (creates new if not provided)
+        """
+        self._session = db_session
+        self._owns_session = db_session is None
+    
+    @property
+    def session(self) -> Session:
+        """Get database session (the active db_scope session if any)."""
+        if self._session is None:
+            scoped = get_scoped_session()
+            if scoped is not None:
+                self._session = scoped
+                self._owns_session = False
+            else:
+                SessionLocal = get_session_local()
+                self._session = SessionLocal()
+        return self._session
+    
+    @property
+    def revisions(self) -> BriefRevisionLog:
+        """Get revision log bound to this service's session."""
+        return BriefRevisionLog(self.session)
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close session if we own it."""
+        if self._owns_session and self._session:
+            self._session.close()
+    
+    def create_brief(
+        self,
+        project_id: str,
+        sections: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Create a content brief (revision 1).
+        
+        Args:
+            project_id: Project UUID
+            sections: Optional list of section dictionaries
+            **kwargs: Brief fields
+        
+        Returns:
+            Created brief (with sections) as dictionary
+        """
+        self._validate_status(kwargs.get("status"))
+        
+        brief = ContentBrief(
+            project_id=project_id,
+            **{k: v for k, v in kwargs.items() if k in BRIEF_FIELDS}
+        )
+        self.session.add(brief)
+        self.session.flush()
+        
+        for i, section in enumerate(sections or []):
+            self.session.add(self._new_section(brief.id, section, i))
+        
+        self.session.flush()
+        self._record_revision(brief)
+        self.session.commit()
+        activity.record_event(
+            project_id,
+            activity.BRIEF_CREATED,
+            f"Created brief: {_brief_label(brief)}",
+            subject_id=brief.id,
+            data={"status": brief.status},
+        )
+        
+        return self.get_brief(brief.id)
+    
+    def get_brief(self, brief_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a brief with its sections.
+        
+        Args:
+            brief_id: Content brief UUID
+        
+        Returns:
+            Brief as dictionary (with "sections") or None if not found
+        """
+        brief = self.session.get(ContentBrief, brief_id)
+        if not brief:
+            return None
+        
+        data = brief.to_dict()
+        data["sections"] = [s.to_dict() for s in self._get_sections(brief_id)]
+        return data
+    
+    def list_briefs(
+        self,
+        project_id: str,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List a project's briefs (without sections).
+        
+        Args:
+            project_id: Project UUID
+            status: Optional status filter
+        
+        Returns:
+            List of briefs as dictionaries
+        """
+        query = select(ContentBrief).where(
+            ContentBrief.project_id == project_id
+        )
+        if status:
+            query = query.where(ContentBrief.status == status)
+        
+        briefs = self.session.execute(
+            query.order_by(ContentBrief.created_at)
+        ).scalars().all()
+        
+        return [b.to_dict() for b in briefs]
+    
+    def update_brief(
+        self,
+        brief_id: str,
+        sections: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update a brief and record a revision.
+        
+        Args:
+            brief_id: Content brief UUID
+            sections: Optional full list of sections. Sections with an
+                "id" are updated, ones without are added, and existing
+                sections missing from the list are removed.
+            **kwargs: Brief fields to update
+        
+        Returns:
+            Updated brief as dictionary or None if not found
+        """
+        brief = self.session.get(ContentBrief, brief_id)
+        if not brief:
+            return None
+        
+        self._validate_status(kwargs.get("status"))
+        old_status = brief.status
+        
+        for field, value in kwargs.items():
+            if field in BRIEF_FIELDS:
+                setattr(brief, field, value)
+        
+        if sections is not None:
+            self._replace_sections(brief_id, sections)
+            # Section edits count as a change to the brief
+            brief.updated_at = datetime.utcnow()
+        
+        self.session.flush()
+        self._record_revision(brief)
+        self.session.commit()
+        
+        if brief.status != old_status:
+            activity.record_event(
+                brief.project_id,
+                activity.BRIEF_STATUS_CHANGED,
+                f"{_brief_label(brief)}: {old_status} → {brief.status}",
+                subject_id=brief_id,
+                data={"from": old_status, "to": brief.status},
+            )
+        else:
+            activity.record_event(
+                brief.project_id,
+                activity.BRIEF_UPDATED,
+                f"Updated brief: {_brief_label(brief)}",
+                subject_id=brief_id,
+            )
+        
+        return self.get_brief(brief_id)
+    
+    def set_status(self, brief_id: str, status: str) -> Optional[Dict[str, Any]]:
+        """
+        Move a brief to another workflow status.
+        
+        Args:
+            brief_id: Content brief UUID
+            status: New status (black, orange, yellow, blue, green)
+        
+        Returns:
+            Updated brief as dictionary or None if not found
+        """
+        return self.update_brief(brief_id, status=status)
+    
+    def delete_brief(self, brief_id: str) -> bool:
+        """
+        Delete a brief, its sections, links, publication and history.
+        
+        Args:
+            brief_id: Content brief UUID
+        
+        Returns:
+            True if deleted, False if not found
+        """
+        brief = self.session.get(ContentBrief, brief_id)
+        if not brief:
+            return False
+        
+        project_id, label = brief.project_id, _brief_label(brief)
+        try:
+            self.session.delete(brief)
+            self.session.commit()
+        except Exception:
+            # Keep the session usable for the caller
+            self.session.rollback()
+            raise
+        activity.record_event(
+            project_id,
+            activity.BRIEF_DELETED,
+            f"Deleted brief: {label}",
+            subject_id=brief_id,
+        )
+        return True
+    
+    # Revision history
+    
+    def get_brief_as_of(
+        self,
+        brief_id: str,
+        revision: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a brief as it was at a revision.
+        
+        Args:
+            brief_id: Content brief UUID
+            revision: Revision number
+        
+        Returns:
+            Brief document ("brief" fields and "sections" by ID) or None
+        """
+        return self.revisions.get_revision(brief_id, revision)
+    
+    def diff_revisions(
+        self,
+        brief_id: str,
+        from_revision: int,
+        to_revision: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the JSON Patch between two revisions of a brief.
+        
+        Args:
+            brief_id: Content brief UUID
+            from_revision: Base revision number
+            to_revision: Target revision number
+        
+        Returns:
+            JSON Patch operations or None if a revision does not exist
+        """
+        return self.revisions.diff(brief_id, from_revision, to_revision)
+    
+    def list_revisions(self, brief_id: str) -> List[Dict[str, Any]]:
+        """
+        List a brief's revisions, newest first.
+        
+        Args:
+            brief_id: Content brief UUID
+        
+        Returns:
+            List of revision metadata dictionaries
+        """
+        return self.revisions.list_revisions(brief_id)
+    
+    # Internals
+    
+    def _get_sections(self, brief_id: str) -> List[BriefSection]:
+        return self.session.execute(
+            select(BriefSection)
+            .where(BriefSection.brief_id == brief_id)
+            .order_by(BriefSection.order_position)
+        ).scalars().all()
+    
+    def _new_section(
+        self,
+        brief_id: str,
+        data: Dict[str, Any],
+        position: int
+    ) -> BriefSection:
+        fields = {k: v for k, v in data.items() if k in SECTION_FIELDS}
+        fields.setdefault("order_position", position)
+        return BriefSection(brief_id=brief_id, **fields)
+    
+    def _replace_sections(
+        self,
+        brief_id: str,
+        sections: List[Dict[str, Any]]
+    ):
+        existing = {s.id: s for s in self._get_sections(brief_id)}
+        keep = set()
+        
+        for i, data in enumerate(sections):
+            section = existing.get(data.get("id"))
+            if section is None:
+                self.session.add(self._new_section(brief_id, data, i))
+                continue
+            
+            keep.add(section.id)
+            for field, value in data.items():
+                if field in SECTION_FIELDS:
+                    setattr(section, field, value)
+        
+        for section_id, section in existing.items():
+            if section_id not in keep:
+                self.session.delete(section)
+    
+    def _record_revision(self, brief: ContentBrief) -> Optional[int]:
+        return self.revisions.record(
+            brief.id,
+            brief_document(brief, self._get_sections(brief.id))
+        )
+    
+    @staticmethod
+    def _validate_status(status: Optional[str]):
+        if status is not None and status not in BRIEF_STATUSES:
+            raise ValueError(f"Invalid brief status: {status}")
+
+
+def _brief_label(brief: ContentBrief) -> str:
+    """Short name of a brief for activity summaries."""
+    return brief.title_tag or brief.h1 or brief.url_slug or brief.id[:8]
\ No newline at end of file
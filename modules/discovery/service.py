@@ -19,6 +19,7 @@ from dataclasses import dataclass
 
 from config.settings import get_settings
 from config.ai_providers import get_ai_client
+from utils import serialization
 
 
 @dataclass
@@ -183,17 +184,7 @@ class BusinessDiscoveryService:
     def _parse_response(self, response: str) -> FrameworkResult:
         """Parse the AI response into a FrameworkResult."""
         try:
-            # Try to extract JSON from the response
-            # Handle cases where AI wraps JSON in markdown code blocks
-            clean_response = response.strip()
-            if "```json" in clean_response:
-                clean_response = clean_response.split("```json")[1]
-                clean_response = clean_response.split("```")[0]
-            elif "```" in clean_response:
-                clean_response = clean_response.split("```")[1]
-                clean_response = clean_response.split("```")[0]
-            
-            data = json.loads(clean_response.strip())
+            data = parse_json_response(response)
             
             return FrameworkResult(
                 source_context=data.get("source_context", ""),
@@ -217,6 +208,26 @@ class BusinessDiscoveryService:
             )
 
 
+def parse_json_response(response: str) -> Any:
+    """
+    Decode the JSON in an AI response.
+    
+    Handles responses that wrap the JSON in markdown code blocks.
+    
+    Raises:
+        json.JSONDecodeError: If the response holds no valid JSON
+    """
+    clean_response = (response or "").strip()
+    if "```json" in clean_response:
+        clean_response = clean_response.split("```json")[1]
+        clean_response = clean_response.split("```")[0]
+    elif "```" in clean_response:
+        clean_response = clean_response.split("```")[1]
+        clean_response = clean_response.split("```")[0]
+    
+    return serialization.loads(clean_response.strip())
+
+
 def generate_framework_from_business_info(
     business_name: str,
     business_description: str = "",
@@ -0,0 +1,169 @@
+"""Deep project cloning with set-based INSERT ... SELECT.
+
+Row contents never pass through Python. Only the IDs of the rows to copy
+are read, and written to a temporary ID-mapping table, each paired with a
+fresh UUID. Every table is then copied with one ``INSERT ... SELECT`` that
+joins the mapping table to swap primary and foreign keys. The whole clone runs in
+one transaction, so it either appears complete or not at all.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Dict, List, Optional
+
+from sqlalchemy import (
+    Column, MetaData, String, Table, delete, insert, literal, select
+)
+from sqlalchemy.orm import Session
+
+from modules.project.export import ProjectExporter
+from utils.database import (
+    Project, TopicalMap, Entity, Attribute, EntityAttribute,
+    ContentBrief, BriefSection, InternalLink
+)
+
+
+# Tables copied by a deep clone, in dependency order, with the foreign
+# keys that point at other copied rows
+CLONED_TABLES = [
+    (TopicalMap, []),
+    (Entity, ["topical_map_id"]),
+    (Attribute, ["topical_map_id"]),
+    (EntityAttribute, ["entity_id", "attribute_id"]),
+    (ContentBrief, ["entity_id", "attribute_id"]),
+    (BriefSection, ["brief_id"]),
+    (InternalLink, ["source_brief_id", "target_brief_id"]),
+]
+
+# IDs inserted into the mapping table per statement
+ID_BATCH_SIZE = 1000
+
+_id_map = Table(
+    "_clone_id_map",
+    MetaData(),
+    Column("old_id", String(36), primary_key=True),
+    Column("new_id", String(36), nullable=False),
+    prefixes=["TEMPORARY"],
+)
+
+
+def clone_project(
+    session: Session,
+    project_id: str,
+    new_name: str
+) -> Optional[Project]:
+    """
+    Clone a project with all its maps, entities, attributes, briefs,
+    sections and internal links.
+    
+    Publications, query data and brief revision history are not copied.
+    
+    Args:
+        session: SQLAlchemy session
+        project_id: Source project UUID
+        new_name: Name for the new project
+    
+    Returns:
+        New project or None if the source was not found
+    """
+    source = session.execute(
+        select(Project).where(
+            Project.id == project_id,
+            Project.deleted_at.is_(None)
+        )
+    ).scalar_one_or_none()
+    
+    if not source:
+        return None
+    
+    try:
+        new_project = Project(
+            name=new_name,
+            source_context=source.source_context,
+            central_entity=source.central_entity,
+            central_search_intent=source.central_search_intent,
+            functional_words=source.functional_words,
+        )
+        session.add(new_project)
+        session.flush()
+        
+        connection = session.connection()
+        _id_map.create(connection, checkfirst=True)
+        session.execute(delete(_id_map))
+        
+        _map_ids(session, project_id)
+        
+        for model, foreign_keys in CLONED_TABLES:
+            session.execute(
+                _copy_statement(model, foreign_keys, new_project.id)
+            )
+        
+        _id_map.drop(connection)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    
+    session.refresh(new_project)
+    return new_project
+
+
+def _map_ids(session: Session, project_id: str):
+    """Pair the ID of every row to copy with a new UUID."""
+    exporter = ProjectExporter(session)
+    
+    cloned = {model.__tablename__ for model, _ in CLONED_TABLES}
+    
+    for table_name, query in exporter.table_queries(project_id):
+        table = Project.metadata.tables[table_name]
+        if table_name not in cloned or "id" not in table.c:
+            continue
+        
+        ids = session.execute(
+            query.with_only_columns(table.c.id).order_by(None)
+        ).scalars()
+        
+        batch: List[Dict[str, str]] = []
+        for old_id in ids:
+            batch.append({"old_id": old_id, "new_id": str(uuid.uuid4())})
+            if len(batch) >= ID_BATCH_SIZE:
+                session.execute(insert(_id_map), batch)
+                batch = []
+        
+        if batch:
+            session.execute(insert(_id_map), batch)
+
+
+def _copy_statement(model, foreign_keys: List[str], new_project_id: str):
+    """Build the INSERT ... SELECT copying one table's rows."""
+    table = model.__table__
+    columns = []
+    values = []
+    joins = []
+    
+    if "id" in table.c:
+        own = _id_map.alias("own")
+        joins.append((own, own.c.old_id == table.c.id, False))
+    
+    for column in table.c:
+        columns.append(column.name)
+        
+        if column.name == "id":
+            values.append(own.c.new_id)
+        elif column.name == "project_id":
+            values.append(literal(new_project_id, String(36)))
+        elif column.name in foreign_keys:
+            ref = _id_map.alias(f"ref_{column.name}")
+            # Optional references (e.g. a brief without an entity) stay
+            # NULL through an outer join
+            joins.append((ref, ref.c.old_id == column, column.nullable))
+            values.append(ref.c.new_id)
+        else:
+            values.append(column)
+    
+    query = select(*values).select_from(table)
+    for alias, condition, outer in joins:
+        query = query.join(alias, condition, isouter=outer)
+    
+    return insert(table).from_select(columns, query)
\ No newline at end of file
@@ -0,0 +1,845 @@
+"""Set-based project export.
+
+A project is read with one query per table, not one per parent row:
+every query filters on the project through joins, and child rows are
+grouped under their parents in Python. A full export costs the same
+handful of queries whether the project has one topical map or a thousand.
+
+For large projects, ``ProjectExporter.write`` streams the same queries
+(with ``yield_per``) straight into NDJSON or a zip of per-table JSON
+files, so memory use stays flat regardless of project size.
+
+``export_markdown_bundle`` renders every map and brief of a project to
+Markdown in one zip, re-rendering only documents that changed since the
+last bundle.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from sqlalchemy import (
+    JSON, Boolean, Date, DateTime, Float, Integer, Select, select
+)
+from sqlalchemy.orm import Session
+
+from config.database import get_session_local
+from utils import compression
+from utils.artifacts import ExportArtifact, ExportArtifactStore, artifact_key
+from utils.database import (
+    Project, TopicalMap, Entity, Attribute, EntityAttribute,
+    ContentBrief, BriefSection, InternalLink, Publication, ContentBlob,
+    QueryData
+)
+from utils.jobs import JobStatus, run_in_background
+
+
+# Version of the streamed export layout (see ProjectExporter.write)
+EXPORT_FORMAT_VERSION = 1
+
+# Formats written as a directory of per-table files
+COLUMNAR_FORMATS = ["parquet", "arrow"]
+
+EXPORT_FORMATS = ["ndjson", "zip", "xlsx", *COLUMNAR_FORMATS]
+
+# Parquet partition columns per table (default: project_id)
+COLUMNAR_PARTITIONS = {"query_data": ["project_id", "date"]}
+
+# Rows fetched per round trip while streaming
+DEFAULT_BATCH_SIZE = 1000
+
+
+def serialize_row(
+    table: str,
+    row: Dict[str, Any],
+    iso_dates: bool = True
+) -> Dict[str, Any]:
+    """
+    Convert a table row into its export dictionary.
+    
+    Matches the models' ``to_dict`` output: dates become ISO strings and
+    entities carry their computed ``total_score``. Publications carry
+    their decompressed article body as ``content``.
+    
+    Args:
+        table: Table name
+        row: Column values
+        iso_dates: Format dates as ISO strings; pass False when the row
+            goes straight to utils.serialization, which encodes them
+            natively to the same strings
+    
+    Returns:
+        JSON-serializable dictionary
+    """
+    if iso_dates:
+        data = {
+            key: (
+                value.isoformat()
+                if isinstance(value, (datetime, date)) else value
+            )
+            for key, value in row.items()
+        }
+    else:
+        data = dict(row)
+    
+    if table == "publications":
+        codec = data.pop("content_codec", None)
+        blob = data.pop("content_data", None)
+        data["content"] = (
+            compression.decompress(blob, codec).decode("utf-8")
+            if blob is not None else None
+        )
+    
+    if table == "entities":
+        data["total_score"] = (
+            (data.get("prominence_score") or 0)
+            + (data.get("popularity_score") or 0)
+            + (data.get("relevance_score") or 0)
+        )
+    
+    return data
+
+
+def column_types(tables: List[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Get spreadsheet column types of exported tables from the models.
+    
+    Args:
+        tables: Table names
+    
+    Returns:
+        Dictionary of {table: {column: type}} for ExportHandler.write_excel
+    """
+    mapping = [
+        (DateTime, "datetime"),
+        (Date, "date"),
+        (Boolean, "bool"),
+        (Integer, "int"),
+        (Float, "float"),
+        (JSON, "json"),
+    ]
+    
+    types = {}
+    for table_name in tables:
+        table = Project.metadata.tables[table_name]
+        types[table_name] = {
+            column.name: next(
+                (name for type_, name in mapping
+                 if isinstance(column.type, type_)),
+                "str"
+            )
+            for column in table.columns
+        }
+    
+    return types
+
+
+class ProjectExporter:
+    """Export a project with a fixed number of queries."""
+    
+    def __init__(self, session: Session):
+        """
+        Initialize project exporter.
+        
+        Args:
+            session: SQLAlchemy session
+        """
+        self.session = session
+    
+    def table_queries(
+        self,
+        project_id: str,
+        include_maps: bool = True,
+        include_briefs: bool = True
+    ) -> List[Tuple[str, Select]]:
+        """
+        Build one select per exported table, scoped to a project.
+        
+        Args:
+            project_id: Project UUID
+            include_maps: Include topical map tables
+            include_briefs: Include content brief tables
+        
+        Returns:
+            List of (table name, select) in dependency order
+        """
+        maps = TopicalMap.__table__
+        entities = Entity.__table__
+        attributes = Attribute.__table__
+        links = EntityAttribute.__table__
+        briefs = ContentBrief.__table__
+        sections = BriefSection.__table__
+        internal_links = InternalLink.__table__
+        publications = Publication.__table__
+        blobs = ContentBlob.__table__
+        
+        queries = []
+        
+        if include_maps:
+            queries += [
+                ("topical_maps", (
+                    select(maps)
+                    .where(maps.c.project_id == project_id)
+                    .order_by(maps.c.created_at, maps.c.id)
+                )),
+                ("entities", (
+                    select(entities)
+                    .join(maps, maps.c.id == entities.c.topical_map_id)
+                    .where(maps.c.project_id == project_id)
+                    .order_by(entities.c.topical_map_id, entities.c.id)
+                )),
+                ("attributes", (
+                    select(attributes)
+                    .join(maps, maps.c.id == attributes.c.topical_map_id)
+                    .where(maps.c.project_id == project_id)
+                    .order_by(attributes.c.topical_map_id, attributes.c.id)
+                )),
+                ("entity_attributes", (
+                    select(links)
+                    .join(entities, entities.c.id == links.c.entity_id)
+                    .join(maps, maps.c.id == entities.c.topical_map_id)
+                    .where(maps.c.project_id == project_id)
+                    .order_by(links.c.entity_id, links.c.attribute_id)
+                )),
+            ]
+        
+        if include_briefs:
+            queries += [
+                ("content_briefs", (
+                    select(briefs)
+                    .where(briefs.c.project_id == project_id)
+                    .order_by(briefs.c.created_at, briefs.c.id)
+                )),
+                ("brief_sections", (
+                    select(sections)
+                    .join(briefs, briefs.c.id == sections.c.brief_id)
+                    .where(briefs.c.project_id == project_id)
+                    .order_by(sections.c.brief_id, sections.c.order_position)
+                )),
+                ("internal_links", (
+                    select(internal_links)
+                    .join(briefs, briefs.c.id == internal_links.c.source_brief_id)
+                    .where(briefs.c.project_id == project_id)
+                    .order_by(internal_links.c.source_brief_id, internal_links.c.id)
+                )),
+                ("publications", (
+                    select(
+                        publications,
+                        blobs.c.codec.label("content_codec"),
+                        blobs.c.data.label("content_data"),
+                    )
+                    .join(briefs, briefs.c.id == publications.c.brief_id)
+                    .outerjoin(blobs, blobs.c.hash == publications.c.content_hash)
+                    .where(briefs.c.project_id == project_id)
+                    .order_by(publications.c.brief_id, publications.c.id)
+                )),
+            ]
+        
+        return queries
+    
+    def query_data_query(
+        self,
+        project_id: str,
+        since: Optional[date] = None,
+        until: Optional[date] = None
+    ) -> Select:
+        """
+        Build the select of a project's query data with publication URLs.
+        
+        Args:
+            project_id: Project UUID
+            since: Optional first date (inclusive)
+            until: Optional last date (inclusive)
+        
+        Returns:
+            Select ordered by date
+        """
+        query_data = QueryData.__table__
+        
+        query = (
+            select(query_data, Publication.url.label("url"))
+            .join(Publication, Publication.id == query_data.c.publication_id)
+            .join(ContentBrief, ContentBrief.id == Publication.brief_id)
+            .where(ContentBrief.project_id == project_id)
+        )
+        if since:
+            query = query.where(query_data.c.date >= since)
+        if until:
+            query = query.where(query_data.c.date <= until)
+        
+        return query.order_by(query_data.c.date, query_data.c.id)
+    
+    def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the (not deleted) project row.
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            Project as dictionary or None if not found
+        """
+        project = self.session.execute(
+            select(Project).where(
+                Project.id == project_id,
+                Project.deleted_at.is_(None)
+            )
+        ).scalar_one_or_none()
+        
+        return project.to_dict() if project else None
+    
+    def data_version(self, project_id: str) -> str:
+        """
+        Get a version stamp of everything a project export contains.
+        
+        The stamp is the time of the project's newest data-changing
+        activity event (see ActivityService.last_change), which every
+        service write records. It is one index lookup however large the
+        project is, and unlike the in-memory cache versions it survives
+        restarts and sees writes made by other processes.
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            SHA-256 hex digest
+        """
+        from modules.activity.service import ActivityService
+        
+        changed_at = ActivityService(self.session).last_change(project_id)
+        payload = json.dumps(
+            [EXPORT_FORMAT_VERSION, project_id, changed_at], default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def fetch_tables(
+        self,
+        project_id: str,
+        include_maps: bool = True,
+        include_briefs: bool = True
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Read every exported table of a project as flat row lists.
+        
+        Args:
+            project_id: Project UUID
+            include_maps: Include topical map tables
+            include_briefs: Include content brief tables
+        
+        Returns:
+            Dictionary of table name to serialized rows
+        """
+        tables = {}
+        for table, query in self.table_queries(
+            project_id, include_maps, include_briefs
+        ):
+            result = self.session.execute(query).mappings()
+            tables[table] = [serialize_row(table, row) for row in result]
+        
+        return tables
+    
+    def export(
+        self,
+        project_id: str,
+        include_briefs: bool = True,
+        include_maps: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Export a project as a nested dictionary.
+        
+        Topical maps carry their entities, attributes and entity-attribute
+        links; content briefs carry their sections, outgoing internal
+        links and publications.
+        
+        Args:
+            project_id: Project UUID
+            include_briefs: Include content briefs
+            include_maps: Include topical maps
+        
+        Returns:
+            Complete project data as dictionary (empty if not found)
+        """
+        project = self.get_project(project_id)
+        if not project:
+            return {}
+        
+        tables = self.fetch_tables(project_id, include_maps, include_briefs)
+        
+        export_data = {
+            "project": project,
+            "exported_at": datetime.utcnow().isoformat(),
+        }
+        
+        if include_maps:
+            entities = _group_by(tables["entities"], "topical_map_id")
+            attributes = _group_by(tables["attributes"], "topical_map_id")
+            
+            map_of_entity = {
+                e["id"]: e["topical_map_id"] for e in tables["entities"]
+            }
+            links = defaultdict(list)
+            for link in tables["entity_attributes"]:
+                links[map_of_entity[link["entity_id"]]].append(link)
+            
+            maps_data = []
+            for map_dict in tables["topical_maps"]:
+                map_dict["entities"] = entities.get(map_dict["id"], [])
+                map_dict["attributes"] = attributes.get(map_dict["id"], [])
+                map_dict["entity_attributes"] = links.get(map_dict["id"], [])
+                maps_data.append(map_dict)
+            
+            export_data["topical_maps"] = maps_data
+        
+        if include_briefs:
+            sections = _group_by(tables["brief_sections"], "brief_id")
+            internal_links = _group_by(
+                tables["internal_links"], "source_brief_id"
+            )
+            publications = _group_by(tables["publications"], "brief_id")
+            
+            briefs_data = []
+            for brief in tables["content_briefs"]:
+                brief["sections"] = sections.get(brief["id"], [])
+                brief["internal_links"] = internal_links.get(brief["id"], [])
+                brief["publications"] = publications.get(brief["id"], [])
+                briefs_data.append(brief)
+            
+            export_data["content_briefs"] = briefs_data
+        
+        return export_data
+    
+    def markdown_documents(
+        self,
+        project_id: str
+    ) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Collect every topical map and content brief of a project as
+        Markdown render inputs.
+        
+        Maps carry their project context and entities with linked
+        attributes; briefs carry their sections and outgoing internal
+        links (targets named by URL slug).
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            List of (path inside the bundle, template, data) in map then
+            brief order (empty if the project was not found)
+        """
+        project = self.get_project(project_id)
+        if not project:
+            return []
+        
+        tables = {}
+        for table, query in self.table_queries(project_id):
+            if table == "publications":
+                continue
+            result = self.session.execute(query).mappings()
+            tables[table] = [serialize_row(table, row) for row in result]
+        
+        documents = []
+        
+        attributes = {a["id"]: a for a in tables["attributes"]}
+        linked = defaultdict(list)
+        for link in tables["entity_attributes"]:
+            if link["attribute_id"] in attributes:
+                linked[link["entity_id"]].append(
+                    attributes[link["attribute_id"]]
+                )
+        entities = _group_by(tables["entities"], "topical_map_id")
+        
+        for map_dict in tables["topical_maps"]:
+            map_dict["project"] = project
+            map_dict["entities"] = [
+                {**entity, "attributes": linked.get(entity["id"], [])}
+                for entity in entities.get(map_dict["id"], [])
+            ]
+            documents.append((
+                _bundle_path("maps", map_dict["name"], map_dict["id"]),
+                "topical_map",
+                map_dict,
+            ))
+        
+        sections = _group_by(tables["brief_sections"], "brief_id")
+        internal_links = _group_by(tables["internal_links"], "source_brief_id")
+        slugs = {
+            b["id"]: b.get("url_slug") or b.get("title_tag") or b["id"]
+            for b in tables["content_briefs"]
+        }
+        
+        for brief in tables["content_briefs"]:
+            brief["sections"] = sections.get(brief["id"], [])
+            brief["internal_links"] = [
+                {**link, "target": slugs.get(link["target_brief_id"], "")}
+                for link in internal_links.get(brief["id"], [])
+            ]
+            documents.append((
+                _bundle_path("briefs", slugs[brief["id"]], brief["id"]),
+                "content_brief",
+                brief,
+            ))
+        
+        return documents
+    
+    def iter_rows(
+        self,
+        project_id: str,
+        include_maps: bool = True,
+        include_briefs: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        iso_dates: bool = True
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream a project's rows table by table.
+        
+        The project row comes first (table "projects"), then every table
+        in dependency order, then the publications' query data. Rows are
+        fetched ``batch_size`` at a time, so only one batch is held in
+        memory.
+        
+        Args:
+            project_id: Project UUID
+            include_maps: Include topical map tables
+            include_briefs: Include content brief tables and query data
+            batch_size: Rows fetched per round trip
+            iso_dates: Format dates as ISO strings (see serialize_row)
+        
+        Yields:
+            Tuples of (table name, serialized row)
+        """
+        project = self.get_project(project_id)
+        if not project:
+            return
+        
+        yield "projects", project
+        
+        queries = self.table_queries(project_id, include_maps, include_briefs)
+        if include_briefs:
+            queries.append(("query_data", self.query_data_query(project_id)))
+        
+        for table, query in queries:
+            result = self.session.execute(
+                query.execution_options(yield_per=batch_size)
+            ).mappings()
+            for row in result:
+                yield table, serialize_row(table, row, iso_dates)
+    
+    def iter_query_data(
+        self,
+        project_id: str,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream a project's Search Console query data, oldest first.
+        
+        Args:
+            project_id: Project UUID
+            since: Optional first date (inclusive)
+            until: Optional last date (inclusive)
+            batch_size: Rows fetched per round trip
+        
+        Yields:
+            Tuples of ("query_data", serialized row) with the publication URL
+        """
+        query = self.query_data_query(project_id, since, until)
+        
+        result = self.session.execute(
+            query.execution_options(yield_per=batch_size)
+        ).mappings()
+        
+        for row in result:
+            yield "query_data", serialize_row("query_data", row)
+    
+    def write_columnar(
+        self,
+        project_id: str,
+        target: Union[str, Path],
+        format: str = "parquet",
+        include_maps: bool = True,
+        include_briefs: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        handler=None,
+        header: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, int]:
+        """
+        Write a project as Parquet datasets or Arrow IPC files.
+        
+        Every table (plus query data when briefs are included) is read
+        with yield_per and converted to record batches chunk by chunk.
+        Parquet datasets are partitioned by project, and query data also
+        by date. Publication bodies are not included.
+        
+        Args:
+            project_id: Project UUID
+            target: Directory (relative to the export path) or path
+            format: Columnar format (parquet, arrow)
+            include_maps: Include topical map tables
+            include_briefs: Include content brief tables and query data
+            batch_size: Rows fetched and written per batch
+            handler: Optional ExportHandler (default export path otherwise)
+            header: Optional manifest metadata
+        
+        Returns:
+            Number of rows written per table
+        """
+        from utils import columnar
+        from utils.export import ExportHandler
+        
+        handler = handler or ExportHandler()
+        
+        queries = [(
+            "projects",
+            select(Project.__table__).where(Project.id == project_id)
+        )]
+        queries += self.table_queries(project_id, include_maps, include_briefs)
+        if include_briefs:
+            queries.append(("query_data", self.query_data_query(project_id)))
+        
+        def tables():
+            for table_name, query in queries:
+                table = Project.metadata.tables[table_name]
+                schema = columnar.arrow_schema(
+                    table, partition_by=COLUMNAR_PARTITIONS.get(
+                        table_name, ["project_id"]
+                    )
+                )
+                # Only the table's own columns (no joined blobs or URLs)
+                rows = self.session.execute(
+                    query.with_only_columns(*table.c)
+                    .execution_options(yield_per=batch_size)
+                ).mappings()
+                
+                yield table_name, schema, columnar.record_batches(
+                    rows, schema, batch_size,
+                    constants={"project_id": project_id}
+                )
+        
+        return handler.write_columnar(
+            tables(), target, format=format, manifest=header
+        )
+    
+    def write(
+        self,
+        project_id: str,
+        target: Union[str, Path, BinaryIO],
+        format: str = "ndjson",
+        include_maps: bool = True,
+        include_briefs: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        handler=None
+    ) -> Dict[str, int]:
+        """
+        Stream a project export to a file or stream.
+        
+        Formats:
+        - ndjson: a header line, then one ``{"table", "row"}`` per line
+        - zip: ``<table>.json`` per table plus ``manifest.json``
+        - xlsx: one typed worksheet per table plus query data (streamed,
+          write-only; sheets beyond Excel's row limit are split)
+        - parquet/arrow: a directory of per-table columnar files (see
+          write_columnar)
+        
+        Args:
+            project_id: Project UUID
+            target: Filename (relative to the export path), path or
+                writable binary stream
+            format: Export format (ndjson, zip, xlsx, parquet, arrow)
+            include_maps: Include topical map tables
+            include_briefs: Include content brief tables and query data
+            batch_size: Rows fetched per round trip
+            handler: Optional ExportHandler (default export path otherwise)
+        
+        Returns:
+            Number of rows written per table
+        
+        Raises:
+            ValueError: If the project does not exist or the format is
+                not supported
+        """
+        from utils.export import ExportHandler
+        
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {format}")
+        
+        if self.get_project(project_id) is None:
+            raise ValueError(f"Project not found: {project_id}")
+        
+        handler = handler or ExportHandler()
+        header = {
+            "format_version": EXPORT_FORMAT_VERSION,
+            "project_id": project_id,
+            "exported_at": datetime.utcnow().isoformat(),
+        }
+        
+        if format in COLUMNAR_FORMATS:
+            return self.write_columnar(
+                project_id, target, format, include_maps, include_briefs,
+                batch_size, handler, header
+            )
+        
+        # Writers encode dates natively (utils.serialization, openpyxl)
+        rows = self.iter_rows(
+            project_id, include_maps, include_briefs, batch_size,
+            iso_dates=False
+        )
+        
+        if format == "zip":
+            return handler.write_json_zip(rows, target, manifest=header)
+        
+        counts = Counter()
+        
+        if format == "xlsx":
+            tables = ["projects"] + [
+                table for table, _ in self.table_queries(
+                    project_id, include_maps, include_briefs
+                )
+            ]
+            if include_briefs:
+                # Usually the largest sheet; split at Excel's row limit
+                tables.append("query_data")
+            
+            def counted():
+                for table, row in rows:
+                    counts[table] += 1
+                    yield table, row
+            
+            workbook = handler.write_excel(
+                counted(), target, column_types=column_types(tables)
+            )
+            if workbook is not target:
+                workbook.close()
+            return dict(counts)
+        
+        def records():
+            yield {"header": header}
+            for table, row in rows:
+                counts[table] += 1
+                yield {"table": table, "row": row}
+        
+        handler.write_ndjson(records(), target)
+        return dict(counts)
+
+
+def export_markdown_bundle(
+    project_id: str,
+    job: Optional[JobStatus] = None
+) -> Optional[ExportArtifact]:
+    """
+    Render all maps and briefs of a project into a zip of Markdown files.
+    
+    Bundles are kept in the export artifact cache, so an unchanged
+    project is not rendered again.
+    
+    Args:
+        project_id: Project UUID
+        job: Optional job status to report progress to
+    
+    Returns:
+        ExportArtifact of the bundle or None if the project was not found
+    """
+    from config.settings import get_settings
+    from utils.export import ExportHandler
+    
+    session = get_session_local()()
+    try:
+        exporter = ProjectExporter(session)
+        project = exporter.get_project(project_id)
+        if not project:
+            return None
+        
+        key = artifact_key(
+            project_id=project_id,
+            format="markdown",
+            data_version=exporter.data_version(project_id),
+        )
+        store = ExportArtifactStore.from_settings()
+        artifact = store.get(key)
+        if artifact is not None:
+            if job:
+                job.message = "Unchanged since the last bundle"
+            return artifact
+        
+        if job:
+            job.message = "Loading briefs and maps"
+        documents = exporter.markdown_documents(project_id)
+    finally:
+        session.close()
+    
+    def progress(done: int, total: int):
+        if job:
+            job.progress = done / total
+            job.message = f"Rendered {done}/{total} documents"
+    
+    handler = ExportHandler(get_settings().get_export_path())
+    counts = {}
+    
+    def write(path: Path):
+        counts.update(handler.write_markdown_bundle(
+            documents, path, progress=progress
+        ))
+    
+    artifact = store.get_or_create(
+        key,
+        handler.get_download_filename(f"{project['name']}_markdown", "zip"),
+        write
+    )
+    
+    if counts:
+        from modules.activity import log as activity
+        
+        activity.record_event(
+            project_id,
+            activity.EXPORT_CREATED,
+            "Exported Markdown bundle",
+            data={"format": "markdown", **counts},
+            invalidate=False,
+        )
+    
+    if job and counts:
+        job.message = (
+            f"{counts['documents']} documents "
+            f"({counts['rendered']} rendered, {counts['cached']} unchanged)"
+        )
+    
+    return artifact
+
+
+def start_markdown_bundle(project_id: str) -> JobStatus:
+    """
+    Start rendering a project's Markdown bundle on a background thread.
+    
+    Args:
+        project_id: Project UUID
+    
+    Returns:
+        Status of the bundle job (its result is the bundle artifact)
+    """
+    return run_in_background(
+        f"markdown-bundle-{project_id}", export_markdown_bundle, project_id
+    )
+
+
+def _bundle_path(folder: str, name: str, row_id: str) -> str:
+    """Build a unique, filesystem-safe path inside a bundle."""
+    clean = "".join(
+        c if c.isalnum() or c in "-_" else "-" for c in (name or "")
+    ).strip("-")[:80]
+    return f"{folder}/{clean or 'untitled'}-{row_id[:8]}.md"
+
+
+def _group_by(
+    rows: List[Dict[str, Any]],
+    key: str
+) -> Dict[str, List[Dict[str, Any]]]:
+    groups = defaultdict(list)
+    for row in rows:
+        groups[row[key]].append(row)
+    return groups
\ No newline at end of file
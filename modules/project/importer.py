@@ -0,0 +1,408 @@
+"""Streaming project import.
+
+Reads any project export - the streamed NDJSON, zip and columnar
+(Parquet/Arrow) formats written by ``ProjectExporter.write`` or the nested
+dictionary returned by ``ProjectService.export_project`` - and
+bulk-inserts it as a new project.
+
+NDJSON and zip exports are parsed one record at a time, and rows are
+inserted with batched Core ``INSERT``s committed per batch, so files much
+larger than memory can be imported. Only the ID mapping (old ID to new
+ID) of rows that other rows refer to is kept for the whole import.
+
+While rows are loading the new project is flagged as deleted, so it stays
+hidden until the import completes; if the import fails or the process
+dies, the partial project is purged like any other deleted project.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import uuid
+import zipfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from sqlalchemy import Date, DateTime, insert
+from sqlalchemy.orm import Session
+
+from modules.project.export import EXPORT_FORMAT_VERSION
+from utils import serialization
+from utils.content_store import ContentStore
+from utils.database import (
+    Project, TopicalMap, Entity, Attribute, EntityAttribute,
+    ContentBrief, BriefSection, InternalLink, Publication, QueryData
+)
+
+
+DEFAULT_BATCH_SIZE = 500
+
+# Tables in dependency order (parents before children)
+TABLE_MODELS = {
+    "topical_maps": TopicalMap,
+    "entities": Entity,
+    "attributes": Attribute,
+    "entity_attributes": EntityAttribute,
+    "content_briefs": ContentBrief,
+    "brief_sections": BriefSection,
+    "internal_links": InternalLink,
+    "publications": Publication,
+    "query_data": QueryData,
+}
+
+# Foreign keys to remap per table: column -> required
+FOREIGN_KEYS = {
+    "topical_maps": {"project_id": True},
+    "entities": {"topical_map_id": True},
+    "attributes": {"topical_map_id": True},
+    "entity_attributes": {"entity_id": True, "attribute_id": True},
+    "content_briefs": {
+        "project_id": True,
+        "entity_id": False,
+        "attribute_id": False,
+    },
+    "brief_sections": {"brief_id": True},
+    "internal_links": {"source_brief_id": True, "target_brief_id": True},
+    "publications": {"brief_id": True},
+    "query_data": {"publication_id": True},
+}
+
+# Tables whose rows are referenced by other rows (keep their ID mapping)
+REFERENCED_TABLES = {
+    "projects",
+    "topical_maps",
+    "entities",
+    "attributes",
+    "content_briefs",
+    "publications",
+}
+
+
+def iter_export_rows(
+    source: Union[str, Path, BinaryIO, Dict[str, Any]]
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Read (table, row) records from any export format.
+    
+    The format is detected from the content: a columnar export directory,
+    zip, NDJSON (first line is a header record) or a single JSON document
+    from export_project.
+    
+    Args:
+        source: Path (file or columnar export directory), seekable binary
+            stream, or an export_project dictionary
+    
+    Yields:
+        Tuples of (table name, row dictionary); the project comes first
+        as table "projects"
+    
+    Raises:
+        ValueError: If the export was written by a newer format version
+    """
+    if isinstance(source, dict):
+        yield from _iter_nested(source)
+        return
+    
+    if isinstance(source, (str, Path)):
+        if Path(source).is_dir():
+            yield from _iter_columnar(Path(source))
+            return
+        with open(source, "rb") as f:
+            yield from iter_export_rows(f)
+        return
+    
+    head = source.read(4)
+    source.seek(0)
+    
+    if head.startswith(b"PK"):
+        yield from _iter_zip(source)
+        return
+    
+    text = io.TextIOWrapper(source, encoding="utf-8")
+    try:
+        first = text.readline()
+        
+        try:
+            record = serialization.loads(first)
+        except ValueError:
+            record = None
+        
+        if isinstance(record, dict) and "header" in record:
+            _check_version(record["header"])
+            yield from _iter_ndjson(text)
+            return
+        
+        # Nested export_project document (has to be parsed whole)
+        text.seek(0)
+        yield from _iter_nested(json.load(text))
+    finally:
+        # Closing the wrapper would close the caller's stream
+        text.detach()
+
+
+def _check_version(header: Dict[str, Any]):
+    version = header.get("format_version", 1)
+    if version > EXPORT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported export format version: {version}")
+
+
+def _iter_ndjson(lines: Iterator[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    for line in lines:
+        line = line.strip()
+        if line:
+            record = serialization.loads(line)
+            yield record["table"], record["row"]
+
+
+def _iter_zip(source: BinaryIO) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    with zipfile.ZipFile(source) as zf:
+        names = set(zf.namelist())
+        if "manifest.json" in names:
+            _check_version(json.loads(zf.read("manifest.json")))
+        
+        for table in ["projects", *TABLE_MODELS]:
+            if f"{table}.json" not in names:
+                continue
+            
+            with zf.open(f"{table}.json") as raw:
+                # One record per line between "[" and "]" (see
+                # ExportHandler.write_json_zip)
+                for line in io.TextIOWrapper(raw, encoding="utf-8"):
+                    line = line.strip().rstrip(",")
+                    if line and line not in ("[", "]"):
+                        yield table, serialization.loads(line)
+
+
+def _iter_columnar(directory: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    from utils import columnar
+    
+    manifest = directory / "manifest.json"
+    if manifest.exists():
+        _check_version(json.loads(manifest.read_text(encoding="utf-8")))
+    
+    for table in ["projects", *TABLE_MODELS]:
+        for path in (directory / table, directory / f"{table}.arrow"):
+            if path.exists():
+                rows = columnar.iter_rows(columnar.read_batches(path))
+                yield from ((table, row) for row in rows)
+                break
+
+
+def _iter_nested(data: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    if not data.get("project"):
+        raise ValueError("Not a project export")
+    
+    yield "projects", data["project"]
+    
+    maps = data.get("topical_maps", [])
+    yield from (("topical_maps", m) for m in maps)
+    for table in ("entities", "attributes", "entity_attributes"):
+        for map_data in maps:
+            yield from ((table, row) for row in map_data.get(table, []))
+    
+    briefs = data.get("content_briefs", [])
+    yield from (("content_briefs", b) for b in briefs)
+    for table, key in (
+        ("brief_sections", "sections"),
+        ("internal_links", "internal_links"),
+        ("publications", "publications"),
+    ):
+        for brief in briefs:
+            yield from ((table, row) for row in brief.get(key, []))
+
+
+class ProjectImporter:
+    """Import a project export as a new project."""
+    
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        remap_ids: bool = True
+    ):
+        """
+        Initialize project importer.
+        
+        Args:
+            session: SQLAlchemy session
+            batch_size: Rows inserted per transaction
+            remap_ids: Give every imported row a new UUID (so an export
+                can be imported next to its source); otherwise keep IDs
+        """
+        self.session = session
+        self.batch_size = batch_size
+        self.remap_ids = remap_ids
+        
+        self.id_map: Dict[str, str] = {}
+        self.counts: Dict[str, int] = {}
+        self.skipped: Dict[str, int] = {}
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffer_table: Optional[str] = None
+    
+    def run(
+        self,
+        source: Union[str, Path, BinaryIO, Dict[str, Any]],
+        name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Import an export file or stream.
+        
+        Args:
+            source: Path (file or columnar export directory), seekable
+                binary stream, or an export_project dictionary
+            name: Optional name for the new project
+        
+        Returns:
+            Dictionary with the new "project" and per-table "counts"
+            and "skipped" rows
+        
+        Raises:
+            ValueError: If the source is not a project export
+        """
+        rows = iter_export_rows(source)
+        
+        table, project_row = next(rows, (None, None))
+        if table != "projects":
+            raise ValueError("Not a project export")
+        
+        project_id = self._create_project(project_row, name)
+        
+        try:
+            for table, row in rows:
+                if table not in TABLE_MODELS:
+                    continue
+                if table != self._buffer_table:
+                    self._flush()
+                    self._buffer_table = table
+                
+                row = self._prepare(table, row)
+                if row is None:
+                    self.skipped[table] = self.skipped.get(table, 0) + 1
+                    continue
+                
+                self._buffer.append(row)
+                if len(self._buffer) >= self.batch_size:
+                    self._flush()
+            
+            self._flush()
+            
+            project = self.session.get(Project, project_id)
+            project.deleted_at = None
+            self.session.commit()
+        except Exception:
+            from modules.project.purge import purge_project
+            
+            self.session.rollback()
+            purge_project(project_id, session=self.session)
+            raise
+        
+        return {
+            "project": project.to_dict(),
+            "counts": self.counts,
+            "skipped": self.skipped,
+        }
+    
+    def _create_project(
+        self,
+        row: Dict[str, Any],
+        name: Optional[str]
+    ) -> str:
+        """Insert the (hidden) project row and return its ID."""
+        project_id = self._new_id(row["id"])
+        
+        project = Project(
+            id=project_id,
+            name=name or row.get("name") or "Imported project",
+            source_context=row.get("source_context"),
+            central_entity=row.get("central_entity"),
+            central_search_intent=row.get("central_search_intent"),
+            functional_words=row.get("functional_words") or [],
+            deleted_at=datetime.utcnow(),
+        )
+        self.session.add(project)
+        self.session.commit()
+        
+        return project_id
+    
+    def _new_id(self, old_id: str, remember: bool = True) -> str:
+        """
+        Get the ID to insert a row with.
+        
+        Args:
+            old_id: ID in the export
+            remember: Keep the mapping (only rows other rows refer to,
+                so memory does not grow with leaf tables)
+        """
+        new_id = str(uuid.uuid4()) if self.remap_ids else old_id
+        if remember:
+            self.id_map[old_id] = new_id
+        return new_id
+    
+    def _prepare(
+        self,
+        table: str,
+        row: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Turn an exported row into insert values.
+        
+        Returns None if a required parent was not imported.
+        """
+        columns = TABLE_MODELS[table].__table__.columns
+        values = {}
+        
+        for column in columns:
+            if column.name not in row:
+                continue
+            value = row[column.name]
+            if isinstance(value, str):
+                if isinstance(column.type, DateTime):
+                    value = datetime.fromisoformat(value)
+                elif isinstance(column.type, Date):
+                    value = date.fromisoformat(value[:10])
+            values[column.name] = value
+        
+        for column, required in FOREIGN_KEYS[table].items():
+            old = values.get(column)
+            if old is None:
+                if required:
+                    return None
+                continue
+            if old not in self.id_map:
+                if required:
+                    return None
+                values[column] = None
+            else:
+                values[column] = self.id_map[old]
+        
+        if "id" in columns and values.get("id"):
+            values["id"] = self._new_id(
+                values["id"], remember=table in REFERENCED_TABLES
+            )
+        
+        if table == "publications":
+            content = row.get("content")
+            if content is not None:
+                values["content_hash"], values["content_size"] = (
+                    ContentStore(self.session).put(content)
+                )
+            else:
+                values["content_hash"] = None
+                values["content_size"] = None
+        
+        return values
+    
+    def _flush(self):
+        """Insert buffered rows of the current table and commit."""
+        if not self._buffer:
+            return
+        
+        table = self._buffer_table
+        model = TABLE_MODELS[table]
+        self.session.execute(insert(model), self._buffer)
+        self.session.commit()
+        
+        self.counts[table] = self.counts.get(table, 0) + len(self._buffer)
+        self._buffer = []
\ No newline at end of file
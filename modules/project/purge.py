@@ -0,0 +1,233 @@
+"""Background purge of soft-deleted projects.
+
+Deleting a project through the ORM cascade loads every child row into
+memory and removes everything in one long write transaction. Instead,
+``ProjectService.delete_project`` only flags the project, and this module
+deletes its rows leaf-first in bounded chunks of Core ``DELETE ... WHERE
+id IN (...)`` statements, committing between chunks so other writers get
+the database lock in between.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from config.database import get_session_local, shares_connection
+from utils.database import (
+    ActivityEvent,
+    DashboardSnapshot,
+    Project,
+    TopicalMap,
+    Entity,
+    Attribute,
+    EntityAttribute,
+    ContentBrief,
+    BriefSection,
+    BriefRevision,
+    InternalLink,
+    Publication,
+    QueryData,
+)
+from utils.content_store import ContentStore
+from utils.jobs import JobStatus, run_in_background, run_inline
+
+
+DEFAULT_CHUNK_SIZE = 500
+
+_resumed = False
+
+
+def _purge_steps(project_id: str) -> List[Tuple[str, object, object]]:
+    """
+    Build the leaf-first list of (label, key column, row filter) steps.
+    
+    Each step deletes rows whose key column is in the next chunk of keys
+    matching the filter.
+    """
+    brief_ids = select(ContentBrief.id).where(
+        ContentBrief.project_id == project_id
+    )
+    map_ids = select(TopicalMap.id).where(
+        TopicalMap.project_id == project_id
+    )
+    publication_ids = select(Publication.id).where(
+        Publication.brief_id.in_(brief_ids)
+    )
+    entity_ids = select(Entity.id).where(Entity.topical_map_id.in_(map_ids))
+    
+    return [
+        (
+            "dashboard snapshot",
+            DashboardSnapshot.project_id,
+            DashboardSnapshot.project_id == project_id,
+        ),
+        (
+            "activity events",
+            ActivityEvent.id,
+            ActivityEvent.project_id == project_id,
+        ),
+        (
+            "query data",
+            QueryData.id,
+            QueryData.publication_id.in_(publication_ids),
+        ),
+        (
+            "publications",
+            Publication.id,
+            Publication.brief_id.in_(brief_ids),
+        ),
+        (
+            "internal links",
+            InternalLink.id,
+            InternalLink.source_brief_id.in_(brief_ids)
+            | InternalLink.target_brief_id.in_(brief_ids),
+        ),
+        (
+            "brief sections",
+            BriefSection.id,
+            BriefSection.brief_id.in_(brief_ids),
+        ),
+        (
+            "brief revisions",
+            BriefRevision.id,
+            BriefRevision.brief_id.in_(brief_ids),
+        ),
+        (
+            "content briefs",
+            ContentBrief.id,
+            ContentBrief.project_id == project_id,
+        ),
+        (
+            "entity attributes",
+            EntityAttribute.entity_id,
+            EntityAttribute.entity_id.in_(entity_ids),
+        ),
+        (
+            "entities",
+            Entity.id,
+            Entity.topical_map_id.in_(map_ids),
+        ),
+        (
+            "attributes",
+            Attribute.id,
+            Attribute.topical_map_id.in_(map_ids),
+        ),
+        (
+            "topical maps",
+            TopicalMap.id,
+            TopicalMap.project_id == project_id,
+        ),
+    ]
+
+
+def purge_project(
+    project_id: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    session: Optional[Session] = None,
+    job: Optional[JobStatus] = None
+) -> int:
+    """
+    Delete a soft-deleted project and all its rows in bounded chunks.
+    
+    Safe to re-run after an interruption; it continues where it stopped.
+    
+    Args:
+        project_id: Project UUID
+        chunk_size: Maximum rows deleted per transaction
+        session: Optional session (a new one is created if omitted)
+        job: Optional job status to report progress to
+    
+    Returns:
+        Number of deleted rows
+    """
+    owns_session = session is None
+    if owns_session:
+        session = get_session_local()()
+    
+    deleted = 0
+    try:
+        steps = _purge_steps(project_id)
+        
+        for i, (label, key_column, condition) in enumerate(steps):
+            if job:
+                job.progress = i / (len(steps) + 1)
+                job.message = f"Deleting {label}"
+            
+            while True:
+                keys = session.execute(
+                    select(key_column).where(condition)
+                    .distinct().limit(chunk_size)
+                ).scalars().all()
+                
+                if not keys:
+                    break
+                
+                result = session.execute(
+                    delete(key_column.table).where(key_column.in_(keys))
+                )
+                session.commit()
+                deleted += result.rowcount or 0
+        
+        session.execute(
+            delete(Project.__table__).where(Project.id == project_id)
+        )
+        session.commit()
+        deleted += 1
+        
+        # Article bodies may be shared with other projects' publications
+        ContentStore(session).delete_unreferenced(chunk_size)
+    finally:
+        if owns_session:
+            session.close()
+    
+    if job:
+        job.message = f"Deleted {deleted} rows"
+    
+    return deleted
+
+
+def start_purge(project_id: str) -> JobStatus:
+    """
+    Start purging a soft-deleted project on a background thread.
+    
+    With an engine that shares one connection between threads
+    (StaticPool), a purge thread would interleave its transactions with
+    the script run's on that connection, so the purge runs inline instead.
+    
+    Args:
+        project_id: Project UUID
+    
+    Returns:
+        Status of the purge job
+    """
+    name = f"project-purge-{project_id}"
+    if shares_connection():
+        return run_inline(name, purge_project, project_id)
+    return run_in_background(name, purge_project, project_id)
+
+
+def resume_pending_purges() -> List[JobStatus]:
+    """
+    Restart purges interrupted by a restart (once per process).
+    
+    Returns:
+        Statuses of the started jobs
+    """
+    global _resumed
+    
+    if _resumed:
+        return []
+    _resumed = True
+    
+    session = get_session_local()()
+    try:
+        project_ids = session.execute(
+            select(Project.id).where(Project.deleted_at.is_not(None))
+        ).scalars().all()
+    finally:
+        session.close()
+    
+    return [start_purge(project_id) for project_id in project_ids]
\ No newline at end of file
@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union, BinaryIO
 from datetime import datetime
+from pathlib import Path
 
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 
-from config.database import get_session_local
+from config.database import get_scoped_session, get_session_local
+from config.settings import get_settings
+from modules.activity import log as activity
+from utils.artifacts import ExportArtifact
 from utils.database import Project
+from utils.shared_cache import (
+    PROJECT_LIST, bump_project_version, bump_version, cached_read
+)
+
+
+def invalidate_project_listing():
+    """Drop cached project listings (call after any project write)."""
+    bump_version(PROJECT_LIST)
 
 
 class ProjectService:
@@ -26,10 +39,15 @@ class ProjectService:
     
     @property
     def session(self) -> Session:
-        """Get database session."""
+        """Get database session (the active db_scope session if any)."""
         if self._session is None:
-            SessionLocal = get_session_local()
-            self._session = SessionLocal()
+            scoped = get_scoped_session()
+            if scoped is not None:
+                self._session = scoped
+                self._owns_session = False
+            else:
+                SessionLocal = get_session_local()
+                self._session = SessionLocal()
         return self._session
     
     def __enter__(self):
@@ -73,6 +91,10 @@ class ProjectService:
         self.session.add(project)
         self.session.commit()
         self.session.refresh(project)
+        invalidate_project_listing()
+        activity.record_event(
+            project.id, activity.PROJECT_CREATED, f"Created project: {name}"
+        )
         
         return project.to_dict()
     
@@ -87,7 +109,8 @@ class ProjectService:
             Project as dictionary or None if not found
         """
         project = self.session.query(Project).filter(
-            Project.id == project_id
+            Project.id == project_id,
+            Project.deleted_at.is_(None)
         ).first()
         
         return project.to_dict() if project else None
@@ -99,12 +122,101 @@ class ProjectService:
         Returns:
             List of projects as dictionaries
         """
-        projects = self.session.query(Project).order_by(
+        projects = self.session.query(Project).filter(
+            Project.deleted_at.is_(None)
+        ).order_by(
             Project.updated_at.desc()
         ).all()
         
         return [p.to_dict() for p in projects]
     
+    def list_projects(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        List projects, most recently updated first, one page at a time.
+        
+        Pages are keyset-paginated on (updated_at, id) and cached in the
+        shared cache until the next project write, so repeated calls (e.g.
+        on every rerun, from any session) do not touch the database.
+        
+        Args:
+            limit: Maximum projects per page
+            cursor: ``next_cursor`` of the previous page
+            search: Optional case-insensitive name prefix
+        
+        Returns:
+            Dictionary with "items" (id, name, central_entity, updated_at)
+            and "next_cursor" (None on the last page)
+        """
+        search = (search or "").strip().lower() or None
+        
+        page = cached_read(
+            PROJECT_LIST,
+            "list_projects",
+            lambda: self._list_projects(limit, cursor, search),
+            limit,
+            cursor,
+            search,
+        )
+        return {"items": list(page["items"]), "next_cursor": page["next_cursor"]}
+    
+    def _list_projects(
+        self,
+        limit: int,
+        cursor: Optional[str],
+        search: Optional[str]
+    ) -> Dict[str, Any]:
+        """Query one listing page (see list_projects)."""
+        query = select(
+            Project.id,
+            Project.name,
+            Project.central_entity,
+            Project.updated_at,
+        ).where(Project.deleted_at.is_(None))
+        
+        if search:
+            # Range on lower(name) so the expression index is used
+            query = query.where(
+                func.lower(Project.name) >= search,
+                func.lower(Project.name) < search + "\uffff",
+            )
+        
+        if cursor:
+            updated_at, last_id = cursor.split("|", 1)
+            updated_at = datetime.fromisoformat(updated_at)
+            query = query.where(or_(
+                Project.updated_at < updated_at,
+                and_(Project.updated_at == updated_at, Project.id < last_id),
+            ))
+        
+        rows = self.session.execute(
+            query.order_by(Project.updated_at.desc(), Project.id.desc())
+            .limit(limit + 1)
+        ).all()
+        
+        items = [
+            {
+                "id": row.id,
+                "name": row.name,
+                "central_entity": row.central_entity,
+                "updated_at": (
+                    row.updated_at.isoformat() if row.updated_at else None
+                ),
+            }
+            for row in rows[:limit]
+        ]
+        
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = f"{last['updated_at']}|{last['id']}"
+        
+        return {"items": items, "next_cursor": next_cursor}
+    
     def update_project(
         self,
         project_id: str,
@@ -121,7 +233,8 @@ class ProjectService:
             Updated project as dictionary or None if not found
         """
         project = self.session.query(Project).filter(
-            Project.id == project_id
+            Project.id == project_id,
+            Project.deleted_at.is_(None)
         ).first()
         
         if not project:
@@ -144,28 +257,54 @@ class ProjectService:
         
         self.session.commit()
         self.session.refresh(project)
+        invalidate_project_listing()
+        activity.record_event(
+            project_id,
+            activity.PROJECT_UPDATED,
+            "Updated project settings",
+            data={"fields": sorted(set(kwargs) & allowed_fields)},
+        )
         
         return project.to_dict()
     
-    def delete_project(self, project_id: str) -> bool:
+    def delete_project(
+        self,
+        project_id: str,
+        background: bool = True
+    ) -> bool:
         """
         Delete a project and all related data.
         
+        The project is hidden immediately (soft delete); its rows are then
+        removed in small chunks so the database is never locked for long.
+        
         Args:
             project_id: Project UUID
+            background: Purge rows on a background thread (otherwise
+                purge before returning)
         
         Returns:
             True if deleted, False if not found
         """
+        from modules.project.purge import purge_project, start_purge
+        
         project = self.session.query(Project).filter(
-            Project.id == project_id
+            Project.id == project_id,
+            Project.deleted_at.is_(None)
         ).first()
         
         if not project:
             return False
         
-        self.session.delete(project)
+        project.deleted_at = datetime.utcnow()
         self.session.commit()
+        invalidate_project_listing()
+        bump_project_version(project_id)
+        
+        if background:
+            start_purge(project_id)
+        else:
+            purge_project(project_id, session=self.session)
         
         return True
     
@@ -173,95 +312,135 @@ class ProjectService:
         """
         Get statistics for a project.
         
+        Results are shared by all sessions until the project's next write,
+        so opening a dashboard costs at most one aggregate query.
+        
         Args:
             project_id: Project UUID
         
         Returns:
             Dictionary with project statistics
         """
-        from utils.database import (
-            TopicalMap, ContentBrief, Publication
+        return cached_read(
+            project_id,
+            "project_stats",
+            lambda: self._get_project_stats(project_id),
+            datetime.utcnow().date(),  # The authority score decays daily
         )
+    
+    def _get_project_stats(
+        self,
+        project_id: str,
+        authority: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Query project statistics in one aggregate (see get_project_stats).
         
-        # Count topical maps
-        map_count = self.session.query(TopicalMap).filter(
-            TopicalMap.project_id == project_id
-        ).count()
-        
-        # Count briefs by status
-        brief_stats = {}
-        for status in ["black", "orange", "yellow", "blue", "green"]:
-            count = self.session.query(ContentBrief).filter(
-                ContentBrief.project_id == project_id,
-                ContentBrief.status == status
-            ).count()
-            brief_stats[status] = count
-        
-        total_briefs = sum(brief_stats.values())
-        
-        # Count publications
-        pub_count = self.session.query(Publication).join(
-            ContentBrief
-        ).filter(
-            ContentBrief.project_id == project_id
-        ).count()
+        Brief counts per status and publication counts come from a single
+        pass over the project's briefs (the project_id/status index) with
+        their publications joined; the authority score is read from its
+        own cache unless one is passed in.
+        """
+        from modules.content_brief.service import BRIEF_STATUSES
+        from utils.database import TopicalMap, ContentBrief, Publication
+        
+        now = datetime.utcnow()
+        row = self.session.execute(
+            select(
+                *(
+                    func.count(ContentBrief.id).filter(
+                        ContentBrief.status == status
+                    )
+                    for status in BRIEF_STATUSES
+                ),
+                func.count(Publication.id),
+                func.count(Publication.id).filter(
+                    Publication.published_at <= now
+                ),
+                select(func.count(TopicalMap.id))
+                .where(TopicalMap.project_id == project_id)
+                .scalar_subquery(),
+            )
+            .select_from(ContentBrief)
+            .outerjoin(Publication, Publication.brief_id == ContentBrief.id)
+            .where(ContentBrief.project_id == project_id)
+        ).one()
+        
+        brief_stats = dict(zip(BRIEF_STATUSES, row[:len(BRIEF_STATUSES)]))
+        pub_count, live_count, map_count = row[len(BRIEF_STATUSES):]
+        
+        if authority is None:
+            authority = self.get_authority_score(project_id)
         
         return {
             "project_id": project_id,
             "topical_maps": map_count,
-            "total_briefs": total_briefs,
+            "total_briefs": sum(brief_stats.values()),
             "briefs_by_status": brief_stats,
             "publications": pub_count,
-            "coverage_score": self._calculate_coverage(project_id),
+            "live_pages": live_count,  # Publications already published
+            "coverage_score": authority["coverage"],
+            "authority": authority,
         }
     
-    def _calculate_coverage(self, project_id: str) -> float:
+    def get_authority_score(self, project_id: str) -> Dict[str, Any]:
         """
-        Calculate topical coverage score.
+        Get the topical authority score of a project.
+        
+        Scores are shared by all sessions until the project's next write
+        (or the next day, as momentum decays); after that only stale
+        components are recomputed, see TopicalAuthorityScorer.
         
         Args:
             project_id: Project UUID
         
         Returns:
-            Coverage score between 0 and 1
+            Score dictionary with overall, coverage, depth and momentum
+            (0-1) and details
         """
-        from utils.database import Entity, Attribute, ContentBrief
-        
-        # Get total mapped attributes
-        total_attrs = self.session.query(Attribute).join(
-            TopicalMap
-        ).filter(
-            TopicalMap.project_id == project_id
-        ).count()
-        
-        if total_attrs == 0:
-            return 0.0
-        
-        # Get attributes with briefs (green status = covered)
-        covered = self.session.query(ContentBrief).filter(
-            ContentBrief.project_id == project_id,
-            ContentBrief.status == "green"
-        ).count()
-        
-        return min(covered / total_attrs, 1.0)
+        from modules.analytics.scoring import TopicalAuthorityScorer
+        
+        return cached_read(
+            project_id,
+            "authority_score",
+            lambda: TopicalAuthorityScorer(self.session).score(
+                project_id
+            ).to_dict(),
+            datetime.utcnow().date(),
+        )
     
     def duplicate_project(
         self,
         project_id: str,
-        new_name: str
+        new_name: str,
+        deep: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
-        Duplicate a project (without content).
+        Duplicate a project.
         
         Args:
             project_id: Source project UUID
             new_name: Name for the new project
+            deep: Also copy topical maps, entities, attributes, briefs,
+                sections and internal links (otherwise only the
+                framework fields)
         
         Returns:
             New project as dictionary or None if source not found
         """
+        if deep:
+            from modules.project.clone import clone_project
+            
+            new_project = clone_project(self.session, project_id, new_name)
+            if new_project is None:
+                return None
+            invalidate_project_listing()
+            self._record_duplicate(new_project, project_id, deep=True)
+            return new_project.to_dict()
+        
         source = self.session.query(Project).filter(
-            Project.id == project_id
+            Project.id == project_id,
+            Project.deleted_at.is_(None)
         ).first()
         
         if not source:
@@ -278,9 +457,25 @@ class ProjectService:
         self.session.add(new_project)
         self.session.commit()
         self.session.refresh(new_project)
+        invalidate_project_listing()
+        self._record_duplicate(new_project, project_id, deep=False)
         
         return new_project.to_dict()
     
+    def _record_duplicate(
+        self,
+        new_project: Project,
+        source_id: str,
+        deep: bool
+    ):
+        """Record the creation of a duplicated project."""
+        activity.record_event(
+            new_project.id,
+            activity.PROJECT_CREATED,
+            f"Created project: {new_project.name} (copy)",
+            data={"source_project_id": source_id, "deep": deep},
+        )
+    
     def export_project(
         self,
         project_id: str,
@@ -290,57 +485,190 @@ class ProjectService:
         """
         Export all project data.
         
+        Runs a fixed number of queries (one per table) regardless of
+        project size; see ProjectExporter.
+        
         Args:
             project_id: Project UUID
+            include_briefs: Include content briefs (with sections and
+                internal links)
+            include_maps: Include topical maps (with entities, attributes
+                and entity-attribute links)
+        
+        Returns:
+            Complete project data as dictionary
+        """
+        from modules.project.export import ProjectExporter
+        
+        return ProjectExporter(self.session).export(
+            project_id,
+            include_briefs=include_briefs,
+            include_maps=include_maps,
+        )
+    
+    def export_project_to_file(
+        self,
+        project_id: str,
+        format: str = "ndjson",
+        include_briefs: bool = True,
+        include_maps: bool = True
+    ) -> Optional[Path]:
+        """
+        Stream a project export into the export directory.
+        
+        Unlike export_project, rows are streamed to disk in batches and
+        never held in memory together. File formats go through the export
+        artifact cache (see get_export_artifact).
+        
+        Args:
+            project_id: Project UUID
+            format: Export format (ndjson, zip, xlsx, parquet, arrow)
             include_briefs: Include content briefs
             include_maps: Include topical maps
         
         Returns:
-            Complete project data as dictionary
+            Path of the written file (a directory for parquet/arrow) or
+            None if project not found
         """
-        from utils.database import TopicalMap, ContentBrief, Entity, Attribute
+        from modules.project.export import COLUMNAR_FORMATS, ProjectExporter
+        from utils.export import ExportHandler
+        
+        if format not in COLUMNAR_FORMATS:
+            artifact = self.get_export_artifact(
+                project_id, format, include_briefs, include_maps
+            )
+            return artifact.path if artifact else None
         
         project = self.get_project(project_id)
         if not project:
-            return {}
+            return None
         
-        export_data = {
-            "project": project,
-            "exported_at": datetime.utcnow().isoformat(),
-        }
+        handler = ExportHandler(get_settings().get_export_path())
+        filename = handler.get_download_filename(project["name"], format)
         
-        if include_maps:
-            maps = self.session.query(TopicalMap).filter(
-                TopicalMap.project_id == project_id
-            ).all()
-            
-            maps_data = []
-            for tm in maps:
-                map_dict = tm.to_dict()
-                
-                # Include entities
-                entities = self.session.query(Entity).filter(
-                    Entity.topical_map_id == tm.id
-                ).all()
-                map_dict["entities"] = [e.to_dict() for e in entities]
-                
-                # Include attributes
-                attrs = self.session.query(Attribute).filter(
-                    Attribute.topical_map_id == tm.id
-                ).all()
-                map_dict["attributes"] = [a.to_dict() for a in attrs]
-                
-                maps_data.append(map_dict)
-            
-            export_data["topical_maps"] = maps_data
+        ProjectExporter(self.session).write(
+            project_id,
+            filename,
+            format=format,
+            include_maps=include_maps,
+            include_briefs=include_briefs,
+            handler=handler,
+        )
+        activity.record_event(
+            project_id,
+            activity.EXPORT_CREATED,
+            f"Exported project as {format}",
+            data={"format": format},
+            invalidate=False,
+        )
         
-        if include_briefs:
-            briefs = self.session.query(ContentBrief).filter(
-                ContentBrief.project_id == project_id
-            ).all()
-            export_data["content_briefs"] = [b.to_dict() for b in briefs]
+        return handler.export_path / filename
+    
+    def get_export_artifact(
+        self,
+        project_id: str,
+        format: str = "ndjson",
+        include_briefs: bool = True,
+        include_maps: bool = True
+    ) -> Optional[ExportArtifact]:
+        """
+        Get a cached project export file, generating it only if needed.
+        
+        Exports are keyed by project, format, options and the project's
+        data version, so repeating an export of unchanged data returns
+        the stored file instantly.
         
-        return export_data
+        Args:
+            project_id: Project UUID
+            format: File export format (ndjson, zip, xlsx)
+            include_briefs: Include content briefs
+            include_maps: Include topical maps
+        
+        Returns:
+            Stored export artifact or None if project not found
+        
+        Raises:
+            ValueError: If the format is not a single-file format
+        """
+        from modules.project.export import COLUMNAR_FORMATS, ProjectExporter
+        from utils.artifacts import ExportArtifactStore, artifact_key
+        from utils.export import ExportHandler
+        
+        if format in COLUMNAR_FORMATS:
+            raise ValueError(f"Not a single-file export format: {format}")
+        
+        project = self.get_project(project_id)
+        if not project:
+            return None
+        
+        exporter = ProjectExporter(self.session)
+        key = artifact_key(
+            project_id=project_id,
+            format=format,
+            include_briefs=include_briefs,
+            include_maps=include_maps,
+            data_version=exporter.data_version(project_id),
+        )
+        
+        handler = ExportHandler(get_settings().get_export_path())
+        
+        def write(path: Path):
+            exporter.write(
+                project_id,
+                path,
+                format=format,
+                include_maps=include_maps,
+                include_briefs=include_briefs,
+                handler=handler,
+            )
+        
+        artifact = ExportArtifactStore.from_settings().get_or_create(
+            key, handler.get_download_filename(project["name"], format), write
+        )
+        activity.record_event(
+            project_id,
+            activity.EXPORT_CREATED,
+            f"Exported project as {format}",
+            data={"format": format, "size": artifact.size},
+            invalidate=False,
+        )
+        return artifact
+    
+    def import_project(
+        self,
+        source: Union[str, Path, BinaryIO, Dict[str, Any]],
+        name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Import a project export as a new project.
+        
+        Accepts the streamed NDJSON, zip and columnar (Parquet/Arrow
+        directory) exports as well as the export_project dictionary (or a
+        JSON file of it). Streamed exports are read and inserted in
+        batches, so they may be larger than memory.
+        
+        Args:
+            source: Path, seekable binary stream, or export dictionary
+            name: Optional name for the new project (defaults to the
+                exported name)
+        
+        Returns:
+            Dictionary with the new "project" and per-table row "counts"
+        
+        Raises:
+            ValueError: If the source is not a project export
+        """
+        from modules.project.importer import ProjectImporter
+        
+        result = ProjectImporter(self.session).run(source, name=name)
+        invalidate_project_listing()
+        activity.record_event(
+            result["project"]["id"],
+            activity.PROJECT_IMPORTED,
+            f"Imported project: {result['project']['name']}",
+            data={"counts": result["counts"]},
+        )
+        return result
 
 
 # Import for backwards compatibility with TopicalMap
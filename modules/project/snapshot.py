@@ -0,0 +1,338 @@
+"""Precomputed dashboard snapshots.
+
+A dashboard needs brief counts, the authority score, the latest activity
+and the top queries of a project, which is several queries and, for the
+authority score, a pass over the project's briefs. Instead of running
+them in the page request, ``build_snapshot`` stores everything the
+dashboard renders as one JSON row per project, and the dashboard reads it
+back with ``get_snapshot`` (a primary-key lookup).
+
+Snapshots are rebuilt by a daemon thread:
+
+- after changes: ``record_event`` schedules the project, and a burst of
+  changes is coalesced into one rebuild ``REBUILD_DELAY`` seconds after
+  the last of them
+- periodically: snapshots older than ``REFRESH_INTERVAL`` are rebuilt,
+  as momentum decays and query data arrives without activity events
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from config.database import get_scoped_session, get_session_local
+from utils import serialization
+from utils.database import (
+    ContentBrief, DashboardSnapshot, Project, Publication, QueryData
+)
+
+
+REBUILD_DELAY = 2.0  # Seconds without changes before a rebuild
+REFRESH_INTERVAL = 15 * 60  # Maximum snapshot age in seconds
+CHECK_INTERVAL = 1.0  # Seconds between scheduled rebuild passes
+STALE_CHECK_INTERVAL = 60.0  # Seconds between stale snapshot passes
+REFRESH_BATCH = 20  # Stale snapshots rebuilt per pass
+
+ACTIVITY_ITEMS = 20  # Events in the snapshot (first feed page)
+TOP_QUERIES = 10
+
+# One build at a time, so concurrent builds cannot race on the upsert
+_build_lock = threading.Lock()
+
+
+def build_snapshot(
+    project_id: str,
+    session: Optional[Session] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Compute a project's dashboard data and store it as its snapshot.
+    
+    Args:
+        project_id: Project UUID
+        session: Optional session (a new one is created if omitted)
+    
+    Returns:
+        Snapshot dictionary (see DashboardSnapshot.to_dict), or None if
+        the project does not exist or is being deleted
+    """
+    owns_session = session is None
+    if owns_session:
+        session = get_session_local()()
+    
+    try:
+        with _build_lock:
+            project = session.get(Project, project_id)
+            if project is None or project.deleted_at is not None:
+                existing = session.get(DashboardSnapshot, project_id)
+                if existing is not None:
+                    session.delete(existing)
+                    session.commit()
+                return None
+            
+            start = time.perf_counter()
+            data = _build_data(session, project_id)
+            
+            snapshot = session.merge(DashboardSnapshot(
+                project_id=project_id,
+                data=data,
+                built_at=datetime.utcnow(),
+                build_ms=round((time.perf_counter() - start) * 1000, 1),
+            ))
+            session.commit()
+            return snapshot.to_dict()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        if owns_session:
+            session.close()
+
+
+def _build_data(session: Session, project_id: str) -> Dict[str, Any]:
+    """Compute everything the dashboard renders."""
+    from modules.activity.service import ActivityService
+    from modules.analytics.scoring import TopicalAuthorityScorer
+    from modules.project.service import ProjectService
+    
+    # Computed directly: the shared cache belongs to script runs, and
+    # the snapshot is the cache of these reads
+    authority = TopicalAuthorityScorer(session).score(project_id).to_dict()
+    stats = ProjectService(session)._get_project_stats(
+        project_id, authority=authority
+    )
+    activity = ActivityService(session).list_events(
+        project_id, limit=ACTIVITY_ITEMS
+    )
+    
+    data = {
+        "stats": stats,
+        "recent_activity": activity["items"],
+        "activity_next_cursor": activity["next_cursor"],
+        "top_queries": _top_queries(session, project_id),
+    }
+    # Store plain JSON types (NumPy numbers, datetimes, ...)
+    return serialization.loads(serialization.dumps(data))
+
+
+def _top_queries(
+    session: Session,
+    project_id: str,
+    limit: int = TOP_QUERIES
+) -> List[Dict[str, Any]]:
+    """Get the project's queries with the most clicks."""
+    clicks = func.sum(QueryData.clicks)
+    impressions = func.sum(QueryData.impressions)
+    
+    rows = session.execute(
+        select(
+            QueryData.query,
+            clicks,
+            impressions,
+            func.avg(QueryData.position),
+        )
+        .join(Publication, Publication.id == QueryData.publication_id)
+        .join(ContentBrief, ContentBrief.id == Publication.brief_id)
+        .where(ContentBrief.project_id == project_id)
+        .group_by(QueryData.query)
+        .order_by(clicks.desc(), impressions.desc())
+        .limit(limit)
+    ).all()
+    
+    return [
+        {
+            "query": query,
+            "clicks": total_clicks or 0,
+            "impressions": total_impressions or 0,
+            "position": round(position, 1) if position is not None else None,
+        }
+        for query, total_clicks, total_impressions, position in rows
+    ]
+
+
+def get_snapshot(
+    project_id: str,
+    session: Optional[Session] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Read a project's dashboard snapshot.
+    
+    Args:
+        project_id: Project UUID
+        session: Optional session (defaults to the active db_scope)
+    
+    Returns:
+        Snapshot dictionary or None if none was built yet
+    """
+    session = session or get_scoped_session()
+    if session is not None:
+        snapshot = session.get(DashboardSnapshot, project_id)
+        return snapshot.to_dict() if snapshot else None
+    
+    session = get_session_local()()
+    try:
+        snapshot = session.get(DashboardSnapshot, project_id)
+        return snapshot.to_dict() if snapshot else None
+    finally:
+        session.close()
+
+
+class SnapshotScheduler:
+    """Rebuild snapshots after changes and when they get old."""
+    
+    def __init__(
+        self,
+        rebuild_delay: float = REBUILD_DELAY,
+        refresh_interval: float = REFRESH_INTERVAL,
+        check_interval: float = CHECK_INTERVAL
+    ):
+        """
+        Initialize scheduler.
+        
+        Args:
+            rebuild_delay: Seconds without changes before a rebuild
+            refresh_interval: Maximum snapshot age in seconds
+            check_interval: Seconds between passes
+        """
+        self.rebuild_delay = rebuild_delay
+        self.refresh_interval = refresh_interval
+        self.check_interval = check_interval
+        
+        self._due: Dict[str, float] = {}  # project_id -> monotonic deadline
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        
+        self.built = 0
+        self.refreshed = 0
+        self.failed = 0
+        self.last_error: Optional[str] = None
+    
+    def schedule(self, project_id: str):
+        """Rebuild a project's snapshot once its changes settle."""
+        with self._lock:
+            self._due[project_id] = time.monotonic() + self.rebuild_delay
+        self.start()
+    
+    def is_pending(self, project_id: str) -> bool:
+        """Check if a rebuild of the project is scheduled."""
+        with self._lock:
+            return project_id in self._due
+    
+    def start(self):
+        """Start the scheduler thread if it is not running."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="dashboard-snapshots", daemon=True
+                )
+                self._thread.start()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get scheduled/built/refreshed/failed counts."""
+        with self._lock:
+            return {
+                "scheduled": len(self._due),
+                "built": self.built,
+                "refreshed": self.refreshed,
+                "failed": self.failed,
+                "last_error": self.last_error,
+            }
+    
+    def run_pending(self, force: bool = False) -> int:
+        """
+        Rebuild snapshots whose changes have settled.
+        
+        Args:
+            force: Also rebuild projects changed less than rebuild_delay
+                seconds ago
+        
+        Returns:
+            Number of rebuilt snapshots
+        """
+        now = time.monotonic()
+        with self._lock:
+            ready = [
+                project_id for project_id, due in self._due.items()
+                if force or due <= now
+            ]
+            for project_id in ready:
+                del self._due[project_id]
+        
+        for project_id in ready:
+            self._build(project_id)
+            self.built += 1
+        return len(ready)
+    
+    def refresh_stale(self) -> int:
+        """
+        Rebuild the oldest snapshots beyond refresh_interval.
+        
+        Returns:
+            Number of rebuilt snapshots
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=self.refresh_interval)
+        
+        session = get_session_local()()
+        try:
+            project_ids = session.execute(
+                select(DashboardSnapshot.project_id)
+                .where(DashboardSnapshot.built_at < cutoff)
+                .order_by(DashboardSnapshot.built_at)
+                .limit(REFRESH_BATCH)
+            ).scalars().all()
+        finally:
+            session.close()
+        
+        for project_id in project_ids:
+            self._build(project_id)
+            self.refreshed += 1
+        return len(project_ids)
+    
+    def _build(self, project_id: str):
+        try:
+            build_snapshot(project_id)
+        except Exception as e:
+            self.failed += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+    
+    def _run(self):
+        """Rebuild changed projects, then stale snapshots, in a loop."""
+        next_stale_check = 0.0
+        while True:
+            time.sleep(self.check_interval)
+            try:
+                self.run_pending()
+                if time.monotonic() >= next_stale_check:
+                    next_stale_check = time.monotonic() + STALE_CHECK_INTERVAL
+                    self.refresh_stale()
+            except Exception as e:  # Keep the thread alive
+                self.failed += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+
+
+_scheduler = SnapshotScheduler()
+
+
+def schedule_rebuild(project_id: str):
+    """Rebuild a project's snapshot after its changes settle."""
+    _scheduler.schedule(project_id)
+
+
+def rebuild_pending(project_id: str) -> bool:
+    """Check if a rebuild of the project's snapshot is scheduled."""
+    return _scheduler.is_pending(project_id)
+
+
+def start_snapshot_refresh():
+    """Start rebuilding stale snapshots in the background."""
+    _scheduler.start()
+
+
+def get_scheduler_stats() -> Dict[str, Any]:
+    """Get snapshot scheduler statistics."""
+    return _scheduler.stats()
\ No newline at end of file
@@ -0,0 +1,5 @@
+"""Publication module for managing published content."""
+
+from modules.publication.service import PublicationService
+
+__all__ = ["PublicationService"]
\ No newline at end of file
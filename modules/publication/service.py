@@ -0,0 +1,262 @@
+"""Publication service for published content and its bodies."""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Iterator, Optional
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from config.database import get_scoped_session, get_session_local
+from utils.content_store import ContentStore
+from modules.activity import log as activity
+from utils.database import ContentBrief, Publication
+
+
+class PublicationService:
+    """Service for managing publications."""
+    
+    def __init__(self, db_session: Optional[Session] = None):
+        """
+        Initialize publication service.
+        
+        Args:
+            db_session: Optional SQLAlchemy session (creates new if not provided)
+        """
+        self._session = db_session
+        self._owns_session = db_session is None
+    
+    @property
+    def session(self) -> Session:
+        """Get database session (the active db_scope session if any)."""
+        if self._session is None:
+            scoped = get_scoped_session()
+            if scoped is not None:
+                self._session = scoped
+                self._owns_session = False
+            else:
+                SessionLocal = get_session_local()
+                self._session = SessionLocal()
+        return self._session
+    
+    @property
+    def store(self) -> ContentStore:
+        """Get content store bound to this service's session."""
+        return ContentStore(self.session)
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close session if we own it."""
+        if self._owns_session and self._session:
+            self._session.close()
+    
+    def create_publication(
+        self,
+        brief_id: str,
+        url: Optional[str] = None,
+        content: Optional[str] = None,
+        schema_markup: Optional[Dict] = None,
+        published_at: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a publication for a brief.
+        
+        Args:
+            brief_id: Content brief UUID
+            url: Published URL
+            content: Article body (stored compressed, out-of-row)
+            schema_markup: Structured data markup
+            published_at: Publication timestamp
+        
+        Returns:
+            Created publication as dictionary
+        """
+        publication = Publication(
+            brief_id=brief_id,
+            url=url,
+            schema_markup=schema_markup,
+            published_at=published_at,
+        )
+        
+        if content is not None:
+            publication.content_hash, publication.content_size = (
+                self.store.put(content)
+            )
+        
+        self.session.add(publication)
+        self.session.commit()
+        self.session.refresh(publication)
+        brief = publication.brief
+        activity.record_event(
+            brief.project_id,
+            activity.PUBLICATION_CREATED,
+            f"Published: {url or brief.title_tag or brief_id[:8]}",
+            subject_id=publication.id,
+        )
+        
+        return publication.to_dict()
+    
+    def update_publication(
+        self,
+        publication_id: str,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update a publication.
+        
+        Args:
+            publication_id: Publication UUID
+            **kwargs: Fields to update (``content`` replaces the body)
+        
+        Returns:
+            Updated publication as dictionary or None if not found
+        """
+        publication = self.session.get(Publication, publication_id)
+        
+        if not publication:
+            return None
+        
+        allowed_fields = {
+            "url",
+            "schema_markup",
+            "published_at",
+            "gsc_data",
+            "performance_metrics",
+        }
+        
+        for field, value in kwargs.items():
+            if field in allowed_fields:
+                setattr(publication, field, value)
+        
+        previous_hash = publication.content_hash
+        if "content" in kwargs:
+            content = kwargs["content"]
+            if content is None:
+                publication.content_hash = None
+                publication.content_size = None
+            else:
+                publication.content_hash, publication.content_size = (
+                    self.store.put(content)
+                )
+        
+        self.session.commit()
+        
+        if previous_hash and previous_hash != publication.content_hash:
+            # Drop the old body unless another publication shares it
+            self.store.delete_unreferenced(keys=[previous_hash])
+        
+        self.session.refresh(publication)
+        activity.record_event(
+            publication.brief.project_id,
+            activity.PUBLICATION_UPDATED,
+            f"Updated publication: {publication.url or publication_id[:8]}",
+            subject_id=publication_id,
+            data={"fields": sorted(kwargs)},
+        )
+        
+        return publication.to_dict()
+    
+    def get_publication(
+        self,
+        publication_id: str,
+        include_content: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a publication by ID.
+        
+        Args:
+            publication_id: Publication UUID
+            include_content: Also load the article body
+        
+        Returns:
+            Publication as dictionary or None if not found
+        """
+        publication = self.session.get(Publication, publication_id)
+        
+        if not publication:
+            return None
+        
+        data = publication.to_dict()
+        if include_content:
+            data["content"] = self.get_content(publication_id)
+        
+        return data
+    
+    def list_publications(self, project_id: str) -> List[Dict[str, Any]]:
+        """
+        List a project's publications without their bodies.
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            List of publications as dictionaries
+        """
+        rows = self.session.execute(
+            select(
+                Publication.id,
+                Publication.brief_id,
+                Publication.url,
+                Publication.content_size,
+                Publication.published_at,
+            )
+            .join(ContentBrief, ContentBrief.id == Publication.brief_id)
+            .where(ContentBrief.project_id == project_id)
+            .order_by(Publication.published_at.desc())
+        ).all()
+        
+        return [
+            {
+                "id": row.id,
+                "brief_id": row.brief_id,
+                "url": row.url,
+                "content_size": row.content_size,
+                "published_at": (
+                    row.published_at.isoformat()
+                    if row.published_at else None
+                ),
+            }
+            for row in rows
+        ]
+    
+    def get_content(self, publication_id: str) -> Optional[str]:
+        """
+        Load a publication's article body.
+        
+        Args:
+            publication_id: Publication UUID
+        
+        Returns:
+            Article body or None
+        """
+        key = self._get_content_hash(publication_id)
+        return self.store.get(key) if key else None
+    
+    def stream_content(
+        self,
+        publication_id: str,
+        chunk_size: int = 64 * 1024
+    ) -> Iterator[str]:
+        """
+        Stream a publication's article body in chunks.
+        
+        Args:
+            publication_id: Publication UUID
+            chunk_size: Approximate chunk size in bytes
+        
+        Yields:
+            Text chunks
+        """
+        key = self._get_content_hash(publication_id)
+        if key:
+            yield from self.store.stream(key, chunk_size)
+    
+    def _get_content_hash(self, publication_id: str) -> Optional[str]:
+        return self.session.execute(
+            select(Publication.content_hash)
+            .where(Publication.id == publication_id)
+        ).scalar()
\ No newline at end of file
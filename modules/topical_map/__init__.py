@@ -0,0 +1,15 @@
+"""Topical map module - AI entity discovery and map reads."""
+
+from modules.topical_map.discovery import (
+    EntityDiscoveryEngine,
+    DiscoveryResult,
+    start_discovery,
+)
+from modules.topical_map.service import TopicalMapService
+
+__all__ = [
+    "EntityDiscoveryEngine",
+    "DiscoveryResult",
+    "TopicalMapService",
+    "start_discovery",
+]
\ No newline at end of file
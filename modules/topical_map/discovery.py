@@ -0,0 +1,654 @@
+"""
+Entity Discovery Engine - AI expansion of a central entity into a map.
+
+Starting from the project's central entity, each round asks the AI for
+the related entities and the attributes of every entity on the current
+frontier. Calls of a round run concurrently (one per frontier entity, at
+most ``max_concurrency`` at a time), and their results are deduplicated
+as they complete: an entity or attribute already seen anywhere in the map
+is dropped. The new entities form the next round's frontier.
+
+Entities of the last round (and any whose expansion was skipped because
+the map filled up) are never expanded, so a final attributes-only pass
+asks for their attributes, and every entity of the map gets them.
+
+Each round is written with three bulk INSERTs (entities, attributes,
+entity-attribute links) in one transaction, so a 1,000-entity map costs
+a handful of statements per round instead of one per row, and a map
+stays usable (and already contains the earlier rounds) if a later round
+fails. Discovery stops before a round if the project has been deleted in
+the meantime, so it never writes into a project that is being purged.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from config.database import get_session_local
+from config.settings import get_settings
+from utils.database import (
+    Attribute, Entity, EntityAttribute, Project, TopicalMap, generate_uuid
+)
+from utils.jobs import JobStatus, run_in_background
+
+
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_MAX_ENTITIES = 1000
+DEFAULT_CHILDREN = 12  # Related entities requested per call
+DEFAULT_ATTRIBUTES = 8  # Attributes requested per call
+
+CLASSIFICATIONS = ("unique", "root", "rarer")
+SECTIONS = ("core", "outer")
+
+
+ENTITY_EXPANSION_PROMPT = '''You are an expert in Koray Tuğberk GÜBÜR's Semantic SEO framework.
+You build topical maps: networks of entities and their attributes that a
+website must cover to gain topical authority.
+
+For the entity you are given, list:
+
+1. **Related entities** that branch from it and belong in the topical map
+   of the website described by the source context. Prefer concrete,
+   searchable entities over generic words.
+2. **Attributes** of the entity, classified with the Unique-First Rule:
+   - unique: only this entity has it
+   - root: every instance of the entity's class has it
+   - rarer: some but not all instances have it
+   and assigned to a section:
+   - core: directly tied to how the website makes money
+   - outer: builds trust and historical data
+
+Score each related entity from 1 to 10 for prominence (is it needed to
+define the parent?), popularity (search demand) and relevance (fit with
+the source context).
+
+Respond with a JSON object in this exact format:
+{
+    "entities": [
+        {"name": "Entity name", "relation": "how it relates to the parent",
+         "prominence": 7, "popularity": 6, "relevance": 8}
+    ],
+    "attributes": [
+        {"name": "Attribute name", "classification": "unique/root/rarer",
+         "section": "core/outer"}
+    ]
+}'''
+
+
+EXPANSION_USER_TEMPLATE = '''**Entity:** {entity}
+**Path from the central entity:** {path}
+
+**Central entity:** {central_entity}
+**Source context:** {source_context}
+**Central search intent:** {central_search_intent}
+
+{instruction}'''
+
+EXPAND_INSTRUCTION = (
+    "List up to {children} related entities and up to {attributes} "
+    "attributes."
+)
+ATTRIBUTES_INSTRUCTION = (
+    "List up to {attributes} attributes only; return an empty "
+    "\"entities\" list."
+)
+
+
+@dataclass
+class DiscoveredEntity:
+    """An entity found by the engine (before it is stored)."""
+    id: str
+    name: str
+    depth: int
+    path: List[str]  # Names from the central entity down to this one
+    relation: Optional[str] = None
+    prominence: int = 5
+    popularity: int = 5
+    relevance: int = 5
+
+
+@dataclass
+class DiscoveryResult:
+    """Outcome of a discovery run."""
+    topical_map_id: str
+    entities: int = 0
+    attributes: int = 0
+    links: int = 0
+    rounds: int = 0
+    ai_calls: int = 0
+    failed_calls: int = 0
+    duplicates: int = 0  # Entities and attributes dropped as already seen
+    seconds: float = 0.0
+    project_deleted: bool = False  # Stopped early by a project delete
+    errors: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+def normalize_name(name: str) -> str:
+    """Dedupe key of an entity or attribute name."""
+    return " ".join(str(name or "").casefold().replace("_", " ").split())
+
+
+def _score(value: Any) -> int:
+    """Clamp an AI-provided score to 1-10 (5 if missing)."""
+    try:
+        return min(max(int(round(float(value))), 1), 10)
+    except (TypeError, ValueError):
+        return 5
+
+
+class EntityDiscoveryEngine:
+    """Discover a topical map breadth-first with concurrent AI calls."""
+    
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        client: Optional[Any] = None,
+        model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        max_entities: int = DEFAULT_MAX_ENTITIES,
+        children_per_entity: int = DEFAULT_CHILDREN,
+        attributes_per_entity: int = DEFAULT_ATTRIBUTES
+    ):
+        """
+        Initialize engine.
+        
+        Args:
+            session: Optional SQLAlchemy session (creates new if not provided)
+            client: OpenAI-compatible client (defaults to get_ai_client())
+            model: Model name (defaults to the configured model)
+            max_concurrency: Parallel AI calls (defaults to the setting)
+            max_depth: Rounds of expansion below the central entity
+            max_entities: Stop once the map has this many entities
+            children_per_entity: Related entities requested per call
+            attributes_per_entity: Attributes requested per call
+        """
+        settings = get_settings()
+        
+        self._session = session
+        self._owns_session = session is None
+        self._client = client
+        self.model = model or settings.ai.default_model
+        self.max_concurrency = max(
+            1, max_concurrency or settings.ai.max_concurrency
+        )
+        self.max_depth = max_depth
+        self.max_entities = max_entities
+        self.children_per_entity = children_per_entity
+        self.attributes_per_entity = attributes_per_entity
+    
+    @property
+    def session(self) -> Session:
+        """Get database session."""
+        if self._session is None:
+            self._session = get_session_local()()
+        return self._session
+    
+    def _get_client(self) -> Any:
+        """Get the AI client (shared by all worker threads)."""
+        if self._client is None:
+            from config.ai_providers import get_ai_client
+            
+            self._client = get_ai_client()
+            if self._client is None:
+                raise ValueError(
+                    "No AI provider configured. "
+                    "Please add an API key in Settings."
+                )
+        return self._client
+    
+    def close(self):
+        """Close the session if the engine created it."""
+        if self._owns_session and self._session:
+            self._session.close()
+            self._session = None
+    
+    def discover(
+        self,
+        project_id: str,
+        central_entity: Optional[str] = None,
+        map_name: Optional[str] = None,
+        progress: Optional[Callable[[float, str], None]] = None
+    ) -> DiscoveryResult:
+        """
+        Build a new topical map for a project.
+        
+        Args:
+            project_id: Project UUID
+            central_entity: Root entity (defaults to the project's)
+            map_name: Map name (defaults to "<entity> map")
+            progress: Optional callback receiving (0-1 fraction, message)
+        
+        Returns:
+            DiscoveryResult with counts of what was stored
+        
+        Raises:
+            ValueError: If the project or the central entity is missing
+        """
+        start = time.perf_counter()
+        
+        project = self.session.get(Project, project_id)
+        if project is None or project.deleted_at is not None:
+            raise ValueError(f"Project not found: {project_id}")
+        
+        central_entity = (central_entity or project.central_entity or "").strip()
+        if not central_entity:
+            raise ValueError(
+                "Define the project's central entity before discovery."
+            )
+        
+        context = {
+            "central_entity": central_entity,
+            "source_context": project.source_context or "Not defined",
+            "central_search_intent": (
+                project.central_search_intent or "Not defined"
+            ),
+        }
+        # Fails before the map is created if no provider is configured
+        client = self._get_client()
+        
+        # The map and its central entity
+        topical_map = TopicalMap(
+            project_id=project_id,
+            name=map_name or f"{central_entity} map",
+            type="raw",
+        )
+        self.session.add(topical_map)
+        self.session.flush()
+        
+        root = DiscoveredEntity(
+            id=generate_uuid(), name=central_entity, depth=0,
+            path=[central_entity], prominence=10, popularity=10,
+            relevance=10,
+        )
+        result = DiscoveryResult(topical_map_id=topical_map.id)
+        
+        seen_entities = {normalize_name(central_entity)}
+        attribute_ids: Dict[str, str] = {}  # Normalized name -> ID
+        
+        entity_rows = [self._entity_row(topical_map.id, root, "central")]
+        self.session.execute(insert(Entity), entity_rows)
+        self.session.commit()
+        result.entities = 1
+        
+        frontier = [root]
+        leaves: List[DiscoveredEntity] = []  # Not expanded
+        for depth in range(1, self.max_depth + 1):
+            if not frontier or result.entities >= self.max_entities:
+                break
+            if self._project_deleted(project_id, result):
+                break
+            
+            if progress:
+                progress(
+                    min(result.entities / self.max_entities, 0.99),
+                    f"Round {depth}: expanding {len(frontier)} entities "
+                    f"({result.entities} found so far)"
+                )
+            
+            frontier, skipped = self._run_round(
+                client, topical_map.id, frontier, context,
+                seen_entities, attribute_ids, result,
+            )
+            leaves.extend(skipped)
+            result.rounds = depth
+        
+        # Entities that were never expanded still need their attributes
+        leaves.extend(frontier)
+        if leaves and not self._project_deleted(project_id, result):
+            if progress:
+                progress(
+                    0.99,
+                    f"Fetching attributes of {len(leaves)} leaf entities"
+                )
+            self._run_round(
+                client, topical_map.id, leaves, context,
+                seen_entities, attribute_ids, result, attributes_only=True,
+            )
+        
+        result.seconds = round(time.perf_counter() - start, 2)
+        if progress and not result.project_deleted:
+            progress(
+                1.0,
+                f"Discovered {result.entities} entities and "
+                f"{result.attributes} attributes in {result.rounds} rounds"
+            )
+        return result
+    
+    def _project_deleted(
+        self,
+        project_id: str,
+        result: DiscoveryResult
+    ) -> bool:
+        """Check (and record on the result) whether the project was deleted."""
+        if not result.project_deleted:
+            row = self.session.execute(
+                select(Project.deleted_at).where(Project.id == project_id)
+            ).one_or_none()
+            # A purged project has no row left
+            result.project_deleted = row is None or row.deleted_at is not None
+        return result.project_deleted
+    
+    def _run_round(
+        self,
+        client: Any,
+        map_id: str,
+        frontier: List[DiscoveredEntity],
+        context: Dict[str, str],
+        seen_entities: Set[str],
+        attribute_ids: Dict[str, str],
+        result: DiscoveryResult,
+        attributes_only: bool = False
+    ) -> Tuple[List[DiscoveredEntity], List[DiscoveredEntity]]:
+        """
+        Expand one frontier concurrently and store the round in bulk.
+        
+        Args:
+            attributes_only: Only ask for the frontier's attributes (for
+                entities that are not expanded further)
+        
+        Returns:
+            (the round's new entities, i.e. the next frontier; frontier
+            entities whose call was skipped because the map filled up)
+        """
+        new_entities: List[DiscoveredEntity] = []
+        skipped: List[DiscoveredEntity] = []
+        attribute_rows: List[Dict[str, Any]] = []
+        link_rows: List[Dict[str, Any]] = []
+        linked: Set[Tuple[str, str]] = set()
+        
+        def is_full() -> bool:
+            return result.entities + len(new_entities) >= self.max_entities
+        
+        def collect(parent: DiscoveredEntity, future: Future):
+            """Dedupe one response into the round's rows."""
+            result.ai_calls += 1
+            try:
+                children, attributes = future.result()
+            except Exception as e:
+                result.failed_calls += 1
+                if len(result.errors) < 10:
+                    result.errors.append(f"{parent.name}: {e}")
+                return
+            
+            for attribute in attributes:
+                key = normalize_name(attribute["name"])
+                attribute_id = attribute_ids.get(key)
+                if attribute_id is None:
+                    attribute_id = generate_uuid()
+                    attribute_ids[key] = attribute_id
+                    attribute_rows.append({
+                        "id": attribute_id,
+                        "topical_map_id": map_id,
+                        "name": attribute["name"][:255],
+                        "classification": attribute["classification"],
+                        "section": attribute["section"],
+                        "depth_level": parent.depth + 1,
+                    })
+                else:
+                    result.duplicates += 1
+                
+                if (parent.id, attribute_id) not in linked:
+                    linked.add((parent.id, attribute_id))
+                    link_rows.append({
+                        "entity_id": parent.id,
+                        "attribute_id": attribute_id,
+                        "relationship_type": attribute["classification"],
+                    })
+            
+            for child in children:
+                key = normalize_name(child["name"])
+                if not key or key in seen_entities:
+                    result.duplicates += 1
+                    continue
+                if is_full():
+                    break
+                
+                seen_entities.add(key)
+                new_entities.append(DiscoveredEntity(
+                    id=generate_uuid(),
+                    name=child["name"][:255],
+                    depth=parent.depth + 1,
+                    path=parent.path + [child["name"]],
+                    relation=child.get("relation"),
+                    prominence=_score(child.get("prominence")),
+                    popularity=_score(child.get("popularity")),
+                    relevance=_score(child.get("relevance")),
+                ))
+        
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(frontier)),
+            thread_name_prefix="entity-discovery",
+        )
+        try:
+            pending = {
+                pool.submit(
+                    self._expand, client, entity, context, attributes_only
+                ): entity
+                for entity in frontier
+            }
+            
+            # Dedupe each response as it arrives, in completion order
+            for future in as_completed(list(pending)):
+                collect(pending.pop(future), future)
+                if is_full() and not attributes_only:
+                    break
+            
+            # Map is full: drop calls that have not started yet (their
+            # entities get attributes in the final pass) and keep the
+            # attributes of calls already running
+            for future in list(pending):
+                if future.cancel():
+                    skipped.append(pending.pop(future))
+            for future, parent in pending.items():
+                collect(parent, future)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        
+        # One transaction per round: entities, then attributes, then links
+        if new_entities:
+            self.session.execute(insert(Entity), [
+                self._entity_row(map_id, entity, "derived")
+                for entity in new_entities
+            ])
+        if attribute_rows:
+            self.session.execute(insert(Attribute), attribute_rows)
+        if link_rows:
+            self.session.execute(insert(EntityAttribute), link_rows)
+        self.session.commit()
+        
+        result.entities += len(new_entities)
+        result.attributes += len(attribute_rows)
+        result.links += len(link_rows)
+        return new_entities, skipped
+    
+    def _expand(
+        self,
+        client: Any,
+        entity: DiscoveredEntity,
+        context: Dict[str, str],
+        attributes_only: bool = False
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Ask the AI for an entity's related entities and attributes.
+        
+        Runs on a worker thread, so it must not touch the session.
+        
+        Args:
+            attributes_only: Only ask for attributes (no related entities)
+        
+        Returns:
+            (related entity dicts, attribute dicts), cleaned up
+        """
+        from modules.discovery.service import parse_json_response
+        
+        instruction = (
+            ATTRIBUTES_INSTRUCTION if attributes_only else EXPAND_INSTRUCTION
+        )
+        user_prompt = EXPANSION_USER_TEMPLATE.format(
+            entity=entity.name,
+            path=" > ".join(entity.path),
+            instruction=instruction.format(
+                children=self.children_per_entity,
+                attributes=self.attributes_per_entity,
+            ),
+            **context,
+        )
+        response = client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": ENTITY_EXPANSION_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=0.4,
+            max_tokens=2000,
+        )
+        data = parse_json_response(response.choices[0].message.content)
+        if not isinstance(data, dict):
+            raise ValueError("AI response is not a JSON object")
+        
+        children = [
+            item for item in data.get("entities") or []
+            if isinstance(item, dict) and str(item.get("name") or "").strip()
+        ][:0 if attributes_only else self.children_per_entity]
+        for child in children:
+            child["name"] = str(child["name"]).strip()
+        
+        attributes = []
+        for item in (data.get("attributes") or [])[:self.attributes_per_entity]:
+            if not isinstance(item, dict):
+                continue
+            name = str(item.get("name") or "").strip()
+            if not name:
+                continue
+            classification = str(item.get("classification") or "").lower()
+            section = str(item.get("section") or "").lower()
+            attributes.append({
+                "name": name,
+                "classification": (
+                    classification if classification in CLASSIFICATIONS
+                    else None
+                ),
+                "section": section if section in SECTIONS else "core",
+            })
+        
+        return children, attributes
+    
+    @staticmethod
+    def _entity_row(
+        map_id: str,
+        entity: DiscoveredEntity,
+        entity_type: str
+    ) -> Dict[str, Any]:
+        """Build an Entity insert row."""
+        return {
+            "id": entity.id,
+            "topical_map_id": map_id,
+            "name": entity.name,
+            "type": entity_type,
+            "properties": {
+                "depth": entity.depth,
+                "path": entity.path,
+                "relation": entity.relation,
+            },
+            "prominence_score": entity.prominence,
+            "popularity_score": entity.popularity,
+            "relevance_score": entity.relevance,
+        }
+
+
+def discover_topical_map(
+    project_id: str,
+    central_entity: Optional[str] = None,
+    map_name: Optional[str] = None,
+    job: Optional[JobStatus] = None,
+    **engine_options
+) -> DiscoveryResult:
+    """
+    Run entity discovery for a project and record it in the activity log.
+    
+    Args:
+        project_id: Project UUID
+        central_entity: Root entity (defaults to the project's)
+        map_name: Optional map name
+        job: Optional job status to report progress to
+        **engine_options: EntityDiscoveryEngine options (max_depth, ...)
+    
+    Returns:
+        DiscoveryResult
+    """
+    from modules.activity import log as activity
+    
+    def report(fraction: float, message: str):
+        if job:
+            job.progress = fraction
+            job.message = message
+    
+    engine = EntityDiscoveryEngine(**engine_options)
+    try:
+        result = engine.discover(
+            project_id,
+            central_entity=central_entity,
+            map_name=map_name,
+            progress=report,
+        )
+    finally:
+        engine.close()
+    
+    if result.project_deleted:
+        report(1.0, "Stopped: the project was deleted")
+        return result
+    
+    activity.record_event(
+        project_id,
+        activity.TOPICAL_MAP_CREATED,
+        f"AI discovered {result.entities} entities and "
+        f"{result.attributes} attributes",
+        subject_id=result.topical_map_id,
+        data={
+            "job": "entity_discovery",
+            "rounds": result.rounds,
+            "ai_calls": result.ai_calls,
+            "failed_calls": result.failed_calls,
+            "seconds": result.seconds,
+        },
+    )
+    return result
+
+
+def start_discovery(
+    project_id: str,
+    central_entity: Optional[str] = None,
+    map_name: Optional[str] = None,
+    **engine_options
+) -> JobStatus:
+    """
+    Start entity discovery on a background thread.
+    
+    Args:
+        project_id: Project UUID
+        central_entity: Root entity (defaults to the project's)
+        map_name: Optional map name
+        **engine_options: EntityDiscoveryEngine options (max_depth, ...)
+    
+    Returns:
+        Status of the discovery job (its result is the DiscoveryResult)
+    """
+    return run_in_background(
+        f"entity-discovery-{project_id}",
+        discover_topical_map,
+        project_id,
+        central_entity=central_entity,
+        map_name=map_name,
+        **engine_options,
+    )
\ No newline at end of file
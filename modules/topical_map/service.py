@@ -0,0 +1,124 @@
+"""Topical map service for reading a project's maps and entities."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from config.database import get_scoped_session, get_session_local
+from utils.database import Attribute, Entity, EntityAttribute, TopicalMap
+
+
+class TopicalMapService:
+    """Service for reading topical maps."""
+    
+    def __init__(self, db_session: Optional[Session] = None):
+        """
+        Initialize topical map service.
+        
+        Args:
+            db_session: Optional SQLAlchemy session (creates new if not provided)
+        """
+        self._session = db_session
+        self._owns_session = db_session is None
+    
+    @property
+    def session(self) -> Session:
+        """Get database session (the active db_scope session if any)."""
+        if self._session is None:
+            scoped = get_scoped_session()
+            if scoped is not None:
+                self._session = scoped
+                self._owns_session = False
+            else:
+                SessionLocal = get_session_local()
+                self._session = SessionLocal()
+        return self._session
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close session if we own it."""
+        if self._owns_session and self._session:
+            self._session.close()
+    
+    def list_maps(self, project_id: str) -> List[Dict[str, Any]]:
+        """
+        List a project's topical maps, newest first.
+        
+        Args:
+            project_id: Project UUID
+        
+        Returns:
+            Map dictionaries with "entity_count" and "attribute_count"
+        """
+        entity_count = (
+            select(func.count(Entity.id))
+            .where(Entity.topical_map_id == TopicalMap.id)
+            .scalar_subquery()
+        )
+        attribute_count = (
+            select(func.count(Attribute.id))
+            .where(Attribute.topical_map_id == TopicalMap.id)
+            .scalar_subquery()
+        )
+        
+        rows = self.session.execute(
+            select(TopicalMap, entity_count, attribute_count)
+            .where(TopicalMap.project_id == project_id)
+            .order_by(TopicalMap.created_at.desc())
+        ).all()
+        
+        return [
+            {
+                **topical_map.to_dict(),
+                "entity_count": entities,
+                "attribute_count": attributes,
+            }
+            for topical_map, entities, attributes in rows
+        ]
+    
+    def get_entities(
+        self,
+        map_id: str,
+        limit: int = 500
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a map's entities, central first, then by depth and PPR score.
+        
+        Args:
+            map_id: Topical map UUID
+            limit: Maximum entities returned
+        
+        Returns:
+            Entity dictionaries with "attribute_count"
+        """
+        attribute_count = (
+            select(func.count(EntityAttribute.attribute_id))
+            .where(EntityAttribute.entity_id == Entity.id)
+            .scalar_subquery()
+        )
+        total_score = (
+            Entity.prominence_score + Entity.popularity_score
+            + Entity.relevance_score
+        )
+        
+        rows = self.session.execute(
+            select(Entity, attribute_count)
+            .where(Entity.topical_map_id == map_id)
+            .order_by(
+                (Entity.type != "central"),
+                Entity.properties["depth"].as_integer(),
+                total_score.desc(),
+            )
+            .limit(limit)
+        ).all()
+        
+        return [
+            {**entity.to_dict(), "attribute_count": attributes}
+            for entity, attributes in rows
+        ]
\ No newline at end of file
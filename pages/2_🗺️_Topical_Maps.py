@@ -11,7 +11,13 @@ app_dir = Path(__file__).parent.parent
 if str(app_dir) not in sys.path:
     sys.path.insert(0, str(app_dir))
 
-from utils.session_state import init_session_state, require_project
+from config.database import db_scope
+from config.settings import get_settings
+from utils.session_state import (
+    init_session_state, require_project, get_current_project,
+    get_current_project_id,
+    set_current_topical_map, timed_run, fragment, rerun_fragment
+)
 
 st.set_page_config(
     page_title="Topical Maps - Semantic SEO Platform",
@@ -20,6 +26,10 @@ st.set_page_config(
 )
 
 
+# Entities listed per map
+ENTITY_TABLE_LIMIT = 500
+
+
 def main():
     init_session_state()
     
@@ -29,25 +39,182 @@ def main():
     if not require_project():
         st.stop()
     
-    st.info("🚧 **Coming in Phase 2**")
-    st.markdown("""
-    This module will include:
-    
-    ### Features
-    - **AI Entity Discovery** - Automatically discover entities and attributes
-    - **PPR Scoring** - Prominence, Popularity, Relevance scoring
-    - **Core/Outer Sections** - Organize monetization vs trust content
-    - **Attribute Classification** - Unique, Root, Rarer attributes
-    - **Visual Map Editor** - Drag-and-drop map building
-    - **Export Options** - JSON, CSV, Markdown
-    
-    ### Workflow
-    1. Define Central Entity
-    2. AI discovers related entities and attributes
-    3. Filter and score with PPR methodology
-    4. Classify into Core (monetization) and Outer (trust) sections
-    5. Process into content briefs
-    """)
+    with timed_run("topical_maps"), db_scope():
+        render_discovery()
+        st.divider()
+        render_maps()
+
+
+@fragment
+def render_discovery():
+    """Render the AI entity discovery form and the status of its job."""
+    from modules.topical_map.discovery import (
+        DEFAULT_MAX_DEPTH, DEFAULT_MAX_ENTITIES, start_discovery
+    )
+    from utils.jobs import get_job
+    
+    settings = get_settings()
+    project = get_current_project() or {}
+    
+    st.markdown("### 🤖 AI Entity Discovery")
+    st.markdown(
+        "Expand the central entity into related entities and their "
+        "attributes, one round per level. Each round asks the AI about "
+        "every entity found in the previous one, in parallel."
+    )
+    
+    job = get_job(st.session_state.get("discovery_job_id") or "")
+    if job and job.is_active:
+        st.progress(job.progress, text=f"Discovery: {job.message}")
+        if st.button("🔄 Refresh Status", key="refresh_discovery"):
+            rerun_fragment()
+        return
+    
+    if job and job.state == "done":
+        if st.session_state.get("discovery_job_shown") != job.id:
+            # Rerun the page once so the map list below includes the map
+            st.session_state.discovery_job_shown = job.id
+            st.rerun()
+        
+        result = job.result
+        st.success(
+            f"✅ {job.message} ({result.ai_calls} AI calls, "
+            f"{result.seconds:.0f}s)"
+        )
+        if result.failed_calls:
+            st.warning(
+                f"{result.failed_calls} AI calls failed; their entities "
+                f"were not expanded. First error: {result.errors[0]}"
+            )
+    elif job and job.state == "failed":
+        st.error(f"❌ Discovery failed: {job.message}")
+    
+    if not settings.has_any_ai_provider():
+        st.warning("No AI provider configured")
+        st.caption("Go to Settings page to add API keys")
+        return
+    
+    with st.form("entity_discovery"):
+        central_entity = st.text_input(
+            "Central Entity",
+            value=project.get("central_entity") or "",
+            help="Root of the map (defaults to the project's central entity)"
+        )
+        map_name = st.text_input(
+            "Map Name",
+            placeholder=f"{central_entity or 'Entity'} map"
+        )
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            max_depth = st.slider(
+                "Rounds",
+                min_value=1,
+                max_value=5,
+                value=DEFAULT_MAX_DEPTH,
+                help="Levels of related entities below the central entity"
+            )
+        with col2:
+            max_entities = st.number_input(
+                "Max Entities",
+                min_value=10,
+                max_value=5000,
+                value=DEFAULT_MAX_ENTITIES,
+                step=50
+            )
+        with col3:
+            max_concurrency = st.slider(
+                "Parallel AI Calls",
+                min_value=1,
+                max_value=32,
+                value=min(settings.ai.max_concurrency, 32),
+                help="Lower this if your provider rate-limits you"
+            )
+        
+        submitted = st.form_submit_button(
+            "🚀 Start Discovery", type="primary"
+        )
+    
+    if submitted:
+        if not central_entity.strip():
+            st.error("Please enter a central entity")
+            return
+        
+        job = start_discovery(
+            get_current_project_id(),
+            central_entity=central_entity.strip(),
+            map_name=map_name.strip() or None,
+            max_depth=max_depth,
+            max_entities=int(max_entities),
+            max_concurrency=max_concurrency,
+        )
+        st.session_state.discovery_job_id = job.id
+        rerun_fragment()
+
+
+@fragment
+def render_maps():
+    """Render the project's topical maps and the selected map's entities."""
+    from modules.topical_map.service import TopicalMapService
+    
+    st.markdown("### 🗺️ Topical Maps")
+    
+    try:
+        with TopicalMapService() as map_service:
+            maps = map_service.list_maps(get_current_project_id())
+            
+            if not maps:
+                st.info(
+                    "No topical maps yet. Start a discovery above to build "
+                    "one from your central entity."
+                )
+                return
+            
+            labels = {
+                m["id"]: (
+                    f"{m['name']} ({m['entity_count']} entities, "
+                    f"{m['attribute_count']} attributes)"
+                )
+                for m in maps
+            }
+            current = st.session_state.get("current_topical_map_id")
+            map_id = st.selectbox(
+                "Map",
+                options=list(labels),
+                format_func=labels.get,
+                index=list(labels).index(current) if current in labels else 0,
+                key="topical_map_select"
+            )
+            if map_id != current:
+                set_current_topical_map(map_id)
+            
+            entities = map_service.get_entities(
+                map_id, limit=ENTITY_TABLE_LIMIT
+            )
+    except Exception as e:
+        st.error(f"Error loading topical maps: {e}")
+        return
+    
+    st.dataframe(
+        [
+            {
+                "Entity": e["name"],
+                "Type": e["type"],
+                "Depth": (e["properties"] or {}).get("depth"),
+                "Path": " > ".join((e["properties"] or {}).get("path") or []),
+                "PPR": e["total_score"],
+                "Attributes": e["attribute_count"],
+            }
+            for e in entities
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+    if len(entities) == ENTITY_TABLE_LIMIT:
+        st.caption(
+            f"Showing the first {ENTITY_TABLE_LIMIT} entities by depth "
+            "and PPR score"
+        )
 
 
 if __name__ == "__main__":
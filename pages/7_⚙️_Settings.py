@@ -22,14 +22,23 @@ if str(app_dir) not in sys.path:
     sys.path.insert(0, str(app_dir))
 
 from config.settings import get_settings, Settings
+from config.database import db_scope
 from config.ai_providers import AI_PROVIDERS, get_provider_config
-from utils.session_state import init_session_state
+from utils.session_state import (
+    init_session_state, timed_run, fragment, rerun_fragment
+)
 
 
 def main():
     """Main settings page."""
     init_session_state()
     
+    with timed_run("settings"), db_scope():
+        render_settings()
+
+
+def render_settings():
+    """Render the settings tabs for one script run."""
     st.title("⚙️ Settings")
     st.markdown("Configure API keys and application settings")
     
@@ -41,6 +50,7 @@ def main():
         "🎨 Appearance"
     ])
     
+    # Each tab is a fragment, so its widgets rerun only that tab
     with tabs[0]:
         render_ai_settings()
     
@@ -54,6 +64,7 @@ def main():
         render_appearance_settings()
 
 
+@fragment
 def render_ai_settings():
     """Render AI provider settings."""
     st.markdown("### 🤖 AI Provider Configuration")
@@ -224,6 +235,7 @@ def render_ai_settings():
         st.info("Restart the app to apply changes")
 
 
+@fragment
 def render_integration_settings():
     """Render integration settings (GSC, SERP, etc.)."""
     st.markdown("### 🔗 External Integrations")
@@ -287,6 +299,7 @@ def render_integration_settings():
             st.success("✓ Serper key configured")
 
 
+@fragment
 def render_data_settings():
     """Render data and export settings."""
     st.markdown("### 💾 Data Management")
@@ -295,21 +308,40 @@ def render_data_settings():
     
     # Database info
     with st.expander("🗄️ Database", expanded=True):
-        db_path = settings.get_database_path()
-        
-        st.markdown(f"**Database Location:** `{db_path}`")
+        from config.database import get_database_url
+        from sqlalchemy.engine import make_url
+        
+        database_url = get_database_url(str(settings.get_database_path()))
+        url = make_url(database_url)
+        # Snapshots need a database file (not a server or :memory:)
+        is_sqlite = (
+            url.get_backend_name() == "sqlite"
+            and url.database not in (None, "", ":memory:")
+        )
         
-        if db_path.exists():
-            size_mb = db_path.stat().st_size / (1024 * 1024)
-            st.markdown(f"**Size:** {size_mb:.2f} MB")
-            st.success("✓ Database exists")
+        if is_sqlite:
+            db_path = Path(url.database)
+            
+            st.markdown(f"**Database Location:** `{db_path}`")
+            
+            if db_path.exists():
+                size_mb = db_path.stat().st_size / (1024 * 1024)
+                st.markdown(f"**Size:** {size_mb:.2f} MB")
+                st.success("✓ Database exists")
+            else:
+                st.warning("Database not yet created")
         else:
-            st.warning("Database not yet created")
+            safe_url = url.render_as_string(hide_password=True)
+            st.markdown(f"**Database Server:** `{safe_url}`")
+            st.caption(
+                "Shared database - back it up with your server's tools "
+                "(e.g. pg_dump)."
+            )
         
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button("🔄 Backup Database", key="backup_db"):
+            if is_sqlite and st.button("🔄 Backup Database", key="backup_db"):
                 backup_database(db_path)
         
         with col2:
@@ -322,14 +354,20 @@ def render_data_settings():
             with col1:
                 if st.button("Yes, Reset", type="primary"):
                     from config.database import reset_db
+                    from utils.shared_cache import bump_version
                     reset_db()
+                    bump_version()
                     st.session_state.confirm_reset = False
                     st.success("Database reset complete")
                     st.rerun()
             with col2:
                 if st.button("Cancel"):
                     st.session_state.confirm_reset = False
-                    st.rerun()
+                    rerun_fragment()
+        
+        if is_sqlite:
+            st.markdown("---")
+            render_backup_section()
     
     # Export settings
     with st.expander("📤 Export Settings"):
@@ -337,18 +375,14 @@ def render_data_settings():
         
         st.markdown(f"**Export Directory:** `{export_path}`")
         
-        # List existing exports
-        if export_path.exists():
-            exports = list(export_path.glob("*"))
-            if exports:
-                st.markdown(f"**Exports:** {len(exports)} files")
-                
-                if st.button("🗑️ Clear Exports", key="clear_exports"):
-                    for f in exports:
-                        f.unlink()
-                    st.success("Exports cleared")
-            else:
-                st.info("No exports yet")
+        render_project_export()
+        render_markdown_bundle()
+        
+        st.markdown("---")
+        render_project_import()
+        
+        st.markdown("---")
+        render_export_cache(settings)
     
     # Cloud sync (future)
     with st.expander("☁️ Cloud Sync (Coming Soon)"):
@@ -367,6 +401,7 @@ def render_data_settings():
         st.info("Cloud sync is coming in a future update")
 
 
+@fragment
 def render_appearance_settings():
     """Render appearance and UI settings."""
     st.markdown("### 🎨 Appearance")
@@ -455,23 +490,284 @@ def save_api_keys_to_env(
 
 
 def backup_database(db_path: Path):
-    """Create a backup of the database."""
-    import shutil
-    from datetime import datetime
+    """Start a consistent, incremental backup of the database."""
+    from utils.backup import start_backup
     
     if not db_path.exists():
         st.error("Database does not exist")
         return
     
-    backup_dir = db_path.parent / "backups"
-    backup_dir.mkdir(exist_ok=True)
+    job = start_backup()
+    st.session_state.backup_job_id = job.id
+    st.info("⏳ Backup started in the background")
+
+
+def render_backup_section():
+    """Render backup job status, snapshot list and restore controls."""
+    from utils.backup import BackupManager, start_restore
+    from utils.jobs import get_job
+    
+    # Status of the last backup/restore started from this session
+    for key, label in (
+        ("backup_job_id", "Backup"),
+        ("restore_job_id", "Restore"),
+    ):
+        job = get_job(st.session_state.get(key) or "")
+        if not job:
+            continue
+        
+        if job.is_active:
+            st.progress(job.progress, text=f"{label}: {job.message}")
+            if st.button("🔄 Refresh Status", key=f"refresh_{key}"):
+                rerun_fragment()
+        elif job.state == "done":
+            st.success(f"✅ {label} complete. {job.message}")
+        else:
+            st.error(f"❌ {label} failed: {job.message}")
+    
+    manager = BackupManager.from_settings()
+    snapshots = manager.list_snapshots()
+    
+    if not snapshots:
+        st.caption("No backups yet")
+        return
+    
+    storage_mb = manager.get_storage_size() / (1024 * 1024)
+    st.markdown(
+        f"**Backups:** {len(snapshots)} snapshots "
+        f"({storage_mb:.2f} MB stored, keeping {manager.retention})"
+    )
+    
+    st.dataframe(
+        [
+            {
+                "Snapshot": s.id,
+                "Created": s.created_at[:19].replace("T", " "),
+                "Size (MB)": round(s.size / (1024 * 1024), 2),
+                "New data (MB)": round(s.stored_bytes / (1024 * 1024), 2),
+            }
+            for s in snapshots
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+    
+    snapshot_id = st.selectbox(
+        "Restore from snapshot",
+        options=[s.id for s in snapshots],
+        key="restore_snapshot_id"
+    )
+    
+    if st.button("♻️ Restore Snapshot", key="restore_db"):
+        st.session_state.confirm_restore = True
+    
+    if st.session_state.get("confirm_restore"):
+        st.warning(
+            f"This will REPLACE the current database with snapshot "
+            f"{snapshot_id}. Are you sure?"
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Yes, Restore", type="primary"):
+                job = start_restore(snapshot_id, manager)
+                st.session_state.restore_job_id = job.id
+                st.session_state.confirm_restore = False
+                rerun_fragment()
+        with col2:
+            if st.button("Cancel", key="cancel_restore"):
+                st.session_state.confirm_restore = False
+                rerun_fragment()
+
+
+def render_project_export():
+    """Render streamed export of the current project."""
+    from utils.session_state import get_current_project
+    
+    project = get_current_project()
+    if not project:
+        st.caption("Select a project to export it")
+        return
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        format = st.radio(
+            "Project export format",
+            options=["ndjson", "zip", "xlsx", "parquet", "arrow"],
+            format_func=lambda f: {
+                "ndjson": "NDJSON (one row per line)",
+                "zip": "Zip of per-table JSON files",
+                "xlsx": "Excel workbook (one sheet per table)",
+                "parquet": "Parquet dataset (for notebooks)",
+                "arrow": "Arrow IPC files (for notebooks)",
+            }[f],
+            horizontal=True,
+            key="project_export_format"
+        )
+    
+    with col2:
+        if st.button("📦 Export Project", key="export_project"):
+            from modules.project.export import COLUMNAR_FORMATS
+            from modules.project.service import ProjectService
+            
+            st.session_state.project_export_path = None
+            st.session_state.project_export = None
+            
+            with st.spinner("Exporting project..."):
+                with ProjectService() as service:
+                    if format in COLUMNAR_FORMATS:
+                        path = service.export_project_to_file(
+                            project["id"], format=format
+                        )
+                        st.session_state.project_export_path = (
+                            str(path) if path else None
+                        )
+                    else:
+                        artifact = service.get_export_artifact(
+                            project["id"], format=format
+                        )
+                        st.session_state.project_export = (
+                            artifact.to_dict() if artifact else None
+                        )
+    
+    export_dir = st.session_state.get("project_export_path")
+    export = st.session_state.get("project_export")
+    if export_dir and Path(export_dir).is_dir():
+        # Columnar exports are directories, read in place by notebooks
+        st.success(f"Exported to `{export_dir}`")
+    elif export and Path(export["path"]).exists():
+        if export["created_at"] != export["last_used"]:
+            st.caption(
+                "♻️ Nothing changed since this export was made on "
+                f"{export['created_at'][:19].replace('T', ' ')} UTC"
+            )
+        size_mb = export["size"] / (1024 * 1024)
+        with open(export["path"], "rb") as f:
+            st.download_button(
+                f"⬇️ Download {export['filename']} ({size_mb:.2f} MB)",
+                data=f,
+                file_name=export["filename"],
+                key="download_project_export"
+            )
+
+
+def render_markdown_bundle():
+    """Render the bulk Markdown export of the current project."""
+    from modules.project.export import start_markdown_bundle
+    from utils.jobs import get_job
+    from utils.session_state import get_current_project
+    
+    project = get_current_project()
+    if not project:
+        return
+    
+    if st.button("📝 Export Briefs & Maps as Markdown", key="markdown_bundle"):
+        job = start_markdown_bundle(project["id"])
+        st.session_state.markdown_bundle_job_id = job.id
+    
+    job = get_job(st.session_state.get("markdown_bundle_job_id") or "")
+    if not job:
+        return
+    
+    if job.is_active:
+        st.progress(job.progress, text=f"Markdown bundle: {job.message}")
+        if st.button("🔄 Refresh Status", key="refresh_markdown_bundle"):
+            rerun_fragment()
+    elif job.state == "done" and job.result and job.result.path.exists():
+        bundle = job.result
+        st.caption(job.message)
+        with open(bundle.path, "rb") as f:
+            st.download_button(
+                f"⬇️ Download {bundle.filename}",
+                data=f,
+                file_name=bundle.filename,
+                mime="application/zip",
+                key="download_markdown_bundle"
+            )
+    elif job.state == "failed":
+        st.error(f"❌ Markdown bundle failed: {job.message}")
+
+
+def render_export_cache(settings):
+    """Render usage of the export artifact cache and other export files."""
+    from utils.artifacts import ExportArtifactStore
+    from utils.export import ExportHandler
+    
+    store = ExportArtifactStore.from_settings(settings)
+    artifacts = store.list_artifacts()
+    
+    if artifacts:
+        used_mb = store.get_storage_size() / (1024 * 1024)
+        st.markdown(
+            f"**Cached exports:** {len(artifacts)} "
+            f"({used_mb:.2f} of {settings.export.max_artifact_mb} MB)"
+        )
+        st.caption(
+            "Unchanged projects reuse their cached export. The least "
+            "recently used exports are removed automatically when the "
+            "cache is full."
+        )
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = backup_dir / f"semantic_seo_{timestamp}.db"
+    # Columnar exports and older files are not managed by the cache
+    handler = ExportHandler(settings.get_export_path())
+    others = handler.list_unmanaged(managed=[store.path])
     
-    shutil.copy(db_path, backup_path)
+    if not artifacts and not others:
+        st.info("No exports yet")
+        return
     
-    st.success(f"✅ Backup created: {backup_path}")
+    if others:
+        other_mb = handler.get_size(others) / (1024 * 1024)
+        st.markdown(
+            f"**Other exports:** {len(others)} files and folders "
+            f"({other_mb:.2f} MB)"
+        )
+        st.caption(
+            "Parquet/Arrow exports and files from before the cache are "
+            "kept until you clear them."
+        )
+        
+        if st.button("🗑️ Clear Other Exports", key="clear_exports"):
+            removed = handler.remove_exports(others)
+            st.session_state.project_export_path = None
+            st.success(f"Removed {removed} exports")
+
+
+def render_project_import():
+    """Render import of a project export as a new project."""
+    uploaded = st.file_uploader(
+        "Import project (NDJSON, zip or JSON export)",
+        type=["ndjson", "zip", "json"],
+        key="project_import_file"
+    )
+    
+    if not uploaded:
+        return
+    
+    name = st.text_input(
+        "New project name (optional)",
+        key="project_import_name"
+    )
+    
+    if st.button("📥 Import Project", key="import_project"):
+        from modules.project.service import ProjectService
+        from utils.session_state import set_current_project
+        
+        try:
+            with st.spinner("Importing project..."):
+                with ProjectService() as service:
+                    result = service.import_project(
+                        uploaded, name=name or None
+                    )
+        except ValueError as e:
+            st.error(f"❌ Import failed: {e}")
+            return
+        
+        set_current_project(result["project"])
+        rows = sum(result["counts"].values())
+        st.success(
+            f"✅ Imported '{result['project']['name']}' ({rows} rows)"
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+"""Round trip of streamed project exports through the importer."""
+
+import io
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from modules.project.export import ProjectExporter
+from modules.project.importer import ProjectImporter
+from utils.content_store import ContentStore
+from utils.database import (
+    Base, Project, TopicalMap, Entity, Attribute, ContentBrief,
+    BriefSection, Publication, QueryData
+)
+from utils.export import ExportHandler
+
+
+QUERY_DATA_ROWS = 3
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def project_id(session):
+    project = Project(name="Coffee")
+    session.add(project)
+    session.flush()
+    
+    topical_map = TopicalMap(project_id=project.id, name="Coffee map")
+    session.add(topical_map)
+    session.flush()
+    
+    entity = Entity(topical_map_id=topical_map.id, name="Espresso")
+    attribute = Attribute(topical_map_id=topical_map.id, name="Grind size")
+    session.add_all([entity, attribute])
+    session.flush()
+    
+    brief = ContentBrief(
+        project_id=project.id,
+        entity_id=entity.id,
+        attribute_id=attribute.id,
+    )
+    session.add(brief)
+    session.flush()
+    
+    session.add(BriefSection(
+        brief_id=brief.id,
+        heading_level=2,
+        heading_text="How fine should espresso be ground?",
+        order_position=0,
+    ))
+    
+    content_hash, content_size = ContentStore(session).put("<p>Fine.</p>")
+    publication = Publication(
+        brief_id=brief.id,
+        url="https://example.com/espresso-grind",
+        content_hash=content_hash,
+        content_size=content_size,
+    )
+    session.add(publication)
+    session.flush()
+    
+    session.add_all([
+        QueryData(
+            publication_id=publication.id,
+            query=f"espresso grind size {day}",
+            clicks=day,
+            impressions=10 * day,
+            date=date(2026, 1, day),
+        )
+        for day in range(1, QUERY_DATA_ROWS + 1)
+    ])
+    session.commit()
+    
+    return project.id
+
+
+def count_query_data(session, project_id):
+    return session.scalar(
+        select(func.count(QueryData.id))
+        .join(Publication, Publication.id == QueryData.publication_id)
+        .join(ContentBrief, ContentBrief.id == Publication.brief_id)
+        .where(ContentBrief.project_id == project_id)
+    )
+
+
+@pytest.mark.parametrize("format", ["ndjson", "zip"])
+def test_round_trip_keeps_query_data(session, project_id, tmp_path, format):
+    stream = io.BytesIO()
+    written = ProjectExporter(session).write(
+        project_id, stream, format=format,
+        handler=ExportHandler(export_path=tmp_path),
+    )
+    assert written["query_data"] == QUERY_DATA_ROWS
+    
+    stream.seek(0)
+    result = ProjectImporter(session).run(stream, name="Coffee (copy)")
+    new_id = result["project"]["id"]
+    
+    assert new_id != project_id
+    assert result["counts"]["query_data"] == QUERY_DATA_ROWS
+    assert count_query_data(session, new_id) == QUERY_DATA_ROWS
+    assert count_query_data(session, project_id) == QUERY_DATA_ROWS
+    
+    imported = session.scalars(
+        select(QueryData.clicks)
+        .join(Publication, Publication.id == QueryData.publication_id)
+        .join(ContentBrief, ContentBrief.id == Publication.brief_id)
+        .where(ContentBrief.project_id == new_id)
+        .order_by(QueryData.date)
+    ).all()
+    assert imported == list(range(1, QUERY_DATA_ROWS + 1))
\ No newline at end of file
@@ -1,42 +1,36 @@
-"""Utilities package for Semantic SEO Platform."""
+"""Utilities package for Semantic SEO Platform.
 
-from utils.database import (
-    Base,
-    Project,
-    TopicalMap,
-    Entity,
-    Attribute,
-    EntityAttribute,
-    ContentBrief,
-    BriefSection,
-    InternalLink,
-    Publication,
-    QueryData,
-)
-from utils.session_state import (
-    init_session_state,
-    get_current_project,
-    set_current_project,
-)
-from utils.export import ExportHandler
+Package-level names are imported on first access (PEP 562), so importing
+a submodule such as ``utils.session_state`` does not load the database
+models or the export stack.
+"""
 
-__all__ = [
+from __future__ import annotations
+
+from utils.lazy import lazy_module
+
+# Public name -> defining module
+__getattr__, __dir__, __all__ = lazy_module(__name__, {
     # Database models
-    "Base",
-    "Project",
-    "TopicalMap",
-    "Entity",
-    "Attribute",
-    "EntityAttribute",
-    "ContentBrief",
-    "BriefSection",
-    "InternalLink",
-    "Publication",
-    "QueryData",
+    "Base": "utils.database",
+    "Project": "utils.database",
+    "TopicalMap": "utils.database",
+    "Entity": "utils.database",
+    "Attribute": "utils.database",
+    "EntityAttribute": "utils.database",
+    "ContentBrief": "utils.database",
+    "BriefSection": "utils.database",
+    "BriefRevision": "utils.database",
+    "InternalLink": "utils.database",
+    "ContentBlob": "utils.database",
+    "Publication": "utils.database",
+    "QueryData": "utils.database",
+    "ActivityEvent": "utils.database",
+    "DashboardSnapshot": "utils.database",
     # Session state
-    "init_session_state",
-    "get_current_project",
-    "set_current_project",
+    "init_session_state": "utils.session_state",
+    "get_current_project": "utils.session_state",
+    "set_current_project": "utils.session_state",
     # Export
-    "ExportHandler",
-]
\ No newline at end of file
+    "ExportHandler": "utils.export",
+})
\ No newline at end of file
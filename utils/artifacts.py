@@ -0,0 +1,296 @@
+"""Content-addressed store for generated export files.
+
+An export is identified by what it was generated from: project, format,
+options and a version hash of the project's data. Asking for an export
+whose key is already stored returns the existing file without
+regenerating it. Files are stored once under their content hash, so
+identical exports made under different keys share one copy.
+
+The store keeps itself within a size quota and an entry count, evicting
+the least recently used artifacts first.
+
+Layout of the artifact directory::
+    
+    blobs/<ab>/<sha256>.<ext>   artifact contents, stored once
+    index.json                  key -> artifact entry
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+_lock = threading.RLock()
+
+
+@dataclass
+class ExportArtifact:
+    """A stored export file."""
+    key: str
+    path: Path
+    filename: str  # Download name
+    size: int
+    created_at: str
+    last_used: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        data = asdict(self)
+        data["path"] = str(self.path)
+        return data
+
+
+def artifact_key(**parts: Any) -> str:
+    """
+    Build an artifact key from what an export was generated from.
+    
+    Args:
+        **parts: JSON-serializable key parts, e.g. project_id, format,
+            options and data_version
+    
+    Returns:
+        SHA-256 hex key
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExportArtifactStore:
+    """Cache generated exports by key, deduplicated by content."""
+    
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 500 * 1024 * 1024,
+        max_entries: int = 100
+    ):
+        """
+        Initialize artifact store.
+        
+        Args:
+            path: Directory holding blobs and the index
+            max_bytes: Size quota for stored blobs
+            max_entries: Maximum number of keys kept
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_entries = max(max_entries, 1)
+        
+        self.blobs_path = self.path / "blobs"
+        self.index_path = self.path / "index.json"
+        self.blobs_path.mkdir(parents=True, exist_ok=True)
+    
+    @classmethod
+    def from_settings(cls, settings=None) -> "ExportArtifactStore":
+        """Create an artifact store from application settings."""
+        if settings is None:
+            from config.settings import get_settings
+            settings = get_settings()
+        
+        return cls(
+            path=settings.get_export_path() / "artifacts",
+            max_bytes=settings.export.max_artifact_mb * 1024 * 1024,
+            max_entries=settings.export.max_artifacts,
+        )
+    
+    def get(self, key: str) -> Optional[ExportArtifact]:
+        """
+        Get a stored artifact and mark it as recently used.
+        
+        Args:
+            key: Artifact key
+        
+        Returns:
+            Artifact or None if not stored
+        """
+        with _lock:
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is None:
+                return None
+            
+            if not self._blob_path(entry).exists():
+                del index[key]
+                self._write_index(index)
+                return None
+            
+            entry["last_used"] = datetime.utcnow().isoformat()
+            self._write_index(index)
+            
+            return self._artifact(key, entry)
+    
+    def get_or_create(
+        self,
+        key: str,
+        filename: str,
+        write: Callable[[Path], Any]
+    ) -> ExportArtifact:
+        """
+        Get a stored artifact or generate and store it.
+        
+        Args:
+            key: Artifact key
+            filename: Download name (its suffix is kept on the blob)
+            write: Function writing the export to the given path
+        
+        Returns:
+            Stored artifact
+        """
+        artifact = self.get(key)
+        if artifact is not None:
+            return artifact
+        
+        tmp = self.path / f".{uuid.uuid4().hex}{Path(filename).suffix}"
+        try:
+            write(tmp)
+            return self.put(key, tmp, filename)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+    
+    def put(self, key: str, source: Path, filename: str) -> ExportArtifact:
+        """
+        Store a generated file under a key.
+        
+        The file is moved into the store; if identical content is already
+        stored it is dropped and the existing blob is shared.
+        
+        Args:
+            key: Artifact key
+            source: Generated file (on the same filesystem as the store)
+            filename: Download name
+        
+        Returns:
+            Stored artifact
+        """
+        source = Path(source)
+        blob_hash = self._hash_file(source)
+        suffix = Path(filename).suffix
+        
+        with _lock:
+            blob = self.blobs_path / blob_hash[:2] / f"{blob_hash}{suffix}"
+            if blob.exists():
+                source.unlink()
+            else:
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(source, blob)
+            
+            now = datetime.utcnow().isoformat()
+            index = self._read_index()
+            index[key] = {
+                "blob": str(blob.relative_to(self.blobs_path)),
+                "filename": filename,
+                "size": blob.stat().st_size,
+                "created_at": now,
+                "last_used": now,
+            }
+            self._evict(index, keep=key)
+            self._write_index(index)
+            
+            return self._artifact(key, index[key])
+    
+    def list_artifacts(self) -> List[ExportArtifact]:
+        """
+        List stored artifacts, most recently used first.
+        
+        Returns:
+            List of artifacts
+        """
+        with _lock:
+            index = self._read_index()
+        
+        artifacts = [self._artifact(k, e) for k, e in index.items()]
+        return sorted(artifacts, key=lambda a: a.last_used, reverse=True)
+    
+    def get_storage_size(self) -> int:
+        """Get total bytes used by stored blobs."""
+        return sum(
+            f.stat().st_size for f in self.blobs_path.glob("*/*")
+            if not f.name.startswith(".")
+        )
+    
+    def clear(self) -> int:
+        """
+        Remove every artifact.
+        
+        Returns:
+            Number of removed keys
+        """
+        with _lock:
+            index = self._read_index()
+            self._write_index({})
+            self._collect_garbage({})
+        return len(index)
+    
+    def _evict(self, index: Dict[str, Dict[str, Any]], keep: str):
+        """Drop least recently used keys beyond the count and size quota."""
+        by_age = sorted(
+            (k for k in index if k != keep),
+            key=lambda k: index[k]["last_used"]
+        )
+        
+        def stored_bytes():
+            blobs = {e["blob"]: e["size"] for e in index.values()}
+            return sum(blobs.values())
+        
+        while by_age and (
+            len(index) > self.max_entries or stored_bytes() > self.max_bytes
+        ):
+            del index[by_age.pop(0)]
+        
+        self._collect_garbage(index)
+    
+    def _collect_garbage(self, index: Dict[str, Dict[str, Any]]) -> int:
+        """Remove blobs no key refers to."""
+        referenced = {e["blob"] for e in index.values()}
+        
+        removed = 0
+        for blob in self.blobs_path.glob("*/*"):
+            if str(blob.relative_to(self.blobs_path)) not in referenced:
+                blob.unlink()
+                removed += 1
+        
+        return removed
+    
+    def _artifact(self, key: str, entry: Dict[str, Any]) -> ExportArtifact:
+        return ExportArtifact(
+            key=key,
+            path=self._blob_path(entry),
+            filename=entry["filename"],
+            size=entry["size"],
+            created_at=entry["created_at"],
+            last_used=entry["last_used"],
+        )
+    
+    def _blob_path(self, entry: Dict[str, Any]) -> Path:
+        return self.blobs_path / entry["blob"]
+    
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self.index_path.exists():
+            return {}
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def _write_index(self, index: Dict[str, Dict[str, Any]]):
+        tmp = self.index_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp, self.index_path)
\ No newline at end of file
@@ -0,0 +1,538 @@
+"""Online, incremental database backups.
+
+Backups are taken with SQLite's online backup API, which copies the
+database a few pages at a time and restarts if another connection writes
+mid-copy, so the result is always a consistent snapshot and writers are
+never blocked for long.
+
+The consistent copy is then split into fixed-size segments on page
+boundaries. Every segment is stored once, compressed and keyed by its
+content hash, and a snapshot is just a JSON manifest listing its segments.
+Unchanged pages are shared between snapshots, so each new backup of a
+large database only stores what changed since the previous one.
+
+Layout of the backup directory::
+    
+    chunks/<ab>/<sha256>.<codec>   compressed segments
+    snapshots/<snapshot_id>.json   snapshot manifests
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from utils import compression
+from utils.jobs import JobStatus, run_in_background
+
+
+BACKUP_JOB_NAME = "database-backup"
+RESTORE_JOB_NAME = "database-restore"
+
+# Held while snapshots are written, deleted or restored and while segments
+# are collected, so garbage collection never removes a segment that a
+# running snapshot has matched but not yet listed in its manifest
+_store_lock = threading.RLock()
+
+
+@dataclass
+class SnapshotInfo:
+    """Summary of a stored snapshot."""
+    id: str
+    created_at: str
+    page_size: int
+    page_count: int
+    size: int  # Uncompressed database size in bytes
+    chunk_count: int
+    new_chunks: int  # Segments written by this snapshot
+    stored_bytes: int  # Compressed bytes written by this snapshot
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class BackupManager:
+    """Create, rotate and restore incremental SQLite snapshots."""
+    
+    def __init__(
+        self,
+        db_path: Path,
+        backup_path: Path,
+        retention: int = 10,
+        pages_per_step: int = 1024,
+        pages_per_chunk: int = 256,
+        compression_level: int = compression.DEFAULT_LEVEL,
+    ):
+        """
+        Initialize backup manager.
+        
+        Args:
+            db_path: Path of the live SQLite database
+            backup_path: Directory holding chunks and manifests
+            retention: Number of snapshots to keep
+            pages_per_step: Pages copied per online-backup step
+            pages_per_chunk: Pages per stored segment
+            compression_level: Compression level for segments
+        """
+        self.db_path = Path(db_path)
+        self.backup_path = Path(backup_path)
+        self.retention = max(retention, 1)
+        self.pages_per_step = pages_per_step
+        self.pages_per_chunk = pages_per_chunk
+        self.compression_level = compression_level
+        
+        self.chunks_path = self.backup_path / "chunks"
+        self.snapshots_path = self.backup_path / "snapshots"
+        self.chunks_path.mkdir(parents=True, exist_ok=True)
+        self.snapshots_path.mkdir(parents=True, exist_ok=True)
+    
+    @classmethod
+    def from_settings(cls, settings=None) -> "BackupManager":
+        """
+        Create a backup manager from application settings.
+        
+        The database file is taken from the database URL the engine is
+        built from (see get_database_url), so snapshots always cover the
+        database the app actually uses.
+        
+        Raises:
+            ValueError: If the database is not an SQLite file
+        """
+        from sqlalchemy.engine import make_url
+        from config.database import get_database_url
+        
+        if settings is None:
+            from config.settings import get_settings
+            settings = get_settings()
+        
+        url = make_url(get_database_url(
+            str(settings.get_database_path()), settings.database.url
+        ))
+        if url.get_backend_name() != "sqlite" or url.database in (
+            None, "", ":memory:"
+        ):
+            raise ValueError(
+                "Snapshots need an SQLite database file, not "
+                f"{url.render_as_string(hide_password=True)}"
+            )
+        
+        return cls(
+            db_path=Path(url.database),
+            backup_path=settings.get_backup_path(),
+            retention=settings.backup.retention,
+            pages_per_step=settings.backup.pages_per_step,
+            pages_per_chunk=settings.backup.pages_per_chunk,
+            compression_level=settings.backup.compression_level,
+        )
+    
+    # Snapshots
+    
+    def create_snapshot(self, job: Optional[JobStatus] = None) -> SnapshotInfo:
+        """
+        Take a consistent snapshot of the live database.
+        
+        Args:
+            job: Optional job status to report progress to
+        
+        Returns:
+            Info about the new snapshot
+        """
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Database does not exist: {self.db_path}")
+        
+        snapshot_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        fd, tmp_name = tempfile.mkstemp(
+            prefix="snapshot_", suffix=".db", dir=self.backup_path
+        )
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        
+        with _store_lock:
+            try:
+                self._online_copy(tmp_path, job)
+                page_size, page_count = self._read_page_info(tmp_path)
+                
+                chunks, new_chunks, stored_bytes = self._store_chunks(
+                    tmp_path, page_size, job
+                )
+                
+                info = SnapshotInfo(
+                    id=snapshot_id,
+                    created_at=datetime.now().isoformat(),
+                    page_size=page_size,
+                    page_count=page_count,
+                    size=tmp_path.stat().st_size,
+                    chunk_count=len(chunks),
+                    new_chunks=new_chunks,
+                    stored_bytes=stored_bytes,
+                )
+                
+                manifest = info.to_dict()
+                manifest["pages_per_chunk"] = self.pages_per_chunk
+                manifest["chunks"] = chunks
+                self._write_json(
+                    self.snapshots_path / f"{snapshot_id}.json", manifest
+                )
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            
+            self.rotate()
+        
+        if job:
+            job.message = (
+                f"Snapshot {snapshot_id}: {new_chunks} new of "
+                f"{len(chunks)} segments"
+            )
+        
+        return info
+    
+    def list_snapshots(self) -> List[SnapshotInfo]:
+        """
+        List stored snapshots, newest first.
+        
+        Returns:
+            List of snapshot infos
+        """
+        snapshots = []
+        for path in sorted(self.snapshots_path.glob("*.json"), reverse=True):
+            manifest = self._read_json(path)
+            snapshots.append(SnapshotInfo(**{
+                k: manifest[k] for k in SnapshotInfo.__dataclass_fields__
+            }))
+        return snapshots
+    
+    def delete_snapshot(self, snapshot_id: str) -> bool:
+        """
+        Delete a snapshot and garbage-collect unreferenced segments.
+        
+        Args:
+            snapshot_id: Snapshot ID
+        
+        Returns:
+            True if deleted, False if not found
+        """
+        path = self.snapshots_path / f"{snapshot_id}.json"
+        with _store_lock:
+            if not path.exists():
+                return False
+            
+            path.unlink()
+            self.collect_garbage()
+        return True
+    
+    def rotate(self) -> List[str]:
+        """
+        Delete snapshots beyond the retention count.
+        
+        Returns:
+            IDs of deleted snapshots
+        """
+        manifests = sorted(self.snapshots_path.glob("*.json"), reverse=True)
+        deleted = []
+        for path in manifests[self.retention:]:
+            path.unlink()
+            deleted.append(path.stem)
+        
+        if deleted:
+            self.collect_garbage()
+        
+        return deleted
+    
+    def collect_garbage(self) -> int:
+        """
+        Remove segments no snapshot refers to.
+        
+        Returns:
+            Number of removed segments
+        """
+        with _store_lock:
+            referenced: Set[str] = set()
+            for path in self.snapshots_path.glob("*.json"):
+                referenced.update(self._read_json(path)["chunks"])
+            
+            removed = 0
+            for chunk_file in self.chunks_path.glob("*/*"):
+                if chunk_file.name.split(".")[0] not in referenced:
+                    chunk_file.unlink()
+                    removed += 1
+        
+        return removed
+    
+    def get_storage_size(self) -> int:
+        """Get total bytes used by stored segments."""
+        return sum(f.stat().st_size for f in self.chunks_path.glob("*/*"))
+    
+    # Restore
+    
+    def restore_snapshot(
+        self,
+        snapshot_id: str,
+        target_path: Optional[Path] = None,
+        job: Optional[JobStatus] = None
+    ) -> Path:
+        """
+        Restore a snapshot.
+        
+        The snapshot is reassembled into a temporary file, integrity-checked
+        and then copied into the target with the online backup API, so
+        connections that are open on the live database stay valid.
+        
+        Args:
+            snapshot_id: Snapshot ID
+            target_path: Database to restore into (defaults to the live one)
+            job: Optional job status to report progress to
+        
+        Returns:
+            Path of the restored database
+        """
+        target_path = Path(target_path or self.db_path)
+        with _store_lock:
+            self._restore(snapshot_id, target_path, job)
+        
+        if job:
+            job.message = f"Restored snapshot {snapshot_id}"
+        
+        return target_path
+    
+    def _restore(
+        self,
+        snapshot_id: str,
+        target_path: Path,
+        job: Optional[JobStatus]
+    ):
+        """Reassemble a snapshot and copy it into the target database."""
+        manifest_path = self.snapshots_path / f"{snapshot_id}.json"
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Snapshot not found: {snapshot_id}")
+        
+        manifest = self._read_json(manifest_path)
+        
+        fd, tmp_name = tempfile.mkstemp(
+            prefix="restore_", suffix=".db", dir=self.backup_path
+        )
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        
+        try:
+            chunks = manifest["chunks"]
+            with open(tmp_path, "wb") as out:
+                for i, chunk_hash in enumerate(chunks, 1):
+                    out.write(self._read_chunk(chunk_hash))
+                    if job:
+                        job.progress = 0.5 * i / max(len(chunks), 1)
+                        job.message = f"Reassembling segment {i}/{len(chunks)}"
+            
+            self._check_integrity(tmp_path)
+            
+            if job:
+                job.message = "Copying into database"
+            
+            src = sqlite3.connect(str(tmp_path))
+            dst = sqlite3.connect(str(target_path))
+            try:
+                src.backup(
+                    dst,
+                    pages=self.pages_per_step,
+                    progress=self._progress_callback(job, 0.5, 0.5),
+                )
+            finally:
+                src.close()
+                dst.close()
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
+    # Internals
+    
+    def _online_copy(self, dest_path: Path, job: Optional[JobStatus]):
+        """Copy the live database with the SQLite online backup API."""
+        src = sqlite3.connect(str(self.db_path))
+        dst = sqlite3.connect(str(dest_path))
+        try:
+            src.backup(
+                dst,
+                pages=self.pages_per_step,
+                progress=self._progress_callback(job, 0.0, 0.5),
+            )
+        finally:
+            src.close()
+            dst.close()
+    
+    def _store_chunks(
+        self,
+        db_copy: Path,
+        page_size: int,
+        job: Optional[JobStatus]
+    ) -> tuple:
+        """Split a database copy into segments and store new ones."""
+        chunk_size = page_size * self.pages_per_chunk
+        total = max(db_copy.stat().st_size // chunk_size, 1)
+        
+        chunks = []
+        new_chunks = 0
+        stored_bytes = 0
+        
+        with open(db_copy, "rb") as f:
+            for i, data in enumerate(iter(lambda: f.read(chunk_size), b"")):
+                chunk_hash = hashlib.sha256(data).hexdigest()
+                chunks.append(chunk_hash)
+                
+                if self._find_chunk(chunk_hash) is None:
+                    stored_bytes += self._write_chunk(chunk_hash, data)
+                    new_chunks += 1
+                
+                if job:
+                    job.progress = 0.5 + 0.5 * min((i + 1) / total, 1.0)
+                    job.message = f"Storing segment {i + 1}/{total}"
+        
+        return chunks, new_chunks, stored_bytes
+    
+    def _chunk_dir(self, chunk_hash: str) -> Path:
+        return self.chunks_path / chunk_hash[:2]
+    
+    def _find_chunk(self, chunk_hash: str) -> Optional[Path]:
+        chunk_dir = self._chunk_dir(chunk_hash)
+        if not chunk_dir.exists():
+            return None
+        matches = list(chunk_dir.glob(f"{chunk_hash}.*"))
+        return matches[0] if matches else None
+    
+    def _write_chunk(self, chunk_hash: str, data: bytes) -> int:
+        codec = compression.default_codec()
+        payload = compression.compress(data, codec, self.compression_level)
+        
+        chunk_dir = self._chunk_dir(chunk_hash)
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        path = chunk_dir / f"{chunk_hash}.{codec}"
+        tmp = chunk_dir / f".{chunk_hash}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+        
+        return len(payload)
+    
+    def _read_chunk(self, chunk_hash: str) -> bytes:
+        path = self._find_chunk(chunk_hash)
+        if path is None:
+            raise FileNotFoundError(f"Backup segment missing: {chunk_hash}")
+        
+        with open(path, "rb") as f:
+            data = compression.decompress(f.read(), path.suffix.lstrip("."))
+        
+        if hashlib.sha256(data).hexdigest() != chunk_hash:
+            raise ValueError(f"Backup segment corrupted: {chunk_hash}")
+        return data
+    
+    @staticmethod
+    def _read_page_info(db_path: Path) -> tuple:
+        conn = sqlite3.connect(str(db_path))
+        try:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        finally:
+            conn.close()
+        return page_size, page_count
+    
+    @staticmethod
+    def _check_integrity(db_path: Path):
+        conn = sqlite3.connect(str(db_path))
+        try:
+            result = conn.execute("PRAGMA quick_check").fetchone()[0]
+        finally:
+            conn.close()
+        if result != "ok":
+            raise ValueError(f"Snapshot failed integrity check: {result}")
+    
+    @staticmethod
+    def _progress_callback(
+        job: Optional[JobStatus],
+        offset: float,
+        scale: float
+    ):
+        if job is None:
+            return None
+        
+        def _progress(status, remaining, total):
+            if total:
+                job.progress = offset + scale * (total - remaining) / total
+                job.message = f"Copied {total - remaining}/{total} pages"
+        
+        return _progress
+    
+    @staticmethod
+    def _read_json(path: Path) -> Dict[str, Any]:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]):
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+
+def start_backup(manager: Optional[BackupManager] = None) -> JobStatus:
+    """
+    Start a snapshot on a background thread.
+    
+    Args:
+        manager: Optional backup manager (created from settings if omitted)
+    
+    Returns:
+        Status of the backup job
+    """
+    manager = manager or BackupManager.from_settings()
+    return run_in_background(BACKUP_JOB_NAME, manager.create_snapshot)
+
+
+def start_restore(
+    snapshot_id: str,
+    manager: Optional[BackupManager] = None
+) -> JobStatus:
+    """
+    Start restoring a snapshot on a background thread.
+    
+    Once the snapshot is copied in, the job upgrades its schema and
+    invalidates the shared cache, so this happens once per restore
+    rather than in the page that shows the result.
+    
+    Args:
+        snapshot_id: Snapshot to restore
+        manager: Optional backup manager (created from settings if omitted)
+    
+    Returns:
+        Status of the restore job
+    """
+    manager = manager or BackupManager.from_settings()
+    return run_in_background(
+        RESTORE_JOB_NAME, _restore_live, manager, snapshot_id
+    )
+
+
+def _restore_live(
+    manager: BackupManager,
+    snapshot_id: str,
+    job: Optional[JobStatus] = None
+) -> Path:
+    """Restore into the live database and refresh what depends on it."""
+    from config.database import init_db
+    from utils.shared_cache import bump_version
+    
+    path = manager.restore_snapshot(snapshot_id, job=job)
+    
+    # The app sets up the schema once per process, so upgrade a snapshot
+    # taken by an older version here
+    init_db(str(path))
+    # Every cached read describes the replaced data
+    bump_version()
+    
+    return path
\ No newline at end of file
@@ -0,0 +1,250 @@
+"""Bounded in-memory cache with TTL, LRU eviction and size accounting.
+
+Each Streamlit session keeps one of these in ``st.session_state`` for
+expensive intermediate results. Entries expire after their TTL, and the
+least recently used entries are evicted once the cache exceeds its entry
+count or its memory cap. Sizes are estimated by walking the value (see
+approximate_size), so the cap is a budget, not an exact limit.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional
+
+
+# Nesting depth walked when estimating sizes
+MAX_SIZE_DEPTH = 8
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: Optional[float]  # time.monotonic() deadline
+
+
+def approximate_size(value: Any) -> int:
+    """
+    Estimate the memory held by a value in bytes.
+    
+    Containers and object attributes are walked recursively (shared
+    objects are counted once); DataFrames and arrays report their own
+    buffer size.
+    
+    Args:
+        value: Value to measure
+    
+    Returns:
+        Approximate size in bytes
+    """
+    return _sizeof(value, set(), 0)
+
+
+def _sizeof(value: Any, seen: set, depth: int) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    
+    if hasattr(value, "memory_usage") and hasattr(value, "columns"):
+        try:  # pandas DataFrame
+            return int(value.memory_usage(deep=True).sum())
+        except Exception:
+            pass
+    if hasattr(value, "nbytes") and not isinstance(value, (bytes, bytearray)):
+        try:  # NumPy array or Arrow table
+            return int(value.nbytes)
+        except Exception:
+            pass
+    
+    size = sys.getsizeof(value, 0)
+    if depth >= MAX_SIZE_DEPTH or isinstance(value, (str, bytes, bytearray)):
+        return size
+    
+    depth += 1
+    if isinstance(value, dict):
+        size += sum(
+            _sizeof(k, seen, depth) + _sizeof(v, seen, depth)
+            for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_sizeof(item, seen, depth) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += _sizeof(vars(value), seen, depth)
+    
+    return size
+
+
+class BoundedCache:
+    """LRU cache bounded by entry count and approximate memory."""
+    
+    def __init__(
+        self,
+        max_bytes: int = 50 * 1024 * 1024,
+        max_entries: int = 500,
+        default_ttl: Optional[float] = 900
+    ):
+        """
+        Initialize cache.
+        
+        Args:
+            max_bytes: Memory cap for all entries
+            max_entries: Maximum number of entries
+            default_ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max(max_entries, 1)
+        self.default_ttl = default_ttl
+        
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as recently used.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+        
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            
+            if entry is None:
+                self.misses += 1
+                return default
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> bool:
+        """
+        Cache a value, evicting least recently used entries if needed.
+        
+        Values larger than the whole memory cap are not cached.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds the entry stays valid (defaults to default_ttl)
+        
+        Returns:
+            True if the value was cached
+        """
+        size = approximate_size(value)
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            
+            if size > self.max_bytes:
+                return False
+            
+            self._entries[key] = _Entry(value, size, expires_at)
+            self._bytes += size
+            self._evict()
+            return True
+    
+    def delete(self, key: Hashable) -> bool:
+        """
+        Remove an entry.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            True if the key was cached
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+    
+    def clear(self):
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def purge_expired(self) -> int:
+        """
+        Remove expired entries.
+        
+        Returns:
+            Number of removed entries
+        """
+        with self._lock:
+            expired = [k for k, e in self._entries.items() if self._expired(e)]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+        return len(expired)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with entry count, size, limits and counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+    
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _evict(self):
+        """Drop least recently used entries beyond the limits."""
+        self.purge_expired()
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or self._bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+    
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+    
+    @staticmethod
+    def _expired(entry: _Entry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= time.monotonic()
\ No newline at end of file
@@ -0,0 +1,341 @@
+"""Columnar (Parquet / Arrow IPC) reading and writing.
+
+Rows are converted to Arrow record batches in fixed-size chunks and
+streamed to disk, so exports never hold a whole table or DataFrame in
+memory. Schemas are derived from the SQLAlchemy table definitions, so
+dates, numbers and booleans keep their types; JSON columns are stored as
+JSON text (flagged in the field metadata) and decoded again on read.
+
+- Parquet: a hive-partitioned dataset directory per table
+  (``<table>/project_id=.../date=.../part-0.parquet``) with the full
+  schema in ``_common_metadata``; zstd-compressed.
+- Arrow IPC: one ``<table>.arrow`` file per table, memory-mapped on read.
+
+Requires the optional ``pyarrow`` package.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+from sqlalchemy import JSON, Boolean, Date, DateTime, Float, Integer, LargeBinary
+
+from utils import serialization
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+
+PARQUET = "parquet"
+ARROW = "arrow"
+COLUMNAR_FORMATS = [PARQUET, ARROW]
+
+# Rows per record batch
+DEFAULT_BATCH_SIZE = 10000
+
+DEFAULT_COMPRESSION = "zstd"
+
+# Schema metadata keys
+PARTITION_KEY = b"partition_by"
+JSON_KEY = b"json"
+
+COMMON_METADATA = "_common_metadata"
+
+
+def is_available() -> bool:
+    """Check whether pyarrow is installed."""
+    return pa is not None
+
+
+def arrow_schema(table, partition_by: Optional[List[str]] = None):
+    """
+    Build the Arrow schema of a SQLAlchemy table.
+    
+    Partition columns that the table does not have (e.g. ``project_id``
+    on child tables) are added as string columns.
+    
+    Args:
+        table: SQLAlchemy Table
+        partition_by: Optional hive partition columns (Parquet only)
+    
+    Returns:
+        pyarrow Schema
+    """
+    _require_pyarrow()
+    
+    fields = []
+    for column in table.columns:
+        metadata = {JSON_KEY: b"1"} if isinstance(column.type, JSON) else None
+        fields.append(
+            pa.field(column.name, _arrow_type(column.type), metadata=metadata)
+        )
+    
+    for name in partition_by or []:
+        if name not in table.columns:
+            fields.append(pa.field(name, pa.string()))
+    
+    metadata = None
+    if partition_by:
+        metadata = {PARTITION_KEY: ",".join(partition_by).encode()}
+    
+    return pa.schema(fields, metadata=metadata)
+
+
+def _arrow_type(column_type):
+    """Map a SQLAlchemy column type to an Arrow type."""
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, LargeBinary):
+        return pa.binary()
+    return pa.string()
+
+
+def record_batches(
+    rows: Iterable[Mapping[str, Any]],
+    schema,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    constants: Optional[Dict[str, Any]] = None
+) -> Iterator:
+    """
+    Convert rows into record batches of at most batch_size rows.
+    
+    Args:
+        rows: Row mappings (extra keys are ignored)
+        schema: Target schema (see arrow_schema)
+        batch_size: Rows per batch
+        constants: Values for columns missing from the rows, e.g. the
+            project_id partition key of child tables
+    
+    Yields:
+        pyarrow RecordBatch objects
+    """
+    _require_pyarrow()
+    
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= batch_size:
+            yield _to_batch(chunk, schema, constants or {})
+            chunk = []
+    
+    if chunk:
+        yield _to_batch(chunk, schema, constants or {})
+
+
+def _to_batch(chunk: List[Mapping[str, Any]], schema, constants: Dict[str, Any]):
+    """Build one record batch column by column."""
+    arrays = []
+    for field in schema:
+        if field.name in constants:
+            values = [constants[field.name]] * len(chunk)
+        else:
+            values = [row.get(field.name) for row in chunk]
+            if _is_json(field):
+                values = [
+                    None if value is None else serialization.dumps_str(value)
+                    for value in values
+                ]
+        arrays.append(pa.array(values, type=field.type))
+    
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def write_parquet(
+    batches: Iterable,
+    schema,
+    base_dir: Union[str, Path],
+    compression: str = DEFAULT_COMPRESSION
+) -> int:
+    """
+    Stream record batches into a (partitioned) Parquet dataset.
+    
+    Args:
+        batches: Record batches matching the schema
+        schema: Dataset schema; partition columns come from its
+            ``partition_by`` metadata
+        base_dir: Dataset directory
+        compression: Parquet compression codec
+    
+    Returns:
+        Number of rows written
+    """
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    
+    base_dir = Path(base_dir)
+    base_dir.mkdir(parents=True, exist_ok=True)
+    
+    rows = 0
+    
+    def counted():
+        nonlocal rows
+        for batch in batches:
+            rows += batch.num_rows
+            yield batch
+    
+    partition_by = partition_columns(schema)
+    partitioning = None
+    if partition_by:
+        partitioning = ds.partitioning(
+            pa.schema([schema.field(name) for name in partition_by]),
+            flavor="hive"
+        )
+    
+    ds.write_dataset(
+        pa.RecordBatchReader.from_batches(schema, counted()),
+        base_dir,
+        format="parquet",
+        partitioning=partitioning,
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="delete_matching",
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression=compression
+        ),
+    )
+    
+    # Full schema (with partition column types and JSON flags) for readers
+    pq.write_metadata(schema, base_dir / COMMON_METADATA)
+    
+    return rows
+
+
+def write_arrow(
+    batches: Iterable,
+    schema,
+    path: Union[str, Path],
+    compression: Optional[str] = DEFAULT_COMPRESSION
+) -> int:
+    """
+    Stream record batches into an Arrow IPC file.
+    
+    Args:
+        batches: Record batches matching the schema
+        schema: File schema
+        path: Target file path
+        compression: IPC buffer compression (zstd, lz4 or None)
+    
+    Returns:
+        Number of rows written
+    """
+    _require_pyarrow()
+    
+    rows = 0
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, schema, options=options) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    
+    return rows
+
+
+def read_batches(
+    path: Union[str, Path],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator:
+    """
+    Stream record batches from a Parquet dataset/file or Arrow IPC file.
+    
+    Args:
+        path: Parquet dataset directory, ``.parquet`` file or ``.arrow``
+            file
+        batch_size: Maximum rows per batch (Parquet only)
+    
+    Yields:
+        pyarrow RecordBatch objects
+    """
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+    
+    path = Path(path)
+    
+    if path.is_dir():
+        dataset = _parquet_dataset(path)
+    elif path.suffix == ".parquet":
+        dataset = ds.dataset(path, format="parquet")
+    else:
+        with pa.memory_map(str(path)) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
+        return
+    
+    yield from dataset.to_batches(batch_size=batch_size)
+
+
+def _parquet_dataset(base_dir: Path):
+    """Open a dataset written by write_parquet (or any hive layout)."""
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    
+    common = base_dir / COMMON_METADATA
+    if not common.exists():
+        return ds.dataset(base_dir, format="parquet", partitioning="hive")
+    
+    schema = pq.read_schema(common)
+    partition_by = partition_columns(schema)
+    partitioning = None
+    if partition_by:
+        partitioning = ds.partitioning(
+            pa.schema([schema.field(name) for name in partition_by]),
+            flavor="hive"
+        )
+    
+    return ds.dataset(
+        base_dir, schema=schema, format="parquet", partitioning=partitioning
+    )
+
+
+def iter_rows(batches: Iterable) -> Iterator[Dict[str, Any]]:
+    """
+    Turn record batches back into row dictionaries.
+    
+    JSON columns are decoded; dates and timestamps come back as Python
+    date/datetime objects.
+    
+    Args:
+        batches: Record batches
+    
+    Yields:
+        Row dictionaries
+    """
+    for batch in batches:
+        json_columns = [field.name for field in batch.schema if _is_json(field)]
+        for row in batch.to_pylist():
+            for name in json_columns:
+                if row[name] is not None:
+                    row[name] = serialization.loads(row[name])
+            yield row
+
+
+def partition_columns(schema) -> List[str]:
+    """Get the partition columns recorded in a schema's metadata."""
+    value = (schema.metadata or {}).get(PARTITION_KEY)
+    return value.decode().split(",") if value else []
+
+
+def _is_json(field) -> bool:
+    return bool(field.metadata and field.metadata.get(JSON_KEY))
+
+
+def _require_pyarrow():
+    """Raise a helpful error if pyarrow is not installed."""
+    if pa is None:
+        raise ImportError(
+            "pyarrow package is required for Parquet/Arrow exports. "
+            "Install with: pip install pyarrow"
+        )
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""Compression helpers shared by backups and stored blobs.
+
+Uses zstd when the ``zstandard`` package is installed and falls back to
+zlib otherwise. The codec name is stored next to every compressed payload
+so data written with one codec can always be read back.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import BinaryIO, Iterator, Optional
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+ZSTD = "zstd"
+ZLIB = "zlib"
+NONE = "none"
+
+DEFAULT_LEVEL = 3
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def default_codec() -> str:
+    """Get the best available codec."""
+    return ZSTD if zstandard is not None else ZLIB
+
+
+def compress(
+    data: bytes,
+    codec: Optional[str] = None,
+    level: int = DEFAULT_LEVEL
+) -> bytes:
+    """
+    Compress bytes.
+    
+    Args:
+        data: Raw bytes
+        codec: Codec name (defaults to the best available)
+        level: Compression level
+    
+    Returns:
+        Compressed bytes
+    """
+    codec = codec or default_codec()
+    
+    if codec == ZSTD:
+        _require_zstd()
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    elif codec == ZLIB:
+        return zlib.compress(data, min(level, 9))
+    elif codec == NONE:
+        return data
+    else:
+        raise ValueError(f"Unsupported codec: {codec}")
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    """
+    Decompress bytes.
+    
+    Args:
+        data: Compressed bytes
+        codec: Codec the data was compressed with
+    
+    Returns:
+        Raw bytes
+    """
+    if codec == ZSTD:
+        _require_zstd()
+        return zstandard.ZstdDecompressor().decompress(data)
+    elif codec == ZLIB:
+        return zlib.decompress(data)
+    elif codec == NONE:
+        return data
+    else:
+        raise ValueError(f"Unsupported codec: {codec}")
+
+
+def iter_decompress(
+    data: bytes,
+    codec: str,
+    chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Decompress bytes incrementally.
+    
+    Args:
+        data: Compressed bytes
+        codec: Codec the data was compressed with
+        chunk_size: Size of the decompressed chunks to yield
+    
+    Yields:
+        Chunks of raw bytes
+    """
+    if codec == ZSTD:
+        _require_zstd()
+        reader = zstandard.ZstdDecompressor().stream_reader(data)
+        while True:
+            chunk = reader.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    elif codec == ZLIB:
+        decompressor = zlib.decompressobj()
+        for start in range(0, len(data), chunk_size):
+            chunk = decompressor.decompress(data[start:start + chunk_size])
+            if chunk:
+                yield chunk
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+    elif codec == NONE:
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+    else:
+        raise ValueError(f"Unsupported codec: {codec}")
+
+
+def compress_file(
+    src: BinaryIO,
+    dst: BinaryIO,
+    codec: Optional[str] = None,
+    level: int = DEFAULT_LEVEL
+) -> str:
+    """
+    Compress a file stream into another stream.
+    
+    Args:
+        src: Readable binary stream
+        dst: Writable binary stream
+        codec: Codec name (defaults to the best available)
+        level: Compression level
+    
+    Returns:
+        Codec used
+    """
+    codec = codec or default_codec()
+    
+    if codec == ZSTD:
+        _require_zstd()
+        zstandard.ZstdCompressor(level=level).copy_stream(src, dst)
+    elif codec == ZLIB:
+        compressor = zlib.compressobj(min(level, 9))
+        for chunk in iter(lambda: src.read(READ_CHUNK_SIZE), b""):
+            dst.write(compressor.compress(chunk))
+        dst.write(compressor.flush())
+    elif codec == NONE:
+        for chunk in iter(lambda: src.read(READ_CHUNK_SIZE), b""):
+            dst.write(chunk)
+    else:
+        raise ValueError(f"Unsupported codec: {codec}")
+    
+    return codec
+
+
+def decompress_file(src: BinaryIO, dst: BinaryIO, codec: str):
+    """
+    Decompress a file stream into another stream.
+    
+    Args:
+        src: Readable binary stream
+        dst: Writable binary stream
+        codec: Codec the data was compressed with
+    """
+    if codec == ZSTD:
+        _require_zstd()
+        zstandard.ZstdDecompressor().copy_stream(src, dst)
+    elif codec == ZLIB:
+        decompressor = zlib.decompressobj()
+        for chunk in iter(lambda: src.read(READ_CHUNK_SIZE), b""):
+            dst.write(decompressor.decompress(chunk))
+        dst.write(decompressor.flush())
+    elif codec == NONE:
+        for chunk in iter(lambda: src.read(READ_CHUNK_SIZE), b""):
+            dst.write(chunk)
+    else:
+        raise ValueError(f"Unsupported codec: {codec}")
+
+
+def _require_zstd():
+    """Raise a helpful error if zstandard is not installed."""
+    if zstandard is None:
+        raise ImportError(
+            "zstandard package is required to read zstd data. "
+            "Install with: pip install zstandard"
+        )
\ No newline at end of file
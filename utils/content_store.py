@@ -0,0 +1,228 @@
+"""Content-addressed, compressed storage for article bodies.
+
+Publication bodies are kept out of the ``publications`` row in
+``content_blobs``: compressed (zstd when available), keyed by SHA-256 of
+the text and shared by every row with identical content. Callers load a
+body only when they actually need it, either whole or as a stream of text
+chunks.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+from typing import Iterable, Iterator, Optional, Tuple
+
+from sqlalchemy import delete, inspect, select, text, update
+from sqlalchemy.orm import Session
+
+from utils import compression
+from utils.database import ContentBlob, Publication
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def content_hash(content: str) -> str:
+    """Get the SHA-256 key of a text body."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class ContentStore:
+    """Read and write compressed content blobs."""
+    
+    def __init__(self, session: Session, level: int = compression.DEFAULT_LEVEL):
+        """
+        Initialize content store.
+        
+        Args:
+            session: SQLAlchemy session
+            level: Compression level for new blobs
+        """
+        self.session = session
+        self.level = level
+    
+    def put(self, content: str) -> Tuple[str, int]:
+        """
+        Store a text body (no-op if identical content is already stored).
+        
+        Does not commit; the blob is written with the caller's transaction.
+        
+        Args:
+            content: Text to store
+        
+        Returns:
+            Tuple of (content hash, raw size in bytes)
+        """
+        raw = content.encode("utf-8")
+        key = hashlib.sha256(raw).hexdigest()
+        
+        exists = self.session.execute(
+            select(ContentBlob.hash).where(ContentBlob.hash == key)
+        ).first()
+        
+        if not exists:
+            codec = compression.default_codec()
+            data = compression.compress(raw, codec, self.level)
+            self.session.add(ContentBlob(
+                hash=key,
+                codec=codec,
+                size=len(raw),
+                compressed_size=len(data),
+                data=data,
+            ))
+            self.session.flush()
+        
+        return key, len(raw)
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Load a whole text body.
+        
+        Args:
+            key: Content hash
+        
+        Returns:
+            Text, or None if not found
+        """
+        row = self.session.execute(
+            select(ContentBlob.codec, ContentBlob.data)
+            .where(ContentBlob.hash == key)
+        ).first()
+        
+        if row is None:
+            return None
+        
+        return compression.decompress(row.data, row.codec).decode("utf-8")
+    
+    def stream(
+        self,
+        key: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """
+        Stream a text body in decompressed chunks.
+        
+        Only the compressed payload is held in memory; the decompressed
+        text is produced chunk by chunk.
+        
+        Args:
+            key: Content hash
+            chunk_size: Approximate size of yielded chunks in bytes
+        
+        Yields:
+            Text chunks
+        """
+        row = self.session.execute(
+            select(ContentBlob.codec, ContentBlob.data)
+            .where(ContentBlob.hash == key)
+        ).first()
+        
+        if row is None:
+            return
+        
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for chunk in compression.iter_decompress(
+            row.data, row.codec, chunk_size
+        ):
+            decoded = decoder.decode(chunk)
+            if decoded:
+                yield decoded
+        
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+    
+    def delete_unreferenced(
+        self,
+        chunk_size: int = 500,
+        keys: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Delete blobs no publication points at, in bounded chunks.
+        
+        Args:
+            chunk_size: Maximum blobs deleted per transaction
+            keys: Only consider these content hashes (all blobs otherwise)
+        
+        Returns:
+            Number of deleted blobs
+        """
+        referenced = select(Publication.content_hash).where(
+            Publication.content_hash.is_not(None)
+        )
+        
+        query = select(ContentBlob.hash).where(
+            ContentBlob.hash.not_in(referenced)
+        )
+        if keys is not None:
+            query = query.where(ContentBlob.hash.in_(list(keys)))
+        
+        deleted = 0
+        while True:
+            batch = self.session.execute(
+                query.limit(chunk_size)
+            ).scalars().all()
+            
+            if not batch:
+                break
+            
+            self.session.execute(
+                delete(ContentBlob).where(ContentBlob.hash.in_(batch))
+            )
+            self.session.commit()
+            deleted += len(batch)
+        
+        return deleted
+
+
+def migrate_inline_content(engine, batch_size: int = 200) -> int:
+    """
+    Move bodies from the legacy inline ``publications.content`` column
+    into the content store.
+    
+    Databases created before the content store still have the column;
+    rows are moved in batches and the inline copy is cleared.
+    
+    Args:
+        engine: SQLAlchemy engine
+        batch_size: Rows moved per transaction
+    
+    Returns:
+        Number of moved bodies
+    """
+    inspector = inspect(engine)
+    if "publications" not in inspector.get_table_names():
+        return 0
+    
+    columns = {c["name"] for c in inspector.get_columns("publications")}
+    if "content" not in columns:
+        return 0
+    
+    moved = 0
+    with Session(engine) as session:
+        store = ContentStore(session)
+        while True:
+            rows = session.execute(text(
+                "SELECT id, content FROM publications "
+                "WHERE content IS NOT NULL LIMIT :limit"
+            ), {"limit": batch_size}).all()
+            
+            if not rows:
+                break
+            
+            for row in rows:
+                key, size = store.put(row.content)
+                session.execute(
+                    update(Publication)
+                    .where(Publication.id == row.id)
+                    .values(content_hash=key, content_size=size)
+                )
+                session.execute(text(
+                    "UPDATE publications SET content = NULL WHERE id = :id"
+                ), {"id": row.id})
+            
+            session.commit()
+            moved += len(rows)
+    
+    return moved
\ No newline at end of file
@@ -8,14 +8,18 @@ from typing import List, Optional, Dict, Any
 
 from sqlalchemy import (
     Column, String, Integer, Float, Boolean, DateTime, Text,
-    ForeignKey, JSON, Date, Index, UniqueConstraint
+    ForeignKey, JSON, Date, Index, UniqueConstraint, LargeBinary, text, func
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import (
     declarative_base, relationship, Mapped, mapped_column
 )
 
 Base = declarative_base()
 
+# JSON on SQLite, binary JSONB (indexable, no reparsing) on PostgreSQL
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 def generate_uuid() -> str:
     """Generate a UUID string."""
@@ -41,7 +45,7 @@ class Project(Base):
     central_entity: Mapped[Optional[str]] = mapped_column(String(255))
     central_search_intent: Mapped[Optional[str]] = mapped_column(Text)
     functional_words: Mapped[Optional[Dict]] = mapped_column(
-        JSON, default=list
+        JSONType, default=list
     )  # Predicates/verbs
     
     created_at: Mapped[datetime] = mapped_column(
@@ -50,6 +54,8 @@ class Project(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+    # Soft delete - set when deletion is requested, row is purged later
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Relationships
     topical_maps: Mapped[List["TopicalMap"]] = relationship(
@@ -59,6 +65,21 @@ class Project(Base):
         "ContentBrief", back_populates="project", cascade="all, delete-orphan"
     )
     
+    # Indexes (partial: only live projects are listed)
+    __table_args__ = (
+        Index(
+            "idx_projects_active", "updated_at",
+            sqlite_where=text("deleted_at IS NULL"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Case-insensitive prefix search on name
+        Index(
+            "idx_projects_name", func.lower(name),
+            sqlite_where=text("deleted_at IS NULL"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -93,8 +114,8 @@ class TopicalMap(Base):
     type: Mapped[str] = mapped_column(
         String(20), default="raw"
     )  # raw or processed
-    core_section: Mapped[Optional[Dict]] = mapped_column(JSON)
-    outer_section: Mapped[Optional[Dict]] = mapped_column(JSON)
+    core_section: Mapped[Optional[Dict]] = mapped_column(JSONType)
+    outer_section: Mapped[Optional[Dict]] = mapped_column(JSONType)
     
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow
@@ -111,6 +132,11 @@ class TopicalMap(Base):
         "Attribute", back_populates="topical_map", cascade="all, delete-orphan"
     )
     
+    # Indexes
+    __table_args__ = (
+        Index("idx_maps_project", "project_id"),
+    )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -152,7 +178,7 @@ class Entity(Base):
         String(20), default="derived"
     )  # central, derived, sibling
     wikidata_id: Mapped[Optional[str]] = mapped_column(String(50))
-    properties: Mapped[Optional[Dict]] = mapped_column(JSON)
+    properties: Mapped[Optional[Dict]] = mapped_column(JSONType)
     
     # PPR Scores
     prominence_score: Mapped[int] = mapped_column(Integer, default=5)
@@ -227,6 +253,9 @@ class Attribute(Base):
     )  # core or outer
     depth_level: Mapped[int] = mapped_column(Integer, default=1)
     search_volume: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
     
     # Relationships
     topical_map: Mapped["TopicalMap"] = relationship(
@@ -274,7 +303,7 @@ class EntityAttribute(Base):
         primary_key=True
     )
     relationship_type: Mapped[Optional[str]] = mapped_column(String(50))
-    extra_data: Mapped[Optional[Dict]] = mapped_column(JSON)
+    extra_data: Mapped[Optional[Dict]] = mapped_column(JSONType)
     
     # Relationships
     entity: Mapped["Entity"] = relationship(
@@ -331,7 +360,7 @@ class ContentBrief(Base):
     url_slug: Mapped[Optional[str]] = mapped_column(String(255))
     meta_description: Mapped[Optional[str]] = mapped_column(Text)
     h1: Mapped[Optional[str]] = mapped_column(String(255))
-    image_alts: Mapped[Optional[Dict]] = mapped_column(JSON)
+    image_alts: Mapped[Optional[Dict]] = mapped_column(JSONType)
     
     # Status
     status: Mapped[str] = mapped_column(
@@ -340,7 +369,7 @@ class ContentBrief(Base):
     
     # Context
     macro_context: Mapped[Optional[str]] = mapped_column(Text)
-    micro_contexts: Mapped[Optional[Dict]] = mapped_column(JSON)
+    micro_contexts: Mapped[Optional[Dict]] = mapped_column(JSONType)
     
     # Publication timing
     target_publish_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
@@ -348,7 +377,7 @@ class ContentBrief(Base):
     
     # Content specifications
     word_count_target: Mapped[Optional[int]] = mapped_column(Integer)
-    authorship_codes: Mapped[Optional[Dict]] = mapped_column(JSON)
+    authorship_codes: Mapped[Optional[Dict]] = mapped_column(JSONType)
     
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow
@@ -383,13 +412,22 @@ class ContentBrief(Base):
         cascade="all, delete-orphan"
     )
     publication: Mapped[Optional["Publication"]] = relationship(
-        "Publication", back_populates="brief", uselist=False
+        "Publication", back_populates="brief", uselist=False,
+        cascade="all, delete-orphan"
+    )
+    revisions: Mapped[List["BriefRevision"]] = relationship(
+        "BriefRevision", back_populates="brief",
+        cascade="all, delete-orphan", passive_deletes=True
     )
     
     # Indexes
     __table_args__ = (
         Index("idx_briefs_project", "project_id"),
         Index("idx_briefs_status", "status"),
+        # Dashboard counts per status (see ProjectService.get_project_stats)
+        Index("idx_briefs_project_status", "project_id", "status"),
+        Index("idx_briefs_entity", "entity_id"),
+        Index("idx_briefs_attribute", "attribute_id"),
     )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -460,14 +498,19 @@ class BriefSection(Base):
     format_instruction: Mapped[Optional[str]] = mapped_column(
         String(20)
     )  # FS, PAA, listing, long_form, table
-    content_instructions: Mapped[Optional[Dict]] = mapped_column(JSON)
-    required_terms: Mapped[Optional[Dict]] = mapped_column(JSON)
+    content_instructions: Mapped[Optional[Dict]] = mapped_column(JSONType)
+    required_terms: Mapped[Optional[Dict]] = mapped_column(JSONType)
     
     # Relationships
     brief: Mapped["ContentBrief"] = relationship(
         "ContentBrief", back_populates="sections"
     )
     
+    # Indexes
+    __table_args__ = (
+        Index("idx_sections_brief", "brief_id"),
+    )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -483,6 +526,54 @@ class BriefSection(Base):
         }
 
 
+class BriefRevision(Base):
+    """
+    Brief Revision model - edit history of a brief and its sections.
+    
+    Most revisions store only a JSON Patch against the previous revision;
+    every few revisions a full snapshot is stored so any revision can be
+    rebuilt from the nearest snapshot with a handful of patches.
+    """
+    __tablename__ = "brief_revisions"
+    
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=generate_uuid
+    )
+    brief_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("content_briefs.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    revision: Mapped[int] = mapped_column(Integer, nullable=False)
+    is_snapshot: Mapped[bool] = mapped_column(Boolean, default=False)
+    payload: Mapped[Any] = mapped_column(
+        JSONType, nullable=False
+    )  # Full document if snapshot, else list of patch operations
+    
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow
+    )
+    
+    # Relationships
+    brief: Mapped["ContentBrief"] = relationship(
+        "ContentBrief", back_populates="revisions"
+    )
+    
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint("brief_id", "revision", name="uq_brief_revision"),
+    )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (without payload)."""
+        return {
+            "id": self.id,
+            "brief_id": self.brief_id,
+            "revision": self.revision,
+            "is_snapshot": self.is_snapshot,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
+
 class InternalLink(Base):
     """
     Internal Link model - links between content briefs.
@@ -528,6 +619,7 @@ class InternalLink(Base):
             "source_brief_id", "target_brief_id",
             name="uq_link_pair"
         ),
+        Index("idx_links_target", "target_brief_id"),
     )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -543,9 +635,36 @@ class InternalLink(Base):
         }
 
 
+class ContentBlob(Base):
+    """
+    Content Blob model - compressed, content-addressed article bodies.
+    
+    Keyed by the SHA-256 of the raw text, so identical bodies are stored
+    once no matter how many publications or revisions point at them.
+    The payload column is deferred and only loaded when read explicitly
+    (see utils.content_store).
+    """
+    __tablename__ = "content_blobs"
+    
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    codec: Mapped[str] = mapped_column(String(10), nullable=False)
+    size: Mapped[int] = mapped_column(Integer, default=0)  # Raw bytes
+    compressed_size: Mapped[int] = mapped_column(Integer, default=0)
+    data: Mapped[bytes] = mapped_column(
+        LargeBinary, nullable=False, deferred=True
+    )
+    
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow
+    )
+
+
 class Publication(Base):
     """
     Publication model - published content from briefs.
+    
+    The article body lives out-of-row in ContentBlob, so listing
+    publications never loads page HTML.
     """
     __tablename__ = "publications"
     
@@ -557,11 +676,14 @@ class Publication(Base):
         nullable=False, unique=True
     )
     url: Mapped[Optional[str]] = mapped_column(String(500))
-    content: Mapped[Optional[str]] = mapped_column(Text)
-    schema_markup: Mapped[Optional[Dict]] = mapped_column(JSON)
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(64), ForeignKey("content_blobs.hash")
+    )
+    content_size: Mapped[Optional[int]] = mapped_column(Integer)
+    schema_markup: Mapped[Optional[Dict]] = mapped_column(JSONType)
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
-    gsc_data: Mapped[Optional[Dict]] = mapped_column(JSON)
-    performance_metrics: Mapped[Optional[Dict]] = mapped_column(JSON)
+    gsc_data: Mapped[Optional[Dict]] = mapped_column(JSONType)
+    performance_metrics: Mapped[Optional[Dict]] = mapped_column(JSONType)
     
     # Relationships
     brief: Mapped["ContentBrief"] = relationship(
@@ -571,12 +693,19 @@ class Publication(Base):
         "QueryData", back_populates="publication", cascade="all, delete-orphan"
     )
     
+    # Indexes
+    __table_args__ = (
+        Index("idx_publications_content", "content_hash"),
+    )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "id": self.id,
             "brief_id": self.brief_id,
             "url": self.url,
+            "content_hash": self.content_hash,
+            "content_size": self.content_size,
             "schema_markup": self.schema_markup,
             "published_at": (
                 self.published_at.isoformat()
@@ -634,4 +763,78 @@ class QueryData(Base):
             "impressions": self.impressions,
             "ctr": self.ctr,
             "date": self.date.isoformat() if self.date else None,
+        }
+
+
+class ActivityEvent(Base):
+    """
+    Activity Event model - append-only log of project changes.
+    
+    Written in batches by the activity writer (see modules.activity) and
+    read newest-first for the dashboard feed. ``project_id`` deliberately
+    has no foreign key: events for a project that is being deleted must
+    not fail the batch they are written in. The purge removes them with
+    the rest of the project.
+    """
+    __tablename__ = "activity_events"
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    project_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    subject_id: Mapped[Optional[str]] = mapped_column(String(36))
+    summary: Mapped[Optional[str]] = mapped_column(String(255))
+    data: Mapped[Optional[Dict]] = mapped_column(JSONType)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    
+    # Indexes
+    __table_args__ = (
+        # Feed pages: newest events of a project, keyset on (created_at, id)
+        Index("idx_activity_project_created", "project_id", "created_at", "id"),
+    )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "id": self.id,
+            "project_id": self.project_id,
+            "event_type": self.event_type,
+            "subject_id": self.subject_id,
+            "summary": self.summary,
+            "data": self.data,
+            "created_at": (
+                self.created_at.isoformat() if self.created_at else None
+            ),
+        }
+
+
+class DashboardSnapshot(Base):
+    """
+    Dashboard Snapshot model - precomputed dashboard data of a project.
+    
+    Rebuilt in the background after project changes and periodically
+    (see modules.project.snapshot), so opening a dashboard is one
+    primary-key read. Like ActivityEvent, ``project_id`` has no foreign
+    key: a rebuild racing a delete must not fail, and the purge removes
+    the row.
+    """
+    __tablename__ = "dashboard_snapshots"
+    
+    project_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    data: Mapped[Dict] = mapped_column(JSONType, nullable=False)
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    build_ms: Mapped[Optional[float]] = mapped_column(Float)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "project_id": self.project_id,
+            "data": self.data,
+            "built_at": (
+                self.built_at.isoformat() if self.built_at else None
+            ),
+            "build_ms": self.build_ms,
         }
\ No newline at end of file
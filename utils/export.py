@@ -2,13 +2,35 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import io
+import shutil
+import threading
+import zipfile
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import (
+    TYPE_CHECKING, Dict, Any, List, Optional, Union, Iterable, Iterator,
+    Tuple, BinaryIO, Callable
+)
 
-import pandas as pd
+from utils import serialization
+
+if TYPE_CHECKING:  # pandas is imported only by the DataFrame exports
+    import pandas as pd
+
+
+# Excel worksheet limits
+EXCEL_MAX_ROWS = 1048576  # Including the header row
+EXCEL_MAX_CELL_CHARS = 32767
+
+# Rendered Markdown by content hash (LRU), shared by all bundles
+_markdown_cache: "OrderedDict[str, str]" = OrderedDict()
+_markdown_lock = threading.Lock()
+MAX_MARKDOWN_CACHE_ENTRIES = 5000
 
 
 class ExportHandler:
@@ -44,8 +66,7 @@ class ExportHandler:
         Returns:
             JSON string
         """
-        indent = 2 if pretty else None
-        json_str = json.dumps(data, indent=indent, default=str)
+        json_str = serialization.dumps_str(data, pretty=pretty)
         
         if filename:
             filepath = self.export_path / filename
@@ -54,6 +75,238 @@ class ExportHandler:
         
         return json_str
     
+    def write_ndjson(
+        self,
+        records: Iterable[Dict[str, Any]],
+        target: Union[str, Path, BinaryIO]
+    ) -> int:
+        """
+        Write records as newline-delimited JSON, one record at a time.
+        
+        Memory use is bounded by the largest single record, not the
+        number of records.
+        
+        Args:
+            records: Iterable of JSON-serializable dictionaries
+            target: Filename (relative to the export path), path or
+                writable binary stream
+        
+        Returns:
+            Number of records written
+        """
+        count = 0
+        with self._open_target(target) as f:
+            for record in records:
+                f.write(serialization.dumps(record))
+                f.write(b"\n")
+                count += 1
+        
+        return count
+    
+    def write_json_zip(
+        self,
+        rows: Iterable[Tuple[str, Dict[str, Any]]],
+        target: Union[str, Path, BinaryIO],
+        manifest: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, int]:
+        """
+        Write rows into a zip of per-table JSON files, incrementally.
+        
+        Each ``<table>.json`` is a JSON array with one record per line, so
+        it can also be read back line by line. Rows of a table must be
+        consecutive. Works with unseekable streams (e.g. a download).
+        
+        Args:
+            rows: Iterable of (table name, row dictionary)
+            target: Filename (relative to the export path), path or
+                writable binary stream
+            manifest: Optional metadata written to ``manifest.json``
+                (row counts per table are added)
+        
+        Returns:
+            Number of rows written per table
+        """
+        counts: Dict[str, int] = {}
+        
+        with self._open_target(target) as f:
+            with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                entry = None
+                current = None
+                
+                for table, row in rows:
+                    if table != current:
+                        if entry is not None:
+                            entry.write(b"\n]\n")
+                            entry.close()
+                        if table in counts:
+                            raise ValueError(
+                                f"Rows for table {table} are not consecutive"
+                            )
+                        entry = zf.open(f"{table}.json", "w")
+                        entry.write(b"[\n")
+                        current = table
+                        counts[table] = 0
+                    else:
+                        entry.write(b",\n")
+                    
+                    entry.write(serialization.dumps(row))
+                    counts[table] += 1
+                
+                if entry is not None:
+                    entry.write(b"\n]\n")
+                    entry.close()
+                
+                if manifest is not None:
+                    zf.writestr(
+                        "manifest.json",
+                        json.dumps(
+                            {**manifest, "tables": counts},
+                            indent=2, default=str
+                        )
+                    )
+        
+        return counts
+    
+    def write_excel(
+        self,
+        rows: Iterable[Tuple[str, Dict[str, Any]]],
+        target: Union[str, Path, BinaryIO],
+        column_types: Optional[Dict[str, Dict[str, str]]] = None,
+        max_rows: int = EXCEL_MAX_ROWS
+    ) -> BinaryIO:
+        """
+        Stream rows into an Excel workbook with write-only worksheets.
+        
+        Rows are written as they arrive (openpyxl spools each sheet to a
+        temporary file), so memory stays flat for large sheets. Each sheet
+        takes its header from its first row. A sheet that reaches Excel's
+        row limit continues on a new sheet ("name (2)", ...), and text
+        longer than a cell can hold is truncated.
+        
+        Args:
+            rows: Iterable of (sheet name, row dictionary), e.g. from a
+                chunked query iterator
+            target: Filename (relative to the export path), path or
+                writable binary stream
+            column_types: Optional {sheet: {column: type}} where type is
+                one of str, int, float, bool, date, datetime or json
+            max_rows: Rows per worksheet, including the header
+        
+        Returns:
+            The written workbook, opened for reading (or ``target`` itself,
+            rewound, if it is a stream)
+        """
+        from openpyxl import Workbook
+        
+        column_types = column_types or {}
+        workbook = Workbook(write_only=True)
+        sheets: Dict[str, Any] = {}
+        headers: Dict[str, List[str]] = {}
+        sheet_rows: Dict[str, int] = {}  # Rows in the current sheet
+        parts: Dict[str, int] = {}  # Sheets per name
+        
+        for sheet_name, row in rows:
+            if sheet_name not in sheets:
+                headers[sheet_name] = list(row.keys())
+                sheet_rows[sheet_name] = max_rows
+                parts[sheet_name] = 0
+            
+            if sheet_rows[sheet_name] >= max_rows:
+                parts[sheet_name] += 1
+                sheet = workbook.create_sheet(
+                    _excel_sheet_title(sheet_name, parts[sheet_name])
+                )
+                sheets[sheet_name] = sheet
+                sheet.append(headers[sheet_name])
+                sheet_rows[sheet_name] = 1
+            
+            types = column_types.get(sheet_name, {})
+            sheets[sheet_name].append([
+                _excel_value(row.get(column), types.get(column))
+                for column in headers[sheet_name]
+            ])
+            sheet_rows[sheet_name] += 1
+        
+        if not sheets:
+            workbook.create_sheet("Data")
+        
+        if hasattr(target, "write"):
+            workbook.save(target)
+            if target.seekable():
+                target.seek(0)
+            return target
+        
+        filepath = self.export_path / target
+        workbook.save(filepath)
+        return open(filepath, "rb")
+    
+    def write_columnar(
+        self,
+        tables: Iterable[Tuple[str, Any, Iterable]],
+        target: Union[str, Path],
+        format: str = "parquet",
+        manifest: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, int]:
+        """
+        Write tables of Arrow record batches into a columnar export.
+        
+        The target is a directory holding a Parquet dataset per table
+        (``<table>/``) or an Arrow IPC file per table (``<table>.arrow``).
+        Batches are written as they are produced, so no table is ever
+        held in memory. Requires pyarrow.
+        
+        Args:
+            tables: Iterable of (table name, schema, record batches), see
+                utils.columnar
+            target: Directory (relative to the export path) or path
+            format: Columnar format (parquet, arrow)
+            manifest: Optional metadata written to ``manifest.json``
+                (row counts per table are added)
+        
+        Returns:
+            Number of rows written per table
+        """
+        from utils import columnar
+        
+        if format not in columnar.COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported format: {format}")
+        
+        directory = self.export_path / target
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        counts: Dict[str, int] = {}
+        for table, schema, batches in tables:
+            if format == columnar.PARQUET:
+                counts[table] = columnar.write_parquet(
+                    batches, schema, directory / table
+                )
+            else:
+                counts[table] = columnar.write_arrow(
+                    batches, schema, directory / f"{table}.arrow"
+                )
+        
+        if manifest is not None:
+            with open(directory / "manifest.json", "w", encoding="utf-8") as f:
+                json.dump(
+                    {**manifest, "format": format, "tables": counts},
+                    f, indent=2, default=str
+                )
+        
+        return counts
+    
+    @contextmanager
+    def _open_target(
+        self,
+        target: Union[str, Path, BinaryIO]
+    ) -> Iterator[BinaryIO]:
+        """Open a filename/path for binary writing, or pass a stream through."""
+        if hasattr(target, "write"):
+            yield target
+            return
+        
+        with open(self.export_path / target, "wb") as f:
+            yield f
+    
     def to_csv(
         self,
         data: Union[pd.DataFrame, List[Dict]],
@@ -69,6 +322,8 @@ class ExportHandler:
         Returns:
             CSV string
         """
+        import pandas as pd
+        
         if isinstance(data, list):
             df = pd.DataFrame(data)
         else:
@@ -90,6 +345,9 @@ class ExportHandler:
         """
         Export data to Excel.
         
+        Builds the whole workbook in memory; use write_excel for large
+        data.
+        
         Args:
             data: DataFrame or dict of DataFrames (for multiple sheets)
             filename: Filename to save
@@ -97,6 +355,8 @@ class ExportHandler:
         Returns:
             Excel file bytes
         """
+        import pandas as pd
+        
         output = io.BytesIO()
         
         with pd.ExcelWriter(output, engine="openpyxl") as writer:
@@ -132,12 +392,7 @@ class ExportHandler:
         Returns:
             Markdown string
         """
-        if template == "content_brief":
-            md = self._brief_to_markdown(data)
-        elif template == "topical_map":
-            md = self._topical_map_to_markdown(data)
-        else:
-            md = self._default_to_markdown(data)
+        md = _render_markdown(template, data)
         
         if filename:
             filepath = self.export_path / filename
@@ -146,7 +401,66 @@ class ExportHandler:
         
         return md
     
-    def _default_to_markdown(self, data: Dict) -> str:
+    def write_markdown_bundle(
+        self,
+        documents: Iterable[Tuple[str, str, Dict[str, Any]]],
+        target: Union[str, Path, BinaryIO],
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Render many documents to Markdown and stream them into a zip.
+        
+        Documents whose data is unchanged since an earlier bundle are
+        taken from a content-hash cache; the rest are rendered inline and
+        written to the zip in order.
+        
+        Args:
+            documents: Iterable of (path inside the zip, template, data);
+                templates as in to_markdown
+            target: Filename (relative to the export path), path or
+                writable binary stream
+            progress: Optional callback receiving (written, total)
+        
+        Returns:
+            Counts of "documents", "rendered" and "cached" documents
+        """
+        documents = list(documents)
+        keys = [
+            _markdown_key(template, data) for _, template, data in documents
+        ]
+        
+        cached = {}
+        with _markdown_lock:
+            for key in keys:
+                if key in _markdown_cache:
+                    _markdown_cache.move_to_end(key)
+                    cached[key] = _markdown_cache[key]
+        
+        rendered = 0
+        with self._open_target(target) as f:
+            with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                for i, (key, (name, template, data)) in enumerate(
+                    zip(keys, documents)
+                ):
+                    md = cached.get(key)
+                    if md is None:
+                        md = _render_markdown(template, data)
+                        cached[key] = md
+                        _cache_markdown(key, md)
+                        rendered += 1
+                    
+                    zf.writestr(name, md)
+                    if progress:
+                        progress(i + 1, len(documents))
+        
+        return {
+            "documents": len(documents),
+            "rendered": rendered,
+            "cached": len(documents) - rendered,
+        }
+    
+    @staticmethod
+    def _default_to_markdown(data: Dict) -> str:
         """Convert generic data to markdown."""
         lines = []
         
@@ -171,7 +485,8 @@ class ExportHandler:
         
         return "\n".join(lines)
     
-    def _brief_to_markdown(self, brief: Dict) -> str:
+    @staticmethod
+    def _brief_to_markdown(brief: Dict) -> str:
         """Convert content brief to markdown format."""
         lines = []
         
@@ -212,7 +527,7 @@ class ExportHandler:
             lines.append("")
             
             for section in brief.get("sections", []):
-                level = section.get("heading_level", "H2")
+                level = section.get("heading_level") or "H2"
                 heading = "#" * (int(level[1]) + 1)
                 lines.append(
                     f"{heading} {section.get('heading_text', '')}"
@@ -259,7 +574,8 @@ class ExportHandler:
         
         return "\n".join(lines)
     
-    def _topical_map_to_markdown(self, map_data: Dict) -> str:
+    @staticmethod
+    def _topical_map_to_markdown(map_data: Dict) -> str:
         """Convert topical map to markdown format."""
         lines = []
         
@@ -342,6 +658,59 @@ class ExportHandler:
         
         return "\n".join(lines)
     
+    def list_unmanaged(self, managed: Iterable[Path] = ()) -> List[Path]:
+        """
+        List exports that no cache manages.
+        
+        Columnar export directories and timestamped files written outside
+        the export artifact store stay in the export path until removed.
+        
+        Args:
+            managed: Directories to skip (e.g. the artifact store)
+        
+        Returns:
+            Top-level files and directories of the export path, oldest first
+        """
+        managed = {Path(path).resolve() for path in managed}
+        paths = [
+            path for path in self.export_path.iterdir()
+            if path.resolve() not in managed
+        ]
+        return sorted(paths, key=lambda path: path.stat().st_mtime)
+    
+    def remove_exports(self, paths: Iterable[Path]) -> int:
+        """
+        Delete export files and directories inside the export path.
+        
+        Args:
+            paths: Paths from list_unmanaged
+        
+        Returns:
+            Number of removed paths
+        """
+        root = self.export_path.resolve()
+        removed = 0
+        for path in paths:
+            path = Path(path)
+            if root not in path.resolve().parents or not path.exists():
+                continue
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+            removed += 1
+        return removed
+    
+    @staticmethod
+    def get_size(paths: Iterable[Path]) -> int:
+        """Get total bytes of files and directories."""
+        total = 0
+        for path in paths:
+            path = Path(path)
+            files = path.rglob("*") if path.is_dir() else [path]
+            total += sum(f.stat().st_size for f in files if f.is_file())
+        return total
+    
     @staticmethod
     def get_download_filename(
         base_name: str,
@@ -366,6 +735,61 @@ class ExportHandler:
         return f"{clean_name}_{timestamp}.{extension}"
 
 
+def _render_markdown(template: str, data: Dict[str, Any]) -> str:
+    """Render one document with a to_markdown template."""
+    if template == "content_brief":
+        return ExportHandler._brief_to_markdown(data)
+    elif template == "topical_map":
+        return ExportHandler._topical_map_to_markdown(data)
+    return ExportHandler._default_to_markdown(data)
+
+
+def _markdown_key(template: str, data: Dict[str, Any]) -> str:
+    """Hash a document's template and data for the render cache."""
+    payload = serialization.dumps(data, sort_keys=True)
+    return hashlib.sha256(template.encode("utf-8") + b"\0" + payload).hexdigest()
+
+
+def _cache_markdown(key: str, md: str):
+    with _markdown_lock:
+        _markdown_cache[key] = md
+        _markdown_cache.move_to_end(key)
+        while len(_markdown_cache) > MAX_MARKDOWN_CACHE_ENTRIES:
+            _markdown_cache.popitem(last=False)
+
+
+def _excel_sheet_title(name: str, part: int = 1) -> str:
+    """Make a valid worksheet title (max 31 chars, no []:*?/\\)."""
+    clean = "".join(c if c not in "[]:*?/\\" else "_" for c in name)
+    suffix = f" ({part})" if part > 1 else ""
+    return (clean[:31 - len(suffix)] or "Sheet") + suffix
+
+
+def _excel_value(value: Any, column_type: Optional[str] = None) -> Any:
+    """Convert a value for a write-only worksheet cell."""
+    if value is None:
+        return None
+    
+    if column_type in ("date", "datetime") and isinstance(value, str):
+        value = datetime.fromisoformat(value)
+        return value.date() if column_type == "date" else value
+    if column_type == "int":
+        return int(value)
+    if column_type == "float":
+        return float(value)
+    if column_type == "bool":
+        return bool(value)
+    if column_type == "str":
+        value = str(value)
+    
+    # Cells cannot hold lists/dicts
+    if isinstance(value, (dict, list)):
+        value = serialization.dumps_str(value)
+    if isinstance(value, str) and len(value) > EXCEL_MAX_CELL_CHARS:
+        return value[:EXCEL_MAX_CELL_CHARS]
+    return value
+
+
 def export_project_data(
     project: Dict,
     topical_maps: List[Dict],
@@ -399,6 +823,8 @@ def export_project_data(
         # For CSV, we'll export briefs (most tabular data)
         return handler.to_csv(briefs)
     elif format == "excel":
+        import pandas as pd
+        
         sheets = {
             "Project": pd.DataFrame([project]),
             "Briefs": pd.DataFrame(briefs),
@@ -0,0 +1,194 @@
+"""Background job runner for long-running maintenance tasks.
+
+Streamlit reruns the whole script on every interaction, so anything that
+takes more than a moment (backups, purges, rebuilds) is handed off to a
+daemon thread and polled from the UI through its job status.
+"""
+
+from __future__ import annotations
+
+import threading
+import traceback
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class JobStatus:
+    """Status of a background job."""
+    id: str
+    name: str
+    state: str = "pending"  # pending, running, done, failed
+    progress: float = 0.0  # 0-1
+    message: str = ""
+    result: Any = None
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    @property
+    def is_active(self) -> bool:
+        """Check if the job has not finished yet."""
+        return self.state in ("pending", "running")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "state": self.state,
+            "progress": self.progress,
+            "message": self.message,
+            "error": self.error,
+            "started_at": (
+                self.started_at.isoformat() if self.started_at else None
+            ),
+            "finished_at": (
+                self.finished_at.isoformat() if self.finished_at else None
+            ),
+        }
+
+
+_jobs: Dict[str, JobStatus] = {}
+_lock = threading.Lock()
+
+# Finished jobs kept around for status display
+MAX_FINISHED_JOBS = 50
+
+
+def run_in_background(
+    name: str,
+    func: Callable[..., Any],
+    *args,
+    **kwargs
+) -> JobStatus:
+    """
+    Run a function on a daemon thread and track its status.
+    
+    The function receives the job's JobStatus as its ``job`` keyword
+    argument so it can report progress.
+    
+    Args:
+        name: Job name (jobs with the same name are not run concurrently)
+        func: Function to run
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+    
+    Returns:
+        JobStatus of the started job, or of the already running job
+        with the same name
+    """
+    with _lock:
+        running = get_active_job(name)
+        if running:
+            return running
+        
+        job = JobStatus(id=str(uuid.uuid4()), name=name)
+        _jobs[job.id] = job
+        _prune_finished()
+    
+    thread = threading.Thread(
+        target=_execute, args=(job, func, args, kwargs),
+        name=f"job-{name}", daemon=True
+    )
+    thread.start()
+    
+    return job
+
+
+def run_inline(
+    name: str,
+    func: Callable[..., Any],
+    *args,
+    **kwargs
+) -> JobStatus:
+    """
+    Run a function on the calling thread and track it like a job.
+    
+    For work that must not leave the caller's thread, e.g. when the
+    database engine shares one connection between all threads.
+    
+    Args:
+        name: Job name
+        func: Function to run (receives the JobStatus as ``job``)
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+    
+    Returns:
+        JobStatus of the finished job
+    """
+    job = JobStatus(id=str(uuid.uuid4()), name=name)
+    with _lock:
+        _jobs[job.id] = job
+        _prune_finished()
+    
+    _execute(job, func, args, kwargs)
+    return job
+
+
+def _execute(
+    job: JobStatus,
+    func: Callable[..., Any],
+    args: tuple,
+    kwargs: Dict[str, Any]
+):
+    """Run a job's function and record its outcome."""
+    job.state = "running"
+    job.started_at = datetime.utcnow()
+    try:
+        job.result = func(*args, job=job, **kwargs)
+        job.progress = 1.0
+        job.state = "done"
+    except Exception as e:
+        job.error = f"{e}\n{traceback.format_exc()}"
+        job.message = str(e)
+        job.state = "failed"
+    finally:
+        job.finished_at = datetime.utcnow()
+
+
+def get_job(job_id: str) -> Optional[JobStatus]:
+    """Get a job by ID."""
+    return _jobs.get(job_id)
+
+
+def get_active_job(name: str) -> Optional[JobStatus]:
+    """Get the running job with the given name, if any."""
+    for job in _jobs.values():
+        if job.name == name and job.is_active:
+            return job
+    return None
+
+
+def list_jobs(name: Optional[str] = None) -> List[JobStatus]:
+    """
+    List known jobs, newest first.
+    
+    Args:
+        name: Optional job name filter
+    
+    Returns:
+        List of job statuses
+    """
+    jobs = [
+        j for j in _jobs.values()
+        if name is None or j.name == name
+    ]
+    return sorted(
+        jobs,
+        key=lambda j: j.started_at or datetime.min,
+        reverse=True
+    )
+
+
+def _prune_finished():
+    """Drop the oldest finished jobs beyond MAX_FINISHED_JOBS."""
+    finished = [j for j in _jobs.values() if not j.is_active]
+    if len(finished) <= MAX_FINISHED_JOBS:
+        return
+    
+    finished.sort(key=lambda j: j.finished_at or datetime.min)
+    for job in finished[:len(finished) - MAX_FINISHED_JOBS]:
+        _jobs.pop(job.id, None)
\ No newline at end of file
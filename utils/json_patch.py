@@ -0,0 +1,106 @@
+"""Minimal JSON Patch (RFC 6902) diff and apply.
+
+Supports the ``add``, ``remove`` and ``replace`` operations, which is all
+that is needed to diff JSON documents. Objects are diffed key by key;
+lists that differ are replaced whole, so documents that need compact
+deltas should key repeated items by ID instead of storing them in lists.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List
+
+
+def _escape(key: str) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute the operations that turn one document into another.
+    
+    Args:
+        old: Source document
+        new: Target document
+        path: JSON pointer prefix (used for recursion)
+    
+    Returns:
+        List of JSON Patch operations
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+    
+    if old == new and type(old) is type(new):
+        return []
+    
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(
+    doc: Any,
+    ops: List[Dict[str, Any]],
+    in_place: bool = False
+) -> Any:
+    """
+    Apply JSON Patch operations to a document.
+    
+    Args:
+        doc: Source document
+        ops: List of JSON Patch operations
+        in_place: Modify ``doc`` instead of a deep copy
+    
+    Returns:
+        Patched document
+    """
+    if not in_place:
+        doc = copy.deepcopy(doc)
+    
+    for op in ops:
+        path = op["path"]
+        if path == "":
+            if op["op"] == "remove":
+                doc = None
+            else:
+                doc = copy.deepcopy(op["value"])
+            continue
+        
+        tokens = [_unescape(t) for t in path.split("/")[1:]]
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        
+        last = tokens[-1]
+        if isinstance(parent, list):
+            if op["op"] == "add":
+                index = len(parent) if last == "-" else int(last)
+                parent.insert(index, copy.deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del parent[int(last)]
+            elif op["op"] == "replace":
+                parent[int(last)] = copy.deepcopy(op["value"])
+            else:
+                raise ValueError(f"Unsupported patch operation: {op['op']}")
+        else:
+            if op["op"] in ("add", "replace"):
+                parent[last] = copy.deepcopy(op["value"])
+            elif op["op"] == "remove":
+                del parent[last]
+            else:
+                raise ValueError(f"Unsupported patch operation: {op['op']}")
+    
+    return doc
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""Lazy package-level exports (PEP 562).
+
+A package ``__init__`` maps each public name to the module that defines
+it, and the name is imported on first access instead of at package
+import::
+
+    __getattr__, __dir__, __all__ = lazy_module(__name__, {
+        "Settings": "config.settings",
+    })
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_module(
+    module_name: str,
+    exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Build the module-level hooks that import exports on first access.
+    
+    Args:
+        module_name: Name of the package (its ``__name__``)
+        exports: Public name -> name of the module defining it
+        
+    Returns:
+        Tuple of ``__getattr__``, ``__dir__`` and ``__all__`` for the package
+    """
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(module), name)
+        # Later lookups find the global and skip __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(exports))
+    
+    return __getattr__, __dir__, list(exports)
\ No newline at end of file
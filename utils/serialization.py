@@ -0,0 +1,131 @@
+"""JSON serialization with an optional fast backend.
+
+Uses orjson when it is installed, then msgspec, and falls back to the
+standard library otherwise. Every backend encodes the values the app
+passes around the same way:
+
+- datetimes, dates and times as ISO 8601 strings (``isoformat()``)
+- UUIDs as strings
+- dataclasses (e.g. ``FrameworkResult``) as objects
+- NumPy arrays and scalars as lists and numbers
+- anything else via ``str()``, like ``json.dumps(..., default=str)``
+
+Output is compact UTF-8 unless ``pretty`` is set. Decoding errors are
+always raised as ``json.JSONDecodeError``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import uuid
+from datetime import date, datetime, time
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+ORJSON = "orjson"
+MSGSPEC = "msgspec"
+STDLIB = "json"
+
+
+def backend() -> str:
+    """Get the name of the serializer in use."""
+    if orjson is not None:
+        return ORJSON
+    if msgspec is not None:
+        return MSGSPEC
+    return STDLIB
+
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Encode a value as JSON.
+    
+    Args:
+        obj: Value to encode
+        pretty: Indent with two spaces
+        sort_keys: Sort object keys
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option)
+    
+    if msgspec is not None:
+        encoder = msgspec.json.Encoder(
+            enc_hook=_default, order="sorted" if sort_keys else None
+        )
+        data = encoder.encode(obj)
+        return msgspec.json.format(data, indent=2) if pretty else data
+    
+    return json.dumps(
+        obj,
+        default=_default,
+        indent=2 if pretty else None,
+        separators=None if pretty else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def dumps_str(obj: Any, pretty: bool = False, sort_keys: bool = False) -> str:
+    """Encode a value as a JSON string (see dumps)."""
+    return dumps(obj, pretty=pretty, sort_keys=sort_keys).decode("utf-8")
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    Decode JSON.
+    
+    Args:
+        data: JSON text or UTF-8 bytes
+    
+    Returns:
+        Decoded value
+    
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            doc = data if isinstance(data, str) else bytes(data).decode(
+                "utf-8", "replace"
+            )
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+    
+    return json.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    """Encode values the backends do not handle natively."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "tolist"):  # NumPy arrays and scalars
+        return obj.tolist()
+    return str(obj)
\ No newline at end of file
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Optional, Dict, Any, List
+import functools
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Iterator, Optional, Dict, Any, List
 import streamlit as st
 
-from utils.database import Project
+from utils.cache import BoundedCache
 
 
 def init_session_state():
@@ -62,8 +66,8 @@ def init_session_state():
         st.session_state.notifications = []
     
     # Cache for expensive operations
-    if "cache" not in st.session_state:
-        st.session_state.cache = {}
+    if not isinstance(st.session_state.get("cache"), BoundedCache):
+        st.session_state.cache = _create_cache()
 
 
 def get_current_project() -> Optional[Dict[str, Any]]:
@@ -222,26 +226,143 @@ def display_notifications():
 
 
 # Cache utilities
+def _create_cache() -> BoundedCache:
+    """Create a session cache sized from the cache settings."""
+    from config.settings import get_settings
+    
+    cache_settings = get_settings().cache
+    return BoundedCache(
+        max_bytes=cache_settings.session_max_mb * 1024 * 1024,
+        max_entries=cache_settings.session_max_entries,
+        default_ttl=cache_settings.session_ttl,
+    )
+
+
+def _get_cache() -> BoundedCache:
+    """Get the session cache, creating it if needed."""
+    cache = st.session_state.get("cache")
+    if not isinstance(cache, BoundedCache):
+        cache = _create_cache()
+        st.session_state.cache = cache
+    return cache
+
+
 def get_cached(key: str) -> Optional[Any]:
-    """Get a cached value."""
-    cache = st.session_state.get("cache", {})
-    return cache.get(key)
+    """Get a cached value (None if missing or expired)."""
+    return _get_cache().get(key)
 
 
-def set_cached(key: str, value: Any):
-    """Set a cached value."""
-    if "cache" not in st.session_state:
-        st.session_state.cache = {}
-    st.session_state.cache[key] = value
+def set_cached(key: str, value: Any, ttl: Optional[float] = None):
+    """
+    Set a cached value.
+    
+    Least recently used values are evicted when the session cache is
+    over its memory or entry limit.
+    
+    Args:
+        key: Cache key
+        value: Value to cache
+        ttl: Seconds the value stays valid (defaults to the setting)
+    """
+    _get_cache().set(key, value, ttl=ttl)
 
 
 def clear_cache(key: Optional[str] = None):
     """Clear cache (specific key or all)."""
     if key:
-        if "cache" in st.session_state and key in st.session_state.cache:
-            del st.session_state.cache[key]
+        _get_cache().delete(key)
     else:
-        st.session_state.cache = {}
+        _get_cache().clear()
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Get size, limits and hit/miss/eviction counts of the session cache."""
+    return _get_cache().stats()
+
+
+# Script timing
+RUN_TIME_HISTORY = 50  # Runs kept per region
+
+
+@contextmanager
+def timed_run(region: str) -> Iterator[None]:
+    """
+    Record how long a script region takes to run.
+    
+    Full runs are timed as "app" (or the page name); fragments are timed
+    under their own region, so the debug panel shows what an interaction
+    inside a fragment costs compared to a full rerun.
+    
+    Args:
+        region: Region name, e.g. "app" or a fragment name
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        # Also recorded when the run ends with st.rerun/st.stop
+        elapsed = time.perf_counter() - start
+        run_times = st.session_state.setdefault("run_times", {})
+        history = run_times.setdefault(
+            region, deque(maxlen=RUN_TIME_HISTORY)
+        )
+        history.append(elapsed)
+
+
+def get_run_time_stats() -> Dict[str, Dict[str, Any]]:
+    """Get run count and last/mean/max milliseconds per timed region."""
+    run_times: Dict[str, Deque[float]] = st.session_state.get("run_times", {})
+    return {
+        region: {
+            "runs": len(history),
+            "last_ms": round(history[-1] * 1000, 1),
+            "mean_ms": round(sum(history) / len(history) * 1000, 1),
+            "max_ms": round(max(history) * 1000, 1),
+        }
+        for region, history in run_times.items()
+        if history
+    }
+
+
+def fragment(func: Callable) -> Callable:
+    """
+    Turn a render function into a timed ``st.fragment``.
+    
+    Widget interactions inside the function rerun only the function.
+    Such reruns skip the page's ``main()``, so the fragment opens its
+    own ``db_scope`` (a full run's scope is reused) and is timed under
+    its function name.
+    
+    Args:
+        func: Render function
+    
+    Returns:
+        Fragment function
+    """
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        from config.database import db_scope
+        
+        with timed_run(func.__name__), db_scope():
+            return func(*args, **kwargs)
+    
+    return st.fragment(run)
+
+
+def rerun_fragment():
+    """
+    Rerun only the current fragment.
+    
+    Streamlit refuses fragment-scoped reruns while a fragment runs as
+    part of a full run (e.g. when a click was merged into one), so the
+    whole app reruns then.
+    """
+    from streamlit.errors import StreamlitAPIException
+    
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
 
 
 # Debug utilities
@@ -0,0 +1,178 @@
+"""Process-wide cache shared by all Streamlit sessions.
+
+Project-scoped reads (stats, listings, scores) are cached once per server
+process instead of once per session, so every viewer of a project reuses
+the same result. Entries are keyed by a version stamp of their scope
+(usually a project ID); services bump the stamp after each write, which
+makes every older entry unreachable, so sessions see fresh data on their
+next rerun without polling.
+
+Versions live in memory, so they only cover writes made by this process;
+reads that must notice other writers should key on the activity log
+instead (see ProjectExporter.data_version).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import streamlit as st
+
+from utils.cache import BoundedCache
+
+
+# Version scope of the project listing (all projects)
+PROJECT_LIST = "__projects__"
+
+_MISSING = object()
+
+
+class SharedCache:
+    """Version-stamped cache of project-scoped reads."""
+    
+    def __init__(
+        self,
+        max_bytes: int = 200 * 1024 * 1024,
+        max_entries: int = 5000,
+        default_ttl: Optional[float] = 3600
+    ):
+        """
+        Initialize shared cache.
+        
+        Args:
+            max_bytes: Memory cap for all entries
+            max_entries: Maximum number of entries
+            default_ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        self.entries = BoundedCache(
+            max_bytes=max_bytes,
+            max_entries=max_entries,
+            default_ttl=default_ttl,
+        )
+        self._versions: Dict[str, int] = {}
+        self._generation = 0  # Bumped to invalidate every scope
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+    
+    def version(self, scope: str) -> Tuple[int, int]:
+        """
+        Get the version stamp of a scope.
+        
+        Args:
+            scope: Project ID or other scope name
+        
+        Returns:
+            (generation, scope version) tuple
+        """
+        with self._lock:
+            return self._generation, self._versions.get(scope, 0)
+    
+    def bump(self, scope: Optional[str] = None):
+        """
+        Invalidate cached reads of a scope (or of every scope).
+        
+        Args:
+            scope: Project ID or other scope name; None for all
+        """
+        with self._lock:
+            if scope is None:
+                self._generation += 1
+            else:
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+        
+        if scope is None:
+            self.entries.clear()
+    
+    def get_or_compute(
+        self,
+        scope: str,
+        name: str,
+        compute: Callable[[], Any],
+        *parts: Hashable,
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Get a cached read, computing it once per scope version.
+        
+        Concurrent callers of the same missing key wait for the first
+        one instead of computing it again.
+        
+        Args:
+            scope: Project ID or other scope name
+            name: Name of the read, e.g. "project_stats"
+            compute: Function producing the value
+            *parts: Further key parts (e.g. arguments of the read)
+            ttl: Seconds the value stays valid (defaults to the cache's)
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        key = (scope, self.version(scope), name, parts)
+        
+        value = self.entries.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        
+        try:
+            with key_lock:
+                if key in self.entries:  # Computed while we waited
+                    return self.entries.get(key)
+                value = compute()
+                self.entries.set(key, value, ttl=ttl)
+                return value
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get entry statistics and the number of versioned scopes."""
+        stats = self.entries.stats()
+        with self._lock:
+            stats["scopes"] = len(self._versions)
+            stats["generation"] = self._generation
+        return stats
+
+
+@st.cache_resource(show_spinner=False)
+def get_shared_cache() -> SharedCache:
+    """Get the process-wide cache (created once per server process)."""
+    from config.settings import get_settings
+    
+    cache_settings = get_settings().cache
+    return SharedCache(
+        max_bytes=cache_settings.shared_max_mb * 1024 * 1024,
+        max_entries=cache_settings.shared_max_entries,
+        default_ttl=cache_settings.shared_ttl,
+    )
+
+
+def cached_read(
+    scope: str,
+    name: str,
+    compute: Callable[[], Any],
+    *parts: Hashable,
+    ttl: Optional[float] = None
+) -> Any:
+    """Get a read from the shared cache (see SharedCache.get_or_compute)."""
+    return get_shared_cache().get_or_compute(
+        scope, name, compute, *parts, ttl=ttl
+    )
+
+
+def bump_version(scope: Optional[str] = None):
+    """Invalidate shared reads of a scope (None for every scope)."""
+    get_shared_cache().bump(scope)
+
+
+def bump_project_version(project_id: Optional[str] = None):
+    """
+    Invalidate shared reads of a project after a write.
+    
+    Args:
+        project_id: Project UUID (None for every project)
+    """
+    get_shared_cache().bump(project_id)
\ No newline at end of file